@@ -0,0 +1,364 @@
+"""
+API 서버 부하 벤치마크
+Mock AEP 서버를 업스트림으로 두고 라우터별 처리량, 지연 시간 백분위, 요청당 CPU, 최대 RSS 측정
+
+시나리오
+- cold: 새로 시작한 서버에 매번 다른 요청을 보내 캐시가 전혀 없는 상태
+- warm: 같은 요청을 한 번 미리 보내 캐시/커넥션 풀이 채워진 뒤 측정
+- burst: warm 상태에서 burst_size개의 요청을 한꺼번에 보내 대기열 처리 측정
+
+API 서버와 Mock 서버는 시나리오마다 별도 프로세스로 새로 띄우므로 결과가 서로 영향을 주지 않습니다.
+결과는 JSON으로 저장되며 --compare로 이전 결과와 비교해 성능 저하를 확인할 수 있습니다.
+
+사용법 (api-project 디렉터리에서):
+    python -m benchmarks.load_bench --concurrency 32 --requests 2000
+    python -m benchmarks.load_bench --scenarios warm --routers schema_registry profile
+    python -m benchmarks.load_bench --compare benchmarks/results/baseline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+try:
+    import psutil
+except ImportError:  # psutil 미설치 시 /proc에서 직접 읽음 (Linux)
+    psutil = None
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+ROUTERS = ["schema_registry", "identity", "profile", "segmentation", "destinations"]
+SCENARIOS = ["cold", "warm", "burst"]
+
+# 비교 시 성능 저하로 판단하는 지표 (값이 클수록 나쁨)
+REGRESSION_METRICS = ["p95_ms", "p99_ms", "cpu_ms_per_request"]
+
+
+# 프로세스 자원 사용량
+class ProcessProbe:
+    """서버 프로세스의 누적 CPU 시간과 최대 RSS 조회"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self._process = psutil.Process(pid) if psutil else None
+        self._ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def cpu_seconds(self) -> Optional[float]:
+        if self._process is not None:
+            times = self._process.cpu_times()
+            return times.user + times.system
+        try:
+            fields = Path(f"/proc/{self.pid}/stat").read_text().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / self._ticks
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def peak_rss_mb(self) -> Optional[float]:
+        try:
+            for line in Path(f"/proc/{self.pid}/status").read_text().splitlines():
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+        except OSError:
+            pass
+        if self._process is not None:
+            return round(self._process.memory_info().rss / 1024 / 1024, 1)
+        return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Servers:
+    """Mock AEP 서버와 API 서버를 하위 프로세스로 실행"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.mock_port = free_port()
+        self.api_port = free_port()
+        self.mock_url = f"http://127.0.0.1:{self.mock_port}"
+        self.api_url = f"http://127.0.0.1:{self.api_port}"
+        self.processes: List[subprocess.Popen] = []
+        self.api_pid = 0
+
+    def __enter__(self) -> "Servers":
+        args = self.args
+        self._spawn([
+            sys.executable, "-m", "mock_aep", "--host", "127.0.0.1", "--port", str(self.mock_port),
+            "--latency-distribution", args.mock_latency_distribution,
+            "--latency-ms", str(args.mock_latency_ms),
+            "--error-rate-429", str(args.mock_error_rate_429),
+            "--error-rate-5xx", str(args.mock_error_rate_5xx),
+        ], os.environ.copy())
+        self._wait(f"{self.mock_url}/__mock/stats")
+
+        env = os.environ.copy()
+        env.update({
+            "PLATFORM_GATEWAY": self.mock_url,
+            "IMS_ENDPOINT": self.mock_url,
+            "ACCESS_TOKEN": "benchmark",
+            "RATE_LIMIT_ENABLED": "true" if args.keep_rate_limits else "false",
+        })
+        api = self._spawn([
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(self.api_port), "--log-level", "warning",
+        ], env)
+        self.api_pid = api.pid
+        self._wait(f"{self.api_url}/health")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for process in reversed(self.processes):
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def _spawn(self, command: List[str], env: Dict[str, str]) -> subprocess.Popen:
+        process = subprocess.Popen(command, cwd=PROJECT_DIR, env=env, stdout=subprocess.DEVNULL)
+        self.processes.append(process)
+        return process
+
+    @staticmethod
+    def _wait(url: str, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(url, timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(f"서버 시작 대기 시간 초과: {url}")
+
+
+# 라우터별 요청 목록
+def build_targets(mock_url: str, count: int) -> Dict[str, List[str]]:
+    """
+    라우터별 요청 경로 목록 (count개, 가능한 한 서로 다른 요청)
+
+    ID가 필요한 경로는 Mock 서버에서 실제 ID를 조회해 사용합니다.
+    """
+    with httpx.Client(base_url=mock_url, timeout=10.0) as mock:
+        schema_ids = [s["$id"] for s in mock.get(
+            "/data/foundation/schemaregistry/tenant/schemas", params={"limit": 100}).json()["results"]]
+        flow_ids = [f["id"] for f in mock.get(
+            "/data/foundation/flowservice/flows", params={"limit": 100}).json()["items"]]
+        segment_ids = [s["id"] for s in mock.get(
+            "/data/core/ups/segment/definitions", params={"limit": 100}).json()["segments"]]
+
+    def cycle(make: Callable[[int], str]) -> List[str]:
+        return [make(i) for i in range(count)]
+
+    return {
+        "schema_registry": cycle(lambda i: [
+            f"/api/schema-registry/schemas?limit={1 + i % 100}&offset={i // 100}",
+            f"/api/schema-registry/schemas/{httpx.URL(schema_ids[i % len(schema_ids)]).path.rsplit('/', 1)[-1]}",
+            f"/api/schema-registry/classes?limit={1 + i % 100}",
+            f"/api/schema-registry/fieldgroups?limit={1 + i % 100}",
+        ][i % 4]),
+        "identity": cycle(lambda i: [
+            f"/api/identity/identity-graph?xid=bench-{i}",
+            "/api/identity/namespaces",
+            f"/api/identity/cluster-members?namespace=Email&id=user{i}@example.com",
+        ][i % 3]),
+        "profile": cycle(lambda i: [
+            f"/api/profile/entities?entityId=user{i}@example.com&entityIdNS=Email",
+            f"/api/profile/merge-policies?limit={1 + i % 100}",
+        ][i % 2]),
+        "segmentation": cycle(lambda i: [
+            f"/api/segmentation/segment-definitions?limit={1 + i % 100}&page={i // 100}",
+            f"/api/segmentation/segment-definitions/{segment_ids[i % len(segment_ids)]}",
+            f"/api/segmentation/segment-jobs?limit={1 + i % 100}",
+            f"/api/segmentation/audiences?limit={1 + i % 100}",
+        ][i % 4]),
+        "destinations": cycle(lambda i: [
+            f"/api/destinations/destinations?limit={1 + i % 100}",
+            f"/api/destinations/dataflows?limit={1 + i % 100}",
+            f"/api/destinations/dataflows/{flow_ids[i % len(flow_ids)]}",
+            f"/api/destinations/dataflows/{flow_ids[i % len(flow_ids)]}/runs?limit={1 + i % 100}",
+        ][i % 4]),
+    }
+
+
+# 부하 생성
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+async def drive(client: httpx.AsyncClient, paths: List[str], concurrency: int) -> Dict[str, Any]:
+    """paths를 concurrency개 워커로 나눠 보내고 지연 시간/상태 코드 집계"""
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    queue = iter(paths)
+
+    async def worker():
+        for path in queue:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                await response.aread()
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": len(latencies),
+        "duration_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "statuses": statuses,
+    }
+
+
+async def run_router(servers: Servers, scenario: str, paths: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """시나리오 하나를 라우터 하나에 대해 실행"""
+    probe = ProcessProbe(servers.api_pid)
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.burst_size))
+    async with httpx.AsyncClient(base_url=servers.api_url, limits=limits, timeout=60.0) as client:
+        if scenario in ("warm", "burst"):
+            await drive(client, paths, args.concurrency)
+        concurrency = args.burst_size if scenario == "burst" else args.concurrency
+        workload = paths[:args.burst_size] if scenario == "burst" else paths
+
+        cpu_before = probe.cpu_seconds()
+        result = await drive(client, workload, concurrency)
+        cpu_after = probe.cpu_seconds()
+
+    cpu = (cpu_after - cpu_before) if cpu_before is not None and cpu_after is not None else None
+    result["concurrency"] = concurrency
+    result["cpu_ms_per_request"] = round(cpu / result["requests"] * 1000, 3) if cpu is not None and result["requests"] else None
+    result["peak_rss_mb"] = probe.peak_rss_mb()
+    return result
+
+
+def run_scenario(scenario: str, args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    with Servers(args) as servers:
+        targets = build_targets(servers.mock_url, args.requests)
+        results = {}
+        for router in args.routers:
+            results[router] = asyncio.run(run_router(servers, scenario, targets[router], args))
+            print_row(scenario, router, results[router])
+        return results
+
+
+# 결과 출력/저장/비교
+def print_row(scenario: str, router: str, r: Dict[str, Any]) -> None:
+    cpu = f"{r['cpu_ms_per_request']:.3f}" if r["cpu_ms_per_request"] is not None else "-"
+    rss = f"{r['peak_rss_mb']:.1f}" if r["peak_rss_mb"] is not None else "-"
+    print(
+        f"{scenario:<6} {router:<16} {r['throughput_rps']:>9.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+        f"{r['p99_ms']:>8.2f} {cpu:>9} {rss:>8} {r['error_rate']:>7.2%}"
+    )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """baseline 대비 threshold 비율 이상 나빠진 지표 목록"""
+    regressions = []
+    for scenario, routers in current["results"].items():
+        for router, metrics in routers.items():
+            base = baseline.get("results", {}).get(scenario, {}).get(router)
+            if not base:
+                continue
+            for name in REGRESSION_METRICS:
+                new, old = metrics.get(name), base.get(name)
+                if new is None or not old:
+                    continue
+                change = (new - old) / old
+                print(f"  {scenario:<6} {router:<16} {name:<20} {old:>10.3f} -> {new:>10.3f} ({change:+.1%})")
+                if change > threshold:
+                    regressions.append(f"{scenario}/{router}/{name} {change:+.1%}")
+            old_rps, new_rps = base.get("throughput_rps"), metrics.get("throughput_rps")
+            if old_rps and new_rps is not None and (old_rps - new_rps) / old_rps > threshold:
+                regressions.append(f"{scenario}/{router}/throughput_rps {(new_rps - old_rps) / old_rps:+.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 서버 라우터별 부하 벤치마크 (Mock AEP 업스트림)")
+    parser.add_argument("--routers", nargs="+", choices=ROUTERS, default=ROUTERS)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수 (기본 16)")
+    parser.add_argument("--requests", type=int, default=1000, help="라우터별 요청 수 (기본 1000)")
+    parser.add_argument("--burst-size", type=int, default=256, help="burst 시나리오 동시 요청 수 (기본 256)")
+    parser.add_argument("--mock-latency-distribution", default="lognormal",
+                        choices=["none", "fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--mock-latency-ms", type=float, default=20.0, help="Mock 업스트림 지연 중앙값 (기본 20ms)")
+    parser.add_argument("--mock-error-rate-429", type=float, default=0.0)
+    parser.add_argument("--mock-error-rate-5xx", type=float, default=0.0)
+    parser.add_argument("--keep-rate-limits", action="store_true",
+                        help="클라이언트 측 속도 제한 유지 (기본은 서버 처리 성능만 보기 위해 비활성화)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본 benchmarks/results/<시각>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="성능 저하 판단 기준 비율 (기본 0.10)")
+    args = parser.parse_args()
+
+    print(f"{'scen':<6} {'router':<16} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'cpu ms/r':>9} {'rss MB':>8} {'errors':>7}")
+    results = {scenario: run_scenario(scenario, args) for scenario in args.scenarios}
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        print(f"\n비교 기준: {args.compare}")
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print("\n성능 저하 감지:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\n성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
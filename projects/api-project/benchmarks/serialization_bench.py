@@ -0,0 +1,129 @@
+"""
+목록 응답 직렬화 벤치마크
+RESPONSE_VALIDATION / ORJSON_RESPONSES 조합별 요청당 CPU 시간 비교
+
+업스트림 호출은 고정 데이터를 돌려주는 가짜 클라이언트로 대체하므로
+측정값은 라우터 → 검증 → JSON 직렬화 구간의 순수 CPU 비용입니다.
+
+사용법 (api-project 디렉터리에서):
+    python -m benchmarks.serialization_bench --items 100 --requests 500
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from config import settings
+from dependencies import get_adobe_client
+from main import app
+
+MODES = [
+    ("full", False),
+    ("full", True),
+    ("adapter", True),
+    ("trusted", True),
+]
+
+
+def make_schemas(count: int) -> List[Dict[str, Any]]:
+    """Schema Registry 목록 응답과 비슷한 크기의 스키마 항목 생성"""
+    return [
+        {
+            "$id": f"https://ns.adobe.com/tenant/schemas/{i:032x}",
+            "meta:altId": f"_tenant.schemas.{i:032x}",
+            "meta:resourceType": "schemas",
+            "version": "1.2",
+            "title": f"Customer Profile Schema {i}",
+            "description": "고객 프로필 정보 스키마",
+            "type": "object",
+            "meta": {"class": "https://ns.adobe.com/xdm/context/profile", "extensible": False, "tags": ["profile", "demo"]},
+            "allOf": [
+                {"$ref": "https://ns.adobe.com/xdm/context/profile"},
+                {"$ref": "https://ns.adobe.com/xdm/context/profile-person-details"},
+                {"$ref": "https://ns.adobe.com/xdm/context/identitymap"},
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+class FakeClient:
+    """고정 목록을 반환하는 AdobeAPIClient 대체"""
+
+    def __init__(self, schemas: List[Dict[str, Any]]):
+        self.schemas = schemas
+
+    async def get_schemas(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+        return self.schemas
+
+
+async def measure(requests: int, limit: int) -> Dict[str, float]:
+    """동일한 목록 요청을 순차 실행하고 요청당 CPU/경과 시간(ms) 반환"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        url = f"/api/schema-registry/schemas?limit={limit}"
+        for _ in range(20):  # 워밍업 (TypeAdapter 생성 등)
+            (await http.get(url)).raise_for_status()
+
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        size = 0
+        for _ in range(requests):
+            response = await http.get(url)
+            response.raise_for_status()
+            size = len(response.content)
+        cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    return {
+        "cpu_ms_per_request": round(cpu / requests * 1000, 4),
+        "wall_ms_per_request": round(wall / requests * 1000, 4),
+        "response_bytes": size,
+    }
+
+
+async def run(items: int, requests: int) -> List[Dict[str, Any]]:
+    app.dependency_overrides[get_adobe_client] = lambda: FakeClient(make_schemas(items))
+    original = (settings.response_validation, settings.orjson_responses)
+    results = []
+    try:
+        for validation, use_orjson in MODES:
+            settings.response_validation = validation
+            settings.orjson_responses = use_orjson
+            result = await measure(requests, min(items, 100))
+            results.append({"validation": validation, "orjson": use_orjson, **result})
+    finally:
+        settings.response_validation, settings.orjson_responses = original
+        app.dependency_overrides.pop(get_adobe_client, None)
+
+    baseline = results[0]["cpu_ms_per_request"]
+    for result in results:
+        result["cpu_saved_ms"] = round(baseline - result["cpu_ms_per_request"], 4)
+        result["speedup"] = round(baseline / result["cpu_ms_per_request"], 2) if result["cpu_ms_per_request"] else None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 방식별 CPU 비용 비교")
+    parser.add_argument("--items", type=int, default=100, help="응답 항목 수 (기본 100)")
+    parser.add_argument("--requests", type=int, default=500, help="방식별 요청 수 (기본 500)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.items, args.requests))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"GET /api/schema-registry/schemas ({args.items} items, {args.requests} requests)")
+    print(f"{'validation':<10} {'orjson':<7} {'cpu ms/req':>11} {'saved ms':>9} {'speedup':>8} {'bytes':>8}")
+    for r in results:
+        print(
+            f"{r['validation']:<10} {str(r['orjson']):<7} {r['cpu_ms_per_request']:>11.3f} "
+            f"{r['cpu_saved_ms']:>9.3f} {r['speedup']:>7.2f}x {r['response_bytes']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
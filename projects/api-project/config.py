@@ -3,7 +3,7 @@ Adobe Experience Platform API 설정
 환경 변수를 통한 인증 정보 관리
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
 
 class AEPSettings(BaseSettings):
@@ -25,13 +25,125 @@ class AEPSettings(BaseSettings):
     client_id: Optional[str] = None
     global_company_id: Optional[str] = None
     
-    # API 엔드포인트
+    # API 엔드포인트 (로컬 Mock 서버 사용 시 http://localhost:8080, `python -m mock_aep`)
     platform_gateway: str = "https://platform.adobe.io"
     ims_endpoint: str = "https://ims-na1.adobelogin.com"
     
     # JWT 인증용 (선택사항)
     private_key_path: Optional[str] = None
     
+    # Access Token 자동 갱신 (CLIENT_SECRET 설정 시 OAuth Server-to-Server 토큰 발급)
+    token_auto_refresh: bool = True
+    token_refresh_margin: float = 300.0
+    
+    # HTTP 커넥션 풀 설정 (앱 전체에서 공유)
+    http2: bool = True
+    http_timeout: float = 30.0
+    http_connect_timeout: float = 10.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_max_connections_per_host: int = 50
+    
+    # 응답 캐시 설정 (엔드포인트 prefix별 TTL, 초 단위)
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 32 * 1024 * 1024
+    cache_ttls: Dict[str, float] = {
+        "/data/foundation/schemaregistry/": 300.0,
+        "/data/core/idnamespace/": 600.0,
+        "/data/core/ups/config/mergePolicies": 600.0,
+        "/data/foundation/flowservice/connectionSpecs": 3600.0,
+    }
+    
+    # 시작 시 참조 데이터 캐시 예열 및 주기적 갱신 (완료 전까지 /health는 503)
+    warmup_enabled: bool = True
+    warmup_targets: List[str] = ["identity_namespaces", "merge_policies", "classes", "connection_specs"]
+    warmup_concurrency: int = 4
+    warmup_timeout: float = 30.0
+    warmup_refresh_interval: float = 240.0
+    
+    # 동일한 동시 GET 요청을 하나의 업스트림 호출로 병합
+    singleflight_enabled: bool = True
+    
+    # 클라이언트 측 속도 제한 (API 계열별 초당 최대 요청 수)
+    rate_limit_enabled: bool = True
+    rate_limits: Dict[str, float] = {
+        "schemaregistry": 20.0,
+        "ups": 20.0,
+        "identity": 20.0,
+        "flowservice": 10.0,
+        "default": 10.0,
+    }
+    rate_limit_burst: int = 10
+    rate_limit_max_retries: int = 3
+    
+    # 재시도 정책 (멱등 요청의 5xx/타임아웃에만 적용)
+    retry_enabled: bool = True
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.2
+    retry_max_delay: float = 5.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_min: float = 10.0
+    
+    # 호스트별 서킷 브레이커
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    
+    # 요청 헤징 (프로필/Identity Graph 조회 꼬리 지연 완화)
+    hedging_enabled: bool = False
+    hedge_percentile: float = 0.95
+    hedge_default_delay: float = 1.0
+    hedge_min_delay: float = 0.05
+    
+    # 변환이 필요 없는 응답은 파싱 없이 업스트림 바이트를 그대로 스트리밍
+    passthrough_streaming: bool = True
+    
+    # 목록 응답 검증 방식
+    # - full: FastAPI response_model로 항목별 검증 후 직렬화 (기본)
+    # - adapter: 캐시된 TypeAdapter로 검증하고 pydantic-core에서 바로 JSON 직렬화
+    # - trusted: 업스트림 응답을 신뢰하고 검증 없이 그대로 직렬화
+    response_validation: Literal["full", "adapter", "trusted"] = "full"
+    orjson_responses: bool = True
+    
+    # Prometheus 메트릭 (/metrics)
+    metrics_enabled: bool = True
+    
+    # 프로필 일괄 조회 (동시 요청 수 / 요청당 최대 항목 수)
+    profile_batch_concurrency: int = 10
+    profile_batch_max_items: int = 10000
+    
+    # Identity 클러스터 일괄 조회 (호출당 최대 ID 수 / 동시 호출 수 / 요청당 최대 ID 수)
+    identity_batch_chunk_size: int = 1000
+    identity_batch_concurrency: int = 4
+    identity_batch_max_items: int = 100000
+    
+    # Identity 클러스터 캐시 (Identity Graph 응답을 멤버별로 색인, 최대 Identity 수 초과 시 클러스터 단위 제거)
+    identity_cache_enabled: bool = True
+    identity_cache_ttl: float = 300.0
+    identity_cache_max_identities: int = 100000
+    
+    # Identity Namespace 레지스트리 (목록 재확인 주기 / 알 수 없는 코드로 강제 갱신하는 최소 간격, 초)
+    namespace_registry_refresh_interval: float = 60.0
+    namespace_registry_miss_refresh_interval: float = 10.0
+    
+    # 세그먼트 작업 진행 상황 SSE (폴링 간격 최소/최대, 상태 변화 없을 때 간격 증가 배수, 구독자 없을 때 중단까지 대기, 초)
+    segment_job_poll_min_interval: float = 2.0
+    segment_job_poll_max_interval: float = 15.0
+    segment_job_poll_backoff: float = 1.5
+    segment_job_poll_idle_timeout: float = 30.0
+    # /api/overview 전체 제한 시간 (초, 시간 안에 끝난 섹션만 반환)
+    overview_deadline: float = 5.0
+    
+    # 데이터 플로우 실행 모니터 (수집 주기, 동시 조회 플로우 수, 플로우당 보관 실행 수, 구독자 없을 때 중단까지 대기)
+    dataflow_monitor_interval: float = 60.0
+    dataflow_monitor_concurrency: int = 8
+    dataflow_monitor_max_runs_per_flow: int = 500
+    dataflow_monitor_idle_timeout: float = 120.0
+    # SSE 연결 유지 주석 전송 간격 (초)
+    sse_heartbeat_interval: float = 15.0
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -41,12 +153,12 @@ class AEPSettings(BaseSettings):
 settings = AEPSettings()
 
 
-def get_aep_headers() -> dict:
-    """AEP API 호출용 공통 헤더 생성"""
+def get_aep_headers(access_token: Optional[str] = None, sandbox_name: Optional[str] = None) -> dict:
+    """AEP API 호출용 공통 헤더 생성 (인자를 생략하면 설정값 사용)"""
     return {
-        "Authorization": f"Bearer {settings.access_token}",
+        "Authorization": f"Bearer {access_token or settings.access_token}",
         "x-api-key": settings.api_key,
         "x-gw-ims-org-id": settings.ims_org,
-        "x-sandbox-name": settings.sandbox_name,
+        "x-sandbox-name": sandbox_name or settings.sandbox_name,
         "Content-Type": "application/json",
     }
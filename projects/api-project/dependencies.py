@@ -0,0 +1,30 @@
+"""
+FastAPI 의존성
+라우터에서 공유 리소스를 주입받기 위한 함수
+"""
+from fastapi import Request
+
+from services.adobe_client import AdobeAPIClient
+from services.dataflow_monitor import DataflowRunMonitor
+from services.job_monitor import SegmentJobMonitor
+from services.namespace_registry import NamespaceRegistry
+
+
+def get_adobe_client(request: Request) -> AdobeAPIClient:
+    """앱 수명 주기(lifespan)에서 생성된 공유 AdobeAPIClient 반환"""
+    return request.app.state.adobe_client
+
+
+def get_namespace_registry(request: Request) -> NamespaceRegistry:
+    """앱 수명 주기(lifespan)에서 생성된 Identity Namespace 레지스트리 반환"""
+    return request.app.state.namespace_registry
+
+
+def get_segment_job_monitor(request: Request) -> SegmentJobMonitor:
+    """앱 수명 주기(lifespan)에서 생성된 세그먼트 작업 모니터 반환"""
+    return request.app.state.segment_job_monitor
+
+
+def get_dataflow_monitor(request: Request) -> DataflowRunMonitor:
+    """앱 수명 주기(lifespan)에서 생성된 데이터 플로우 실행 모니터 반환"""
+    return request.app.state.dataflow_monitor
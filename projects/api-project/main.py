@@ -2,10 +2,78 @@
 Adobe Experience Platform API Documentation Server
 FastAPI 기반 AEP API 엔드포인트 문서화 및 테스트 서버
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from config import settings
+from routers import schema_registry, identity, profile, segmentation, destinations, overview
+from services.adobe_client import AdobeAPIClient
+from services.metrics import MetricsMiddleware, PoolCollector
+from services.dataflow_monitor import DataflowRunMonitor
+from services.job_monitor import SegmentJobMonitor
+from services.namespace_registry import NamespaceRegistry
+from services.warmer import CacheWarmer
+from responses import FastJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 주기 관리
+    
+    모든 라우터가 공유하는 AdobeAPIClient(커넥션 풀)를 시작 시 생성하고
+    종료 시 열린 연결을 정리합니다.
+    warmup_enabled이면 참조 데이터 캐시 예열을 백그라운드로 시작합니다.
+    """
+    client = AdobeAPIClient()
+    await client.start()
+    app.state.adobe_client = client
+    app.state.namespace_registry = NamespaceRegistry(
+        client,
+        refresh_interval=settings.namespace_registry_refresh_interval,
+        miss_refresh_interval=settings.namespace_registry_miss_refresh_interval
+    )
+    app.state.segment_job_monitor = SegmentJobMonitor(
+        client,
+        min_interval=settings.segment_job_poll_min_interval,
+        max_interval=settings.segment_job_poll_max_interval,
+        backoff=settings.segment_job_poll_backoff,
+        idle_timeout=settings.segment_job_poll_idle_timeout
+    )
+    app.state.dataflow_monitor = DataflowRunMonitor(
+        client,
+        interval=settings.dataflow_monitor_interval,
+        concurrency=settings.dataflow_monitor_concurrency,
+        max_runs_per_flow=settings.dataflow_monitor_max_runs_per_flow,
+        idle_timeout=settings.dataflow_monitor_idle_timeout
+    )
+    pool_collector = PoolCollector(client).register() if settings.metrics_enabled else None
+    warmer = None
+    if settings.warmup_enabled:
+        warmer = CacheWarmer(
+            client,
+            settings.warmup_targets,
+            concurrency=settings.warmup_concurrency,
+            timeout=settings.warmup_timeout,
+            refresh_interval=settings.warmup_refresh_interval
+        )
+        await warmer.start()
+    app.state.warmer = warmer
+    try:
+        yield
+    finally:
+        await app.state.segment_job_monitor.stop()
+        await app.state.dataflow_monitor.stop()
+        if warmer is not None:
+            await warmer.stop()
+        if pool_collector is not None:
+            pool_collector.unregister()
+        await client.aclose()
 
-from routers import schema_registry, identity, profile, segmentation, destinations
 
 app = FastAPI(
     title="Adobe Experience Platform API Documentation",
@@ -19,10 +87,13 @@ app = FastAPI(
     * **Profile API** - Real-Time Customer Profile 조회
     * **Segmentation** - 세그먼트 정의 및 관리
     * **Destinations** - 데이터 활성화 대상 관리
+    * **Overview** - 대시보드용 주요 리소스 요약
     """,
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -34,12 +105,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus 메트릭 수집 (라우트 템플릿 단위)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(schema_registry.router, prefix="/api/schema-registry", tags=["Schema Registry"])
 app.include_router(identity.router, prefix="/api/identity", tags=["Identity Service"])
 app.include_router(profile.router, prefix="/api/profile", tags=["Real-Time Customer Profile"])
 app.include_router(segmentation.router, prefix="/api/segmentation", tags=["Segmentation"])
 app.include_router(destinations.router, prefix="/api/destinations", tags=["Destinations"])
+app.include_router(overview.router, prefix="/api", tags=["Overview"])
 
 
 @app.get("/", tags=["Root"])
@@ -54,9 +130,64 @@ async def root():
 
 
 @app.get("/health", tags=["Root"])
-async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
+async def health_check(request: Request):
+    """
+    헬스 체크 엔드포인트
+
+    캐시 예열이 끝나기 전에는 503을 반환하여 로드밸런서가 트래픽을 보내지 않도록 합니다.
+    """
+    warmer = getattr(request.app.state, "warmer", None)
+    if warmer is None:
+        return {"status": "healthy"}
+    if not warmer.ready.is_set():
+        return JSONResponse(status_code=503, content={"status": "warming", "warmup": warmer.info()})
+    return {"status": "healthy", "warmup": warmer.info()}
+
+
+@app.get("/cache/stats", tags=["Root"])
+async def cache_stats():
+    """응답 캐시 적중/미스/제거 통계"""
+    cache = app.state.adobe_client.cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.info()}
+
+
+@app.get("/identity-cache/stats", tags=["Root"])
+async def identity_cache_stats():
+    """Identity 클러스터 캐시 통계 (적중/미스, 클러스터 병합/제거 수, 저장된 클러스터/Identity 수)"""
+    identity_cache = app.state.adobe_client.identity_cache
+    if identity_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **identity_cache.info()}
+
+
+@app.get("/segment-job-monitor/stats", tags=["Root"])
+async def segment_job_monitor_stats():
+    """세그먼트 작업 폴러 상태 (작업별 구독자 수, 조회 횟수, 현재 폴링 간격)"""
+    return app.state.segment_job_monitor.info()
+
+
+@app.get("/namespace-registry/stats", tags=["Root"])
+async def namespace_registry_stats():
+    """Identity Namespace 레지스트리 상태 (색인된 Namespace 수, idType별 개수, 갱신 버전)"""
+    return app.state.namespace_registry.info()
+
+
+@app.get("/rate-limits/stats", tags=["Root"])
+async def rate_limit_stats():
+    """API 계열별 속도 제한 상태 (현재 속도, 대기열 길이, 대기 시간)"""
+    limiter = app.state.adobe_client.rate_limiter
+    if limiter is None:
+        return {"enabled": False}
+    return {"enabled": True, "families": limiter.info()}
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", tags=["Root"])
+    async def metrics():
+        """Prometheus 메트릭 (라우트/업스트림 지연 시간, 상태 코드, 응답 크기, 커넥션 풀 사용률)"""
+        return Response(generate_latest(), headers={"Content-Type": CONTENT_TYPE_LATEST})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,4 @@
+"""
+Mock AEP 서버
+부하 테스트/벤치마크용 로컬 Adobe Experience Platform API 대역
+"""
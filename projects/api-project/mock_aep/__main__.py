@@ -0,0 +1,44 @@
+"""
+Mock AEP 서버 실행
+
+사용법 (api-project 디렉터리에서):
+    python -m mock_aep --port 8080 --latency-ms 40 --error-rate-429 0.05
+"""
+import argparse
+
+import uvicorn
+
+from mock_aep.app import create_app
+from mock_aep.settings import mock_settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Mock AEP 서버")
+    parser.add_argument("--host", default=mock_settings.host)
+    parser.add_argument("--port", type=int, default=mock_settings.port)
+    parser.add_argument("--seed", type=int, default=mock_settings.seed, help="데이터/지연 시간 난수 seed")
+    parser.add_argument("--latency-distribution", default=mock_settings.latency_distribution,
+                        choices=["none", "fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--latency-ms", type=float, default=mock_settings.latency_ms, help="지연 시간 중앙값 (ms)")
+    parser.add_argument("--latency-spread", type=float, default=mock_settings.latency_spread)
+    parser.add_argument("--error-rate-429", type=float, default=mock_settings.error_rate_429)
+    parser.add_argument("--error-rate-5xx", type=float, default=mock_settings.error_rate_5xx)
+    parser.add_argument("--stall-rate", type=float, default=mock_settings.stall_rate)
+    args = parser.parse_args()
+
+    settings = mock_settings.model_copy(update={
+        "host": args.host,
+        "port": args.port,
+        "seed": args.seed,
+        "latency_distribution": args.latency_distribution,
+        "latency_ms": args.latency_ms,
+        "latency_spread": args.latency_spread,
+        "error_rate_429": args.error_rate_429,
+        "error_rate_5xx": args.error_rate_5xx,
+        "stall_rate": args.stall_rate,
+    })
+    uvicorn.run(create_app(settings), host=settings.host, port=settings.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+"""
+Mock AEP 서버
+AdobeAPIClient / AEPSchemaBuilder가 사용하는 AEP API를 로컬에서 흉내 내는 FastAPI 앱
+"""
+import base64
+import hashlib
+import json
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Body, FastAPI, Query, Request, Response
+
+from mock_aep.data import MockStore
+from mock_aep.faults import FaultInjectionMiddleware, MockStats
+from mock_aep.settings import MockSettings, mock_settings
+
+router = APIRouter()
+
+SCHEMA_REGISTRY = "/data/foundation/schemaregistry"
+FLOW_SERVICE = "/data/foundation/flowservice"
+
+
+# 공통 응답/페이지네이션
+def respond(request: Request, data: Any, status_code: int = 200) -> Response:
+    """JSON 응답 (GET 200 응답에는 ETag를 붙이고 If-None-Match가 같으면 304)"""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    headers = {}
+    if request.method == "GET" and status_code == 200:
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        headers["ETag"] = etag
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
+
+
+def error(request: Request, status_code: int, title: str) -> Response:
+    return respond(request, {"title": title, "status": status_code}, status_code)
+
+
+def state(request: Request) -> Tuple[MockStore, MockSettings]:
+    return request.app.state.store, request.app.state.settings
+
+
+def page_slice(items: List[Any], start: Any, limit: int, settings: MockSettings) -> Tuple[List[Any], Optional[int]]:
+    """start 위치부터 limit개(최대 max_page_size)와 다음 시작 위치 (마지막 페이지면 None)"""
+    limit = max(1, min(int(limit), settings.max_page_size))
+    offset = int(start or 0)
+    end = offset + limit
+    return items[offset:end], end if end < len(items) else None
+
+
+def filter_property(items: List[Dict[str, Any]], expression: Optional[str]) -> List[Dict[str, Any]]:
+    """`property=key==value` 필터 (값이 목록이면 포함 여부로 비교)"""
+    if not expression or "==" not in expression:
+        return items
+    key, value = expression.split("==", 1)
+    matched = []
+    for item in items:
+        field = item.get(key)
+        if field == value or (isinstance(field, list) and value in field):
+            matched.append(item)
+    return matched
+
+
+def registry_page(request: Request, items: List[Dict[str, Any]], limit: int, start: Any) -> Dict[str, Any]:
+    """Schema Registry 목록 응답 (`_page.next` → start, Accept가 xed-id면 요약 필드만)"""
+    _, settings = state(request)
+    page, next_start = page_slice(items, start, limit, settings)
+    if "xed-id" in request.headers.get("accept", ""):
+        page = [
+            {key: item.get(key) for key in ("$id", "meta:altId", "version", "title")}
+            for item in page
+        ]
+    result = {
+        "results": page,
+        "_page": {"orderby": "title", "next": str(next_start) if next_start is not None else None, "count": len(page)},
+        "_links": {},
+    }
+    if next_start is not None:
+        result["_links"]["next"] = {"href": f"{request.url.path}?start={next_start}&limit={limit}"}
+    return result
+
+
+def ups_page(request: Request, items: List[Dict[str, Any]], limit: int, start: Any, key: str = "children") -> Dict[str, Any]:
+    """UPS 목록 응답 (`_page.next` → start)"""
+    _, settings = state(request)
+    page, next_start = page_slice(items, start, limit, settings)
+    result = {
+        "_page": {"totalCount": len(items), "pageSize": len(page), "next": str(next_start) if next_start is not None else None},
+        key: page,
+        "_links": {},
+    }
+    if next_start is not None:
+        result["_links"]["next"] = {"href": f"{request.url.path}?start={next_start}&limit={limit}"}
+    return result
+
+
+def flow_page(request: Request, items: List[Dict[str, Any]], limit: int, token: Optional[str]) -> Dict[str, Any]:
+    """Flow Service 목록 응답 (`_links.next.href`의 continuationToken)"""
+    _, settings = state(request)
+    start = int(base64.urlsafe_b64decode(token.encode()).decode()) if token else 0
+    page, next_start = page_slice(items, start, limit, settings)
+    result: Dict[str, Any] = {"items": page, "_links": {}}
+    if next_start is not None:
+        next_token = base64.urlsafe_b64encode(str(next_start).encode()).decode()
+        result["_links"]["next"] = {"href": f"{request.url.path}?continuationToken={next_token}&limit={limit}"}
+    return result
+
+
+# Adobe IMS
+@router.post("/ims/token/v3", tags=["IMS"])
+async def issue_token(request: Request):
+    """Client Credentials 토큰 발급 (어떤 client_id/secret이든 허용)"""
+    return respond(request, {
+        "access_token": f"mock-{uuid.uuid4().hex}",
+        "token_type": "bearer",
+        "expires_in": 86399,
+    })
+
+
+# Schema Registry
+@router.get(f"{SCHEMA_REGISTRY}/tenant/schemas", tags=["Schema Registry"])
+async def list_schemas(
+    request: Request,
+    limit: int = Query(20),
+    start: Optional[str] = Query(None),
+    property: Optional[str] = Query(None)
+):
+    store, _ = state(request)
+    items = filter_property(store.schemas, property)
+    return respond(request, registry_page(request, items, limit, start))
+
+
+@router.post(f"{SCHEMA_REGISTRY}/tenant/schemas", tags=["Schema Registry"])
+async def create_schema(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    if any(schema.get("title") == body.get("title") for schema in store.schemas):
+        return error(request, 409, f"Schema '{body.get('title')}' already exists")
+    schema = store.make_schema(body, seq=len(store.schemas))
+    store.schemas.append(schema)
+    return respond(request, schema, 201)
+
+
+@router.get(SCHEMA_REGISTRY + "/tenant/schemas/{schema_id:path}", tags=["Schema Registry"])
+async def get_schema(request: Request, schema_id: str):
+    store, _ = state(request)
+    schema = store.find(store.schemas, schema_id)
+    if schema is None:
+        return error(request, 404, "Schema not found")
+    return respond(request, schema)
+
+
+@router.patch(SCHEMA_REGISTRY + "/tenant/schemas/{schema_id:path}", tags=["Schema Registry"])
+async def patch_schema(request: Request, schema_id: str, operations: List[Dict[str, Any]] = Body(...)):
+    """JSON Patch의 최상위 경로 add/replace/remove만 지원"""
+    store, _ = state(request)
+    schema = store.find(store.schemas, schema_id)
+    if schema is None:
+        return error(request, 404, "Schema not found")
+    for operation in operations:
+        key = operation.get("path", "").lstrip("/").split("/", 1)[0]
+        if operation.get("op") in ("add", "replace"):
+            schema[key] = operation.get("value")
+        elif operation.get("op") == "remove":
+            schema.pop(key, None)
+    return respond(request, schema)
+
+
+@router.delete(SCHEMA_REGISTRY + "/tenant/schemas/{schema_id:path}", tags=["Schema Registry"])
+async def delete_schema(request: Request, schema_id: str):
+    store, _ = state(request)
+    schema = store.find(store.schemas, schema_id)
+    if schema is None:
+        return error(request, 404, "Schema not found")
+    store.schemas.remove(schema)
+    return Response(status_code=204)
+
+
+@router.get(f"{SCHEMA_REGISTRY}/global/classes", tags=["Schema Registry"])
+async def list_classes(request: Request, limit: int = Query(20), start: Optional[str] = Query(None)):
+    store, _ = state(request)
+    return respond(request, registry_page(request, store.classes, limit, start))
+
+
+@router.get(SCHEMA_REGISTRY + "/global/classes/{class_id:path}", tags=["Schema Registry"])
+async def get_class(request: Request, class_id: str):
+    store, _ = state(request)
+    resource = store.find(store.classes, class_id)
+    return respond(request, resource) if resource else error(request, 404, "Class not found")
+
+
+@router.get(SCHEMA_REGISTRY + "/{container}/fieldgroups", tags=["Schema Registry"])
+async def list_field_groups(
+    request: Request,
+    container: str,
+    limit: int = Query(20),
+    start: Optional[str] = Query(None),
+    property: Optional[str] = Query(None)
+):
+    store, _ = state(request)
+    items = store.tenant_field_groups if container == "tenant" else store.field_groups
+    return respond(request, registry_page(request, filter_property(items, property), limit, start))
+
+
+@router.post(f"{SCHEMA_REGISTRY}/tenant/fieldgroups", tags=["Schema Registry"])
+async def create_field_group(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    if any(fg.get("title") == body.get("title") for fg in store.tenant_field_groups):
+        return error(request, 409, f"Field group '{body.get('title')}' already exists")
+    field_group = store.make_field_group(body)
+    store.tenant_field_groups.append(field_group)
+    return respond(request, field_group, 201)
+
+
+@router.get(SCHEMA_REGISTRY + "/{container}/fieldgroups/{field_group_id:path}", tags=["Schema Registry"])
+async def get_field_group(request: Request, container: str, field_group_id: str):
+    store, _ = state(request)
+    items = store.tenant_field_groups if container == "tenant" else store.field_groups
+    resource = store.find(items, field_group_id)
+    return respond(request, resource) if resource else error(request, 404, "Field group not found")
+
+
+@router.get(f"{SCHEMA_REGISTRY}/global/datatypes", tags=["Schema Registry"])
+async def list_data_types(request: Request, limit: int = Query(20), start: Optional[str] = Query(None)):
+    store, _ = state(request)
+    return respond(request, registry_page(request, store.data_types, limit, start))
+
+
+@router.get(f"{SCHEMA_REGISTRY}/tenant/descriptors", tags=["Schema Registry"])
+async def list_descriptors(request: Request):
+    store, _ = state(request)
+    return respond(request, {"results": store.descriptors})
+
+
+@router.post(f"{SCHEMA_REGISTRY}/tenant/descriptors", tags=["Schema Registry"])
+async def create_descriptor(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    descriptor = {**body, "@id": uuid.uuid4().hex, "meta:containerId": store.settings.tenant_id}
+    store.descriptors.append(descriptor)
+    return respond(request, descriptor, 201)
+
+
+# Catalog
+@router.post("/data/foundation/catalog/dataSets", tags=["Catalog"])
+async def create_dataset(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    return respond(request, [f"@/dataSets/{store.add_dataset(body)}"], 201)
+
+
+# Identity Service
+@router.get("/data/core/idnamespace/identities", tags=["Identity Service"])
+async def list_namespaces(request: Request):
+    store, _ = state(request)
+    return respond(request, store.namespaces)
+
+
+@router.post("/data/core/idnamespace/identities", tags=["Identity Service"])
+async def create_namespace(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    if not body.get("code"):
+        return error(request, 400, "code is required")
+    if any(ns["code"].lower() == body["code"].lower() for ns in store.namespaces):
+        return error(request, 409, f"Namespace '{body['code']}' already exists")
+    return respond(request, store.add_namespace(body))
+
+
+@router.get("/data/core/idnamespace/identities/{namespace_id}", tags=["Identity Service"])
+async def get_namespace(request: Request, namespace_id: str):
+    store, _ = state(request)
+    namespace = next((ns for ns in store.namespaces if str(ns["id"]) == namespace_id), None)
+    return respond(request, namespace) if namespace else error(request, 404, "Namespace not found")
+
+
+@router.get("/data/core/identity/cluster/members", tags=["Identity Service"])
+async def get_cluster_members(
+    request: Request,
+    xid: Optional[str] = Query(None),
+    namespace: Optional[str] = Query(None),
+    nsid: Optional[str] = Query(None)
+):
+    store, _ = state(request)
+    key = xid or f"{namespace}:{nsid}"
+    return respond(request, {"xid": xid, "identities": store.cluster_members(key)})
+
+
+@router.post("/data/core/identity/clusters/members", tags=["Identity Service"])
+async def get_cluster_members_batch(request: Request, body: Dict[str, Any] = Body(...)):
+    store, _ = state(request)
+    response = []
+    for xid in body.get("xids") or []:
+        response.append({"xid": xid, "members": store.cluster_members(xid)})
+    for composite in body.get("compositeXids") or []:
+        response.append({
+            "compositeXid": composite,
+            "members": store.cluster_members(f"{composite.get('nsid')}:{composite.get('id')}"),
+        })
+    return respond(request, {"version": "1.0", "response": response})
+
+
+# Real-Time Customer Profile
+@router.get("/data/core/ups/access/entities", tags=["Profile"])
+async def get_profile_entity(
+    request: Request,
+    entity_id: Optional[str] = Query(None, alias="entityId"),
+    entity_id_ns: Optional[str] = Query(None, alias="entityIdNS")
+):
+    store, _ = state(request)
+    if not entity_id:
+        return error(request, 400, "entityId is required")
+    return respond(request, store.profile(entity_id, entity_id_ns or "ECID"))
+
+
+@router.get("/data/core/ups/preview", tags=["Profile"])
+async def preview_profiles(request: Request, limit: int = Query(10)):
+    store, settings = state(request)
+    count = max(1, min(limit, settings.max_page_size))
+    return respond(request, {"results": [store.profile(f"preview-{i}", "ECID") for i in range(count)]})
+
+
+@router.get("/data/core/ups/config/mergePolicies", tags=["Profile"])
+async def list_merge_policies(request: Request, limit: int = Query(20), start: Optional[str] = Query(None)):
+    store, _ = state(request)
+    return respond(request, ups_page(request, store.merge_policies, limit, start))
+
+
+@router.get("/data/core/ups/config/mergePolicies/{policy_id}", tags=["Profile"])
+async def get_merge_policy(request: Request, policy_id: str):
+    store, _ = state(request)
+    policy = next((p for p in store.merge_policies if p["id"] == policy_id), None)
+    return respond(request, policy) if policy else error(request, 404, "Merge policy not found")
+
+
+# Segmentation
+@router.get("/data/core/ups/segment/definitions", tags=["Segmentation"])
+async def list_segment_definitions(request: Request, limit: int = Query(10), page: int = Query(0)):
+    store, settings = state(request)
+    size = max(1, min(limit, settings.max_page_size))
+    total = len(store.segment_definitions)
+    return respond(request, {
+        "segments": store.segment_definitions[page * size:(page + 1) * size],
+        "page": {"totalCount": total, "totalPages": -(-total // size), "pageOffset": page, "pageSize": size},
+        "link": {"next": ""},
+    })
+
+
+@router.get("/data/core/ups/segment/definitions/{segment_id}", tags=["Segmentation"])
+async def get_segment_definition(request: Request, segment_id: str):
+    store, _ = state(request)
+    segment = next((s for s in store.segment_definitions if s["id"] == segment_id), None)
+    return respond(request, segment) if segment else error(request, 404, "Segment definition not found")
+
+
+@router.get("/data/core/ups/segment/jobs", tags=["Segmentation"])
+async def list_segment_jobs(
+    request: Request,
+    limit: int = Query(20),
+    start: Optional[str] = Query(None),
+    status: Optional[str] = Query(None)
+):
+    store, _ = state(request)
+    jobs = [store.view_segment_job(job) for job in store.segment_jobs]
+    if status:
+        jobs = [job for job in jobs if job["status"] == status.upper()]
+    return respond(request, ups_page(request, jobs, limit, start))
+
+
+@router.post("/data/core/ups/segment/jobs", tags=["Segmentation"])
+async def create_segment_job(request: Request, body: Any = Body(...)):
+    """본문은 {"segmentId": [...]} 또는 [{"segmentId": ...}] 형식 모두 허용"""
+    store, _ = state(request)
+    if isinstance(body, dict):
+        segment_ids = body.get("segmentId") or []
+        segment_ids = [segment_ids] if isinstance(segment_ids, str) else segment_ids
+    else:
+        segment_ids = [item.get("segmentId") for item in body if isinstance(item, dict)]
+    if not segment_ids:
+        return error(request, 400, "segmentId is required")
+    return respond(request, store.add_segment_job(segment_ids))
+
+
+@router.get("/data/core/ups/segment/jobs/{job_id}", tags=["Segmentation"])
+async def get_segment_job(request: Request, job_id: str):
+    store, _ = state(request)
+    job = next((j for j in store.segment_jobs if j["id"] == job_id), None)
+    return respond(request, store.view_segment_job(job)) if job else error(request, 404, "Segment job not found")
+
+
+@router.get("/data/core/ups/audiences", tags=["Segmentation"])
+async def list_audiences(request: Request, limit: int = Query(20), start: Optional[str] = Query(None)):
+    store, _ = state(request)
+    return respond(request, ups_page(request, store.audiences, limit, start))
+
+
+# Flow Service (Destinations)
+@router.get(f"{FLOW_SERVICE}/destinations", tags=["Flow Service"])
+async def list_destinations(request: Request, limit: int = Query(20), continuation_token: Optional[str] = Query(None, alias="continuationToken")):
+    store, _ = state(request)
+    return respond(request, flow_page(request, store.destinations, limit, continuation_token))
+
+
+@router.get(FLOW_SERVICE + "/destinations/{destination_id}", tags=["Flow Service"])
+async def get_destination(request: Request, destination_id: str):
+    store, _ = state(request)
+    destination = next((d for d in store.destinations if d["id"] == destination_id), None)
+    return respond(request, {"items": [destination]}) if destination else error(request, 404, "Destination not found")
+
+
+@router.get(f"{FLOW_SERVICE}/flows", tags=["Flow Service"])
+async def list_dataflows(request: Request, limit: int = Query(20), continuation_token: Optional[str] = Query(None, alias="continuationToken")):
+    store, _ = state(request)
+    return respond(request, flow_page(request, store.dataflows, limit, continuation_token))
+
+
+@router.get(FLOW_SERVICE + "/flows/{dataflow_id}", tags=["Flow Service"])
+async def get_dataflow(request: Request, dataflow_id: str):
+    store, _ = state(request)
+    dataflow = next((f for f in store.dataflows if f["id"] == dataflow_id), None)
+    return respond(request, {"items": [dataflow]}) if dataflow else error(request, 404, "Dataflow not found")
+
+
+@router.get(f"{FLOW_SERVICE}/runs", tags=["Flow Service"])
+async def list_runs(
+    request: Request,
+    limit: int = Query(20),
+    property: Optional[str] = Query(None),
+    orderby: Optional[str] = Query(None),
+    continuation_token: Optional[str] = Query(None, alias="continuationToken")
+):
+    """`orderby=-createdAt`처럼 필드명 앞에 -를 붙이면 내림차순"""
+    store, _ = state(request)
+    runs = filter_property(store.runs, property)
+    if orderby:
+        key = orderby.lstrip("+-")
+        runs = sorted(runs, key=lambda run: run.get(key) or 0, reverse=orderby.startswith("-"))
+    return respond(request, flow_page(request, runs, limit, continuation_token))
+
+
+@router.get(f"{FLOW_SERVICE}/connectionSpecs", tags=["Flow Service"])
+async def list_connection_specs(request: Request):
+    store, _ = state(request)
+    return respond(request, {"items": store.connection_specs})
+
+
+# Mock 제어용 엔드포인트
+@router.get("/__mock/config", tags=["Mock"])
+async def get_config(request: Request):
+    """현재 지연/장애 주입 설정"""
+    return request.app.state.settings.model_dump()
+
+
+@router.patch("/__mock/config", tags=["Mock"])
+async def update_config(request: Request, changes: Dict[str, Any] = Body(...)):
+    """
+    실행 중 설정 변경 (예: {"error_rate_429": 0.1, "latency_ms": 200})
+
+    데이터 규모 관련 값은 POST /__mock/reset 이후에 반영됩니다.
+    """
+    settings: MockSettings = request.app.state.settings
+    updated = MockSettings.model_validate({**settings.model_dump(), **changes})
+    for name in changes:
+        setattr(settings, name, getattr(updated, name))
+    return settings.model_dump()
+
+
+@router.get("/__mock/stats", tags=["Mock"])
+async def get_stats(request: Request):
+    """API 계열별 요청 수와 주입한 장애 수"""
+    return request.app.state.stats.info()
+
+
+@router.post("/__mock/reset", tags=["Mock"])
+async def reset(request: Request):
+    """데이터를 seed로 다시 생성하고 통계 초기화"""
+    request.app.state.store = MockStore(request.app.state.settings)
+    stats: MockStats = request.app.state.stats
+    stats.requests.clear()
+    stats.injected.clear()
+    stats.total_delay = 0.0
+    return {"status": "reset"}
+
+
+def create_app(settings: Optional[MockSettings] = None) -> FastAPI:
+    """Mock AEP 앱 생성 (벤치마크에서 설정을 달리하여 여러 인스턴스 생성 가능)"""
+    settings = settings or mock_settings
+    stats = MockStats()
+    app = FastAPI(
+        title="Mock Adobe Experience Platform",
+        description="부하 테스트/벤치마크용 로컬 AEP API 대역 서버",
+        version="1.0.0",
+    )
+    app.state.settings = settings
+    app.state.stats = stats
+    app.state.store = MockStore(settings)
+    app.include_router(router)
+    app.add_middleware(FaultInjectionMiddleware, settings=settings, stats=stats)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,403 @@
+"""
+Mock AEP 데이터 저장소
+seed 기반으로 재현 가능한 스키마/Identity/프로필/세그먼트/데이터 플로우 데이터를 생성하고 생성 요청을 메모리에 반영
+"""
+import hashlib
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from mock_aep.settings import MockSettings
+
+# 기본 제공 Identity Namespace (id, code, name, idType)
+STANDARD_NAMESPACES = [
+    (4, "ECID", "Experience Cloud ID", "COOKIE"),
+    (6, "Email", "Email", "EMAIL"),
+    (7, "Phone", "Phone", "PHONE"),
+    (10, "AAID", "Adobe Analytics (Legacy ID)", "COOKIE"),
+    (411, "AdCloud", "AdCloud", "COOKIE"),
+    (20914, "GAID", "Google Ad ID (GAID)", "DEVICE"),
+    (20915, "IDFA", "Apple IDFA (ID for Advertisers)", "DEVICE"),
+    (28271, "Email_LC_SHA256", "Emails (SHA256, lowercased)", "EMAIL"),
+    (28272, "Phone_SHA256", "Phone (SHA256)", "PHONE"),
+]
+
+STANDARD_CLASSES = [
+    ("https://ns.adobe.com/xdm/context/profile", "XDM Individual Profile"),
+    ("https://ns.adobe.com/xdm/context/experienceevent", "XDM ExperienceEvent"),
+    ("https://ns.adobe.com/xdm/classes/record", "Record Schema"),
+    ("https://ns.adobe.com/xdm/classes/product", "Product"),
+]
+
+FIRST_NAMES = ["Minjun", "Seoyeon", "Jiho", "Hayoon", "Doyun", "Jiwoo", "Alex", "Sam", "Jordan", "Taylor"]
+LAST_NAMES = ["Kim", "Lee", "Park", "Choi", "Jung", "Kang", "Smith", "Garcia", "Chen", "Brown"]
+CITIES = ["Seoul", "Busan", "Incheon", "Daegu", "San Jose", "New York", "London", "Tokyo"]
+
+
+def iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def stable_hex(*parts: Any, length: int = 32) -> str:
+    """입력값이 같으면 항상 같은 16진수 ID"""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:length]
+
+
+class MockStore:
+    """
+    Mock AEP 리소스 저장소
+
+    목록 데이터는 시작 시 seed로 한 번 생성하며, 프로필/Identity 클러스터처럼 키로 조회하는
+    데이터는 요청 값에서 결정적으로 만들어 같은 입력이면 항상 같은 응답을 돌려줍니다.
+    """
+
+    def __init__(self, settings: MockSettings):
+        self.settings = settings
+        self.tenant = settings.tenant_id
+        self.started_at = time.time()
+        rng = random.Random(settings.seed)
+
+        self.classes = self._generate_classes(rng, settings.classes)
+        self.field_groups = self._generate_field_groups(rng, settings.field_groups)
+        self.data_types = self._generate_data_types(settings.data_types)
+        self.schemas = self._generate_schemas(rng, settings.schemas)
+        self.tenant_field_groups: List[Dict[str, Any]] = []
+        self.descriptors: List[Dict[str, Any]] = []
+        self.datasets: List[Dict[str, Any]] = []
+        self.namespaces = [
+            {
+                "id": nsid,
+                "name": name,
+                "code": code,
+                "description": f"{name} namespace",
+                "idType": id_type,
+                "namespaceType": "Standard",
+                "createTime": 1551688425000,
+                "status": "ACTIVE",
+            }
+            for nsid, code, name, id_type in STANDARD_NAMESPACES
+        ]
+        self.merge_policies = self._generate_merge_policies(settings.merge_policies)
+        self.segment_definitions = self._generate_segment_definitions(rng, settings.segment_definitions)
+        self.segment_jobs = self._generate_segment_jobs(rng, settings.segment_jobs)
+        self.audiences = self._generate_audiences(settings.audiences)
+        self.destinations = self._generate_destinations(settings.destinations)
+        self.dataflows = self._generate_dataflows(settings.dataflows)
+        self.runs = self._generate_runs(rng, settings.runs_per_dataflow)
+        self.connection_specs = self._generate_connection_specs()
+
+    # Schema Registry
+    def _generate_classes(self, rng: random.Random, count: int) -> List[Dict[str, Any]]:
+        classes = [
+            {"$id": class_id, "meta:altId": class_id.replace("https://ns.adobe.com/", "_").replace("/", "."),
+             "title": title, "description": f"{title} class", "type": "object", "version": "1.0",
+             "meta:resourceType": "classes", "meta:extensible": True}
+            for class_id, title in STANDARD_CLASSES
+        ]
+        for i in range(len(classes), count):
+            class_id = f"https://ns.adobe.com/xdm/classes/mock-{i:04d}"
+            classes.append({
+                "$id": class_id, "meta:altId": f"_xdm.classes.mock-{i:04d}",
+                "title": f"Mock Class {i:04d}", "description": "Generated class", "type": "object",
+                "version": f"1.{rng.randint(0, 9)}", "meta:resourceType": "classes", "meta:extensible": True,
+            })
+        return classes
+
+    def _generate_field_groups(self, rng: random.Random, count: int) -> List[Dict[str, Any]]:
+        field_groups = []
+        for i in range(count):
+            target = STANDARD_CLASSES[i % len(STANDARD_CLASSES)][0]
+            fg_id = f"https://ns.adobe.com/xdm/mixins/mock-{i:04d}"
+            field_groups.append({
+                "$id": fg_id, "meta:altId": f"_xdm.mixins.mock-{i:04d}",
+                "title": f"Mock Field Group {i:04d}", "description": "Generated field group",
+                "type": "object", "version": f"1.{rng.randint(0, 9)}",
+                "meta:resourceType": "mixins", "meta:intendedToExtend": [target],
+                "meta": {"intendedToExtend": [target]},
+            })
+        return field_groups
+
+    def _generate_data_types(self, count: int) -> List[Dict[str, Any]]:
+        return [
+            {"$id": f"https://ns.adobe.com/xdm/datatypes/mock-{i:04d}", "meta:altId": f"_xdm.datatypes.mock-{i:04d}",
+             "title": f"Mock Data Type {i:04d}", "description": "Generated data type", "type": "object",
+             "version": "1.0", "meta:resourceType": "datatypes"}
+            for i in range(count)
+        ]
+
+    def _generate_schemas(self, rng: random.Random, count: int) -> List[Dict[str, Any]]:
+        schemas = []
+        for i in range(count):
+            class_id = STANDARD_CLASSES[i % 2][0]
+            field_groups = rng.sample(self.field_groups, k=min(3, len(self.field_groups)))
+            schemas.append(self.make_schema({
+                "title": f"Mock Schema {i:04d}",
+                "description": "Generated schema",
+                "type": "object",
+                "allOf": [{"$ref": class_id}] + [{"$ref": fg["$id"]} for fg in field_groups],
+            }, seq=i))
+        return schemas
+
+    def make_schema(self, body: Dict[str, Any], seq: Optional[int] = None) -> Dict[str, Any]:
+        """생성 요청 본문으로 테넌트 스키마 리소스 생성"""
+        hex_id = stable_hex(self.tenant, "schema", body.get("title"), seq)
+        refs = [part.get("$ref") for part in body.get("allOf", []) if isinstance(part, dict)]
+        class_id = next((ref for ref in refs if ref in {c["$id"] for c in self.classes}), refs[0] if refs else None)
+        return {
+            **body,
+            "$id": f"https://ns.adobe.com/{self.tenant}/schemas/{hex_id}",
+            "meta:altId": f"_{self.tenant}.schemas.{hex_id}",
+            "meta:resourceType": "schemas",
+            "meta:class": class_id,
+            "meta": {"class": class_id, "tenantNamespace": f"_{self.tenant}"},
+            "version": body.get("version", "1.0"),
+            "type": body.get("type", "object"),
+        }
+
+    def make_field_group(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """생성 요청 본문으로 테넌트 필드 그룹 리소스 생성"""
+        hex_id = stable_hex(self.tenant, "fieldgroup", body.get("title"))
+        return {
+            **body,
+            "$id": f"https://ns.adobe.com/{self.tenant}/mixins/{hex_id}",
+            "meta:altId": f"_{self.tenant}.mixins.{hex_id}",
+            "meta:resourceType": "mixins",
+            "version": body.get("version", "1.0"),
+            "type": body.get("type", "object"),
+        }
+
+    @staticmethod
+    def find(resources: List[Dict[str, Any]], resource_id: str) -> Optional[Dict[str, Any]]:
+        """$id, meta:altId 또는 $id 마지막 경로로 리소스 검색"""
+        for resource in resources:
+            if resource_id in (resource["$id"], resource.get("meta:altId"), resource["$id"].rsplit("/", 1)[-1]):
+                return resource
+        return None
+
+    # Identity Service
+    def add_namespace(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        namespace = {
+            "id": 1000000 + len(self.namespaces),
+            "name": body.get("name", body.get("code")),
+            "code": body["code"],
+            "description": body.get("description"),
+            "idType": body.get("idType", "NON_PEOPLE"),
+            "namespaceType": "Custom",
+            "createTime": int(time.time() * 1000),
+            "status": "ACTIVE",
+        }
+        self.namespaces.append(namespace)
+        return namespace
+
+    def cluster_members(self, key: str) -> List[Dict[str, str]]:
+        """Identity 값으로 결정되는 2~5개 멤버의 Identity 클러스터"""
+        rng = random.Random(stable_hex("cluster", key))
+        members = [{"namespace": "ECID", "id": str(rng.randrange(10 ** 37, 10 ** 38))}]
+        if rng.random() < 0.8:
+            members.append({"namespace": "Email", "id": f"user{rng.randrange(10 ** 6)}@example.com"})
+        if rng.random() < 0.5:
+            members.append({"namespace": "Phone", "id": f"+8210{rng.randrange(10 ** 7, 10 ** 8)}"})
+        for _ in range(rng.randint(0, 2)):
+            members.append({"namespace": "ECID", "id": str(rng.randrange(10 ** 37, 10 ** 38))})
+        return members
+
+    # Profile
+    def profile(self, entity_id: str, entity_id_ns: str) -> Dict[str, Any]:
+        """entityId/entityIdNS로 결정되는 프로필 엔티티"""
+        rng = random.Random(stable_hex("profile", entity_id_ns, entity_id))
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        return {
+            "entityId": entity_id,
+            "entity": {
+                "person": {"name": {"firstName": first, "lastName": last}},
+                "personalEmail": {"address": f"{first}.{last}{rng.randrange(1000)}@example.com".lower()},
+                "homeAddress": {"city": rng.choice(CITIES), "countryCode": rng.choice(["KR", "US", "GB", "JP"])},
+                "identityMap": {entity_id_ns: [{"id": entity_id, "primary": True}]},
+                "loyalty": {"points": rng.randrange(0, 50000), "tier": rng.choice(["bronze", "silver", "gold"])},
+            },
+            "lastModifiedAt": iso(self.started_at - rng.randrange(0, 86400 * 30)),
+        }
+
+    def _generate_merge_policies(self, count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": str(uuid.UUID(stable_hex("merge-policy", i))),
+                "name": "Default Timestamp Ordered" if i == 0 else f"Mock Merge Policy {i:03d}",
+                "description": "Generated merge policy",
+                "imsOrgId": "mock@AdobeOrg",
+                "schema": {"name": "_xdm.context.profile"},
+                "version": 1,
+                "default": i == 0,
+                "identityGraph": {"type": "pdg" if i % 3 else "none"},
+                "attributeMerge": {"type": "timestampOrdered" if i % 2 == 0 else "dataSetPrecedence"},
+                "updateEpoch": int(self.started_at) - i * 3600,
+            }
+            for i in range(count)
+        ]
+
+    # Segmentation
+    def _generate_segment_definitions(self, rng: random.Random, count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": str(uuid.UUID(stable_hex("segment", i))),
+                "name": f"Mock Segment {i:04d}",
+                "description": "Generated segment definition",
+                "schema": {"name": "_xdm.context.profile"},
+                "expression": {
+                    "type": "PQL",
+                    "format": "pql/text",
+                    "value": f"homeAddress.city = \"{rng.choice(CITIES)}\" and loyalty.points > {rng.randrange(100, 10000)}",
+                },
+                "evaluationInfo": {
+                    "batch": {"enabled": True},
+                    "continuous": {"enabled": i % 3 == 0},
+                    "synchronous": {"enabled": i % 5 == 0},
+                },
+                "creationTime": int(self.started_at * 1000) - i * 60000,
+                "updateTime": int(self.started_at * 1000) - i * 30000,
+            }
+            for i in range(count)
+        ]
+
+    def _generate_segment_jobs(self, rng: random.Random, count: int) -> List[Dict[str, Any]]:
+        jobs = []
+        for i in range(count):
+            segment = self.segment_definitions[i % len(self.segment_definitions)] if self.segment_definitions else None
+            status = "SUCCEEDED" if i % 10 else rng.choice(["FAILED", "CANCELLED", "SUCCEEDED"])
+            created = self.started_at - (count - i) * 3600
+            total = rng.randrange(10000, 5000000)
+            jobs.append({
+                "id": str(uuid.UUID(stable_hex("segment-job", i))),
+                "status": status,
+                "segments": [{"segmentId": segment["id"]}] if segment else [],
+                "creationTime": int(created * 1000),
+                "updateTime": int((created + 600) * 1000),
+                "metrics": {
+                    "totalTime": {"startTimeInMs": int(created * 1000), "endTimeInMs": int((created + 600) * 1000),
+                                  "totalTimeInMs": 600000},
+                    "totalProfiles": total,
+                    "segmentedProfileCounter": {segment["id"]: rng.randrange(0, total)} if segment else {},
+                },
+            })
+        return jobs
+
+    def add_segment_job(self, segment_ids: List[str]) -> Dict[str, Any]:
+        now = time.time()
+        job = {
+            "id": str(uuid.uuid4()),
+            "status": "NEW",
+            "segments": [{"segmentId": segment_id} for segment_id in segment_ids],
+            "creationTime": int(now * 1000),
+            "updateTime": int(now * 1000),
+            "_startedAt": now,
+            "metrics": {"totalProfiles": 0, "segmentedProfileCounter": {}},
+        }
+        self.segment_jobs.append(job)
+        return self.view_segment_job(job)
+
+    def view_segment_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """생성한 작업은 경과 시간에 따라 NEW → PROCESSING → SUCCEEDED로 진행"""
+        started = job.get("_startedAt")
+        if started is None:
+            return job
+        duration = max(0.001, self.settings.segment_job_duration)
+        progress = min(1.0, (time.time() - started) / duration)
+        total = int(stable_hex(job["id"], length=6), 16) % 1000000 + 10000
+        job = {key: value for key, value in job.items() if not key.startswith("_")}
+        job["status"] = "NEW" if progress < 0.05 else "PROCESSING" if progress < 1.0 else "SUCCEEDED"
+        job["computeJobProgress"] = round(progress * 100, 1)
+        job["updateTime"] = int(min(time.time(), started + duration) * 1000)
+        job["metrics"] = {
+            "totalProfiles": int(total * progress),
+            "segmentedProfileCounter": {
+                seg["segmentId"]: int(total * progress * 0.3) for seg in job["segments"]
+            },
+        }
+        return job
+
+    def _generate_audiences(self, count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": str(uuid.UUID(stable_hex("audience", i))),
+                "audienceId": str(uuid.UUID(stable_hex("audience", i))),
+                "name": f"Mock Audience {i:04d}",
+                "namespace": "AEPSegments" if i % 4 else "CustomerAudienceUpload",
+                "description": "Generated audience",
+                "lifecycleState": "published",
+                "createdBy": "mock",
+                "creationTime": int(self.started_at * 1000) - i * 60000,
+            }
+            for i in range(count)
+        ]
+
+    # Flow Service
+    def _generate_destinations(self, count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": str(uuid.UUID(stable_hex("destination", i))),
+                "name": f"Mock Destination {i:03d}",
+                "description": "Generated destination",
+                "connectionSpec": {"id": str(uuid.UUID(stable_hex("connection-spec", i % 5))), "version": "1.0"},
+                "state": "enabled",
+                "createdAt": int(self.started_at * 1000) - i * 86400000,
+            }
+            for i in range(count)
+        ]
+
+    def _generate_dataflows(self, count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": str(uuid.UUID(stable_hex("flow", i))),
+                "name": f"Mock Dataflow {i:03d}",
+                "description": "Generated dataflow",
+                "flowSpec": {"id": str(uuid.UUID(stable_hex("flow-spec", i % 3))), "version": "1.0"},
+                "state": "enabled" if i % 7 else "disabled",
+                "sourceConnectionIds": [str(uuid.UUID(stable_hex("source-connection", i)))],
+                "targetConnectionIds": [str(uuid.UUID(stable_hex("target-connection", i)))],
+                "scheduleParams": {"frequency": "hour", "interval": 1},
+                "createdAt": int(self.started_at * 1000) - i * 86400000,
+            }
+            for i in range(count)
+        ]
+
+    def _generate_runs(self, rng: random.Random, per_flow: int) -> List[Dict[str, Any]]:
+        runs = []
+        for flow in self.dataflows:
+            for i in range(per_flow):
+                started = self.started_at - (per_flow - i) * 3600
+                duration = rng.uniform(30, 900)
+                records = rng.randrange(1000, 500000)
+                failed = records // rng.randrange(50, 5000) if rng.random() < 0.2 else 0
+                status = "failed" if failed and rng.random() < 0.3 else "success"
+                runs.append({
+                    "id": str(uuid.UUID(stable_hex("run", flow["id"], i))),
+                    "flowId": flow["id"],
+                    "createdAt": int(started * 1000),
+                    "metrics": {
+                        "durationSummary": {"startedAtUTC": int(started * 1000),
+                                            "completedAtUTC": int((started + duration) * 1000)},
+                        "sizeSummary": {"inputBytes": records * 320, "outputBytes": (records - failed) * 410},
+                        "recordSummary": {"inputRecordCount": records, "outputRecordCount": records - failed,
+                                          "failedRecordCount": failed},
+                        "statusSummary": {"status": status},
+                    },
+                })
+        return runs
+
+    def _generate_connection_specs(self) -> List[Dict[str, Any]]:
+        names = ["Amazon S3", "Google Ads", "Facebook Custom Audience", "Salesforce Marketing Cloud", "HTTP API"]
+        return [
+            {"id": str(uuid.UUID(stable_hex("connection-spec", i))), "name": name,
+             "providerId": str(uuid.UUID(stable_hex("provider", i))), "version": "1.0",
+             "attributes": {"category": "destination" if i else "source"}}
+            for i, name in enumerate(names)
+        ]
+
+    # Catalog
+    def add_dataset(self, body: Dict[str, Any]) -> str:
+        dataset_id = stable_hex("dataset", body.get("name"), len(self.datasets), length=24)
+        self.datasets.append({"id": dataset_id, **body, "created": int(time.time() * 1000)})
+        return dataset_id
+
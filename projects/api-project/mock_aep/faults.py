@@ -0,0 +1,122 @@
+"""
+Mock AEP 지연 시간 및 장애 주입
+요청마다 설정된 분포에서 지연 시간을 뽑고 429/5xx/응답 지연(stall)을 확률적으로 발생
+"""
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from services.rate_limiter import endpoint_family
+
+from mock_aep.settings import MockSettings
+
+# 장애 주입/지연을 적용하지 않는 경로 (제어용 엔드포인트, IMS 토큰 발급)
+EXEMPT_PREFIXES = ("/__mock", "/ims/")
+
+
+class LatencyModel:
+    """설정된 분포에서 응답 지연(초) 샘플링"""
+
+    def __init__(self, settings: MockSettings, rng: Optional[random.Random] = None):
+        self.settings = settings
+        self.rng = rng or random.Random(settings.seed)
+
+    def sample(self, family: str) -> float:
+        settings = self.settings
+        base = settings.family_latency_ms.get(family, settings.latency_ms)
+        spread = settings.latency_spread
+        distribution = settings.latency_distribution
+        if distribution == "none" or base <= 0:
+            return 0.0
+        if distribution == "fixed":
+            ms = base
+        elif distribution == "uniform":
+            ms = self.rng.uniform(base * (1 - spread), base * (1 + spread))
+        elif distribution == "normal":
+            ms = self.rng.gauss(base, base * spread)
+        else:
+            ms = self.rng.lognormvariate(0.0, spread) * base
+        return max(0.0, ms) / 1000
+
+
+class MockStats:
+    """API 계열별 요청 수와 주입한 장애 수"""
+
+    def __init__(self):
+        self.requests: Counter = Counter()
+        self.injected: Counter = Counter()
+        self.total_delay = 0.0
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "injected": dict(self.injected),
+            "total_delay_seconds": round(self.total_delay, 3),
+        }
+
+
+class FaultInjectionMiddleware:
+    """
+    지연/장애 주입 ASGI 미들웨어
+
+    처리 순서: 지연 시간 대기 → stall(stall_seconds 동안 응답 없음) → 429 → 5xx → 정상 처리
+    """
+
+    def __init__(self, app, settings: MockSettings, stats: MockStats):
+        self.app = app
+        self.settings = settings
+        self.stats = stats
+        self.latency = LatencyModel(settings)
+        self.rng = random.Random(settings.seed + 1)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path.startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        settings = self.settings
+        family = endpoint_family(path)
+        self.stats.requests[family] += 1
+
+        delay = self.latency.sample(family)
+        if delay:
+            self.stats.total_delay += delay
+            await asyncio.sleep(delay)
+
+        roll = self.rng.random()
+        if roll < settings.stall_rate:
+            self.stats.injected["stall"] += 1
+            await asyncio.sleep(settings.stall_seconds)
+        roll -= settings.stall_rate
+
+        if roll < settings.error_rate_429:
+            self.stats.injected["429"] += 1
+            await self._error(send, 429, "Too Many Requests", {"Retry-After": f"{settings.retry_after_seconds:g}"})
+            return
+        roll -= settings.error_rate_429
+
+        if roll < settings.error_rate_5xx:
+            status = self.rng.choice(settings.error_statuses)
+            self.stats.injected[str(status)] += 1
+            await self._error(send, status, "Injected upstream failure")
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _error(send, status: int, title: str, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps({
+            "type": "https://ns.adobe.com/aep/errors/mock-injected",
+            "title": title,
+            "status": status,
+            "report": {"injectedAt": time.time()},
+        }).encode("utf-8")
+        raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        for name, value in (headers or {}).items():
+            raw_headers.append((name.lower().encode(), value.encode()))
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,58 @@
+"""
+Mock AEP 서버 설정
+MOCK_AEP_ 접두사 환경 변수로 지연 시간 분포, 장애 주입 비율, 생성 데이터 규모 지정
+"""
+from typing import Dict, List, Literal
+
+from pydantic_settings import BaseSettings
+
+
+class MockSettings(BaseSettings):
+    """Mock AEP 서버 설정 (실행 중에는 PATCH /__mock/config로 변경 가능)"""
+
+    host: str = "0.0.0.0"
+    port: int = 8080
+    tenant_id: str = "mocktenant"
+    seed: int = 42
+
+    # 응답 지연 (ms)
+    # - fixed: 항상 latency_ms
+    # - uniform: latency_ms ± latency_ms * latency_spread
+    # - normal: 평균 latency_ms, 표준편차 latency_ms * latency_spread
+    # - lognormal: 중앙값 latency_ms, sigma latency_spread (긴 꼬리 지연)
+    latency_distribution: Literal["none", "fixed", "uniform", "normal", "lognormal"] = "lognormal"
+    latency_ms: float = 40.0
+    latency_spread: float = 0.5
+    # API 계열별 지연 중앙값 덮어쓰기 (예: {"ups": 120})
+    family_latency_ms: Dict[str, float] = {}
+
+    # 장애 주입 (요청별 확률, 0~1)
+    error_rate_429: float = 0.0
+    retry_after_seconds: float = 1.0
+    error_rate_5xx: float = 0.0
+    error_statuses: List[int] = [500, 502, 503, 504]
+    stall_rate: float = 0.0
+    stall_seconds: float = 30.0
+
+    # 생성 데이터 규모
+    schemas: int = 250
+    classes: int = 40
+    field_groups: int = 300
+    data_types: int = 60
+    merge_policies: int = 20
+    segment_definitions: int = 500
+    segment_jobs: int = 200
+    audiences: int = 500
+    destinations: int = 30
+    dataflows: int = 50
+    runs_per_dataflow: int = 100
+    max_page_size: int = 100
+
+    # 세그먼트 작업 생성 후 완료까지 걸리는 시간 (초)
+    segment_job_duration: float = 20.0
+
+    class Config:
+        env_prefix = "MOCK_AEP_"
+
+
+mock_settings = MockSettings()
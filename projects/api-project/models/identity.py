@@ -61,3 +61,30 @@ class IdentityGraphRequest(BaseModel):
     
     class Config:
         populate_by_name = True
+
+
+class CompositeXid(BaseModel):
+    """Namespace ID + Identity 값 조합"""
+    nsid: int = Field(description="Namespace ID (숫자)")
+    id: str = Field(description="Identity 값")
+
+
+class IdentityClusterBatchRequest(BaseModel):
+    """Identity 클러스터 일괄 조회 요청"""
+    xids: Optional[List[str]] = Field(None, description="Experience Cloud ID 목록")
+    composite_xids: Optional[List[CompositeXid]] = Field(
+        None, alias="compositeXids", description="(nsid, id) 조합 목록"
+    )
+    graph_type: str = Field("Private Graph", alias="graph-type", description="그래프 유형")
+    
+    class Config:
+        populate_by_name = True
+        json_schema_extra = {
+            "example": {
+                "compositeXids": [
+                    {"nsid": 6, "id": "user@example.com"},
+                    {"nsid": 4, "id": "12345"}
+                ],
+                "graph-type": "Private Graph"
+            }
+        }
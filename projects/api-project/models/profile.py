@@ -71,3 +71,33 @@ class ProfileQueryRequest(BaseModel):
     
     class Config:
         populate_by_name = True
+
+
+class ProfileEntityRef(BaseModel):
+    """일괄 조회 대상 엔티티"""
+    entity_id: str = Field(alias="entityId", description="엔티티 ID")
+    entity_id_ns: str = Field(alias="entityIdNS", description="엔티티 ID Namespace")
+    
+    class Config:
+        populate_by_name = True
+
+
+class ProfileBatchRequest(BaseModel):
+    """프로필 일괄 조회 요청"""
+    schema_name: str = Field("_xdm.context.profile", alias="schema.name", description="스키마 이름")
+    merge_policy_id: Optional[str] = Field(None, alias="mergePolicyId", description="Merge Policy ID")
+    entities: List[ProfileEntityRef] = Field(min_length=1, description="조회할 엔티티 목록")
+    concurrency: Optional[int] = Field(None, ge=1, le=100, description="동시 요청 수 (기본값: 서버 설정)")
+    
+    class Config:
+        populate_by_name = True
+        json_schema_extra = {
+            "example": {
+                "schema.name": "_xdm.context.profile",
+                "entities": [
+                    {"entityId": "user@example.com", "entityIdNS": "Email"},
+                    {"entityId": "12345", "entityIdNS": "ECID"}
+                ],
+                "concurrency": 10
+            }
+        }
@@ -70,5 +70,8 @@ class FieldGroupModel(BaseModel):
 class SchemaListResponse(BaseModel):
     """스키마 목록 응답"""
     results: List[SchemaModel]
-    _page: Optional[Dict[str, Any]] = Field(None, description="페이지네이션 정보")
-    _links: Optional[Dict[str, Any]] = Field(None, description="링크 정보")
+    page: Optional[Dict[str, Any]] = Field(None, alias="_page", description="페이지네이션 정보")
+    links: Optional[Dict[str, Any]] = Field(None, alias="_links", description="링크 정보")
+    
+    class Config:
+        populate_by_name = True
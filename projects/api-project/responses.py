@@ -0,0 +1,159 @@
+"""
+공통 응답 헬퍼
+대용량 목록/업스트림 응답/SSE 스트리밍과 검증 방식별 빠른 JSON 응답 생성 함수
+"""
+import json
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (ORJSON_RESPONSES=false 또는 orjson 미설치 시 표준 json)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None or not settings.orjson_responses:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Any) -> TypeAdapter:
+    """모델 타입별 TypeAdapter (검증기/직렬화기 생성 비용은 타입당 한 번만)"""
+    return TypeAdapter(model)
+
+
+def validated_response(data: Any, model: Any) -> Any:
+    """
+    RESPONSE_VALIDATION 설정에 따라 목록 응답 생성
+
+    - full: data를 그대로 반환해 FastAPI response_model이 검증/직렬화
+    - adapter: 캐시된 TypeAdapter로 검증 후 pydantic-core에서 바로 JSON 바이트 생성
+    - trusted: 검증 없이 업스트림 데이터를 그대로 직렬화 (모델에 없는 필드도 포함)
+
+    Response 객체를 반환하면 FastAPI는 response_model 검증을 건너뛰며,
+    OpenAPI 문서에는 response_model이 그대로 표시됩니다.
+    """
+    mode = settings.response_validation
+    if mode == "trusted":
+        return FastJSONResponse(data)
+    if mode == "adapter":
+        adapter = type_adapter(model)
+        return Response(adapter.dump_json(adapter.validate_python(data), by_alias=True), media_type="application/json")
+    return data
+
+
+def _ndjson_line(item: Any) -> bytes:
+    return (json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+async def ndjson_response(items: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    비동기 이터레이터를 NDJSON(줄 단위 JSON) 스트리밍 응답으로 변환
+
+    첫 항목은 응답을 만들기 전에 미리 가져오므로, 첫 페이지 조회 실패는
+    호출한 라우터에서 일반 HTTP 오류로 처리할 수 있습니다.
+    스트리밍 도중 발생한 오류는 `{"error": ...}` 줄을 마지막에 기록하고 종료합니다.
+    """
+    iterator = items.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        return StreamingResponse(iter(()), media_type=NDJSON_MEDIA_TYPE)
+
+    async def body():
+        try:
+            yield _ndjson_line(first)
+            async for item in iterator:
+                yield _ndjson_line(item)
+        except Exception as e:
+            yield _ndjson_line({"error": str(e)})
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _sse_message(name: str, data: Any) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {name}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def sse_response(events: AsyncIterator[Optional[Tuple[str, Any]]]) -> StreamingResponse:
+    """
+    (이벤트 이름, 데이터) 이터레이터를 Server-Sent Events 스트리밍 응답으로 변환
+
+    None은 연결 유지용 주석(`: keepalive`)으로 전송합니다.
+    클라이언트 연결이 끊기면 이터레이터를 닫아 구독을 해제합니다.
+    """
+    async def body():
+        try:
+            async for event in events:
+                yield b": keepalive\n\n" if event is None else _sse_message(*event)
+        finally:
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return StreamingResponse(
+        body(),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 패스스루 시 그대로 전달하는 업스트림 응답 헤더
+PASSTHROUGH_HEADERS = ("etag", "last-modified", "cache-control", "x-request-id")
+
+
+def _accepts_encoding(request: Request, encoding: str) -> bool:
+    accepted = request.headers.get("accept-encoding", "")
+    return any(part.split(";")[0].strip() in (encoding, "*") for part in accepted.split(","))
+
+
+def upstream_response(request: Request, upstream: httpx.Response) -> StreamingResponse:
+    """
+    업스트림 응답을 파싱/재직렬화 없이 그대로 스트리밍 (상태 코드와 Content-Type 유지)
+
+    호출자가 업스트림의 압축 방식(gzip 등)을 받을 수 있으면 압축된 원본 바이트를 그대로 넘기고,
+    그렇지 않으면 청크 단위로 압축만 풀어 전달합니다. 전송이 끝나면 업스트림 연결을 반환합니다.
+    """
+    headers = {name: upstream.headers[name] for name in PASSTHROUGH_HEADERS if name in upstream.headers}
+    encoding = upstream.headers.get("content-encoding")
+    if encoding and _accepts_encoding(request, encoding):
+        headers["content-encoding"] = encoding
+        chunks = upstream.aiter_raw()
+    else:
+        chunks = upstream.aiter_bytes()
+
+    async def body():
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await upstream.aclose()
+
+    return StreamingResponse(
+        body(),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+        headers=headers,
+        background=BackgroundTask(upstream.aclose),
+    )
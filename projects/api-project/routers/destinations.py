@@ -2,17 +2,22 @@
 Destinations API 라우터
 데이터 활성화 대상 관리
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 from services.adobe_client import AdobeAPIClient
+from services.dataflow_monitor import DataflowRunMonitor
+from dependencies import get_adobe_client, get_dataflow_monitor
+from config import settings
+from responses import ndjson_response, sse_response, upstream_response
 
 router = APIRouter()
-client = AdobeAPIClient()
 
 
 @router.get("/destinations", summary="대상 목록 조회")
 async def list_destinations(
-    limit: int = Query(10, ge=1, le=100, description="조회할 대상 수")
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="조회할 대상 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     사용 가능한 모든 대상(Destination)을 조회합니다.
@@ -24,20 +29,42 @@ async def list_destinations(
     - **세그먼트 대상**: 세그먼트 기반 활성화
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_destinations(limit=limit, stream=True))
         destinations = await client.get_destinations(limit=limit)
         return destinations
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"대상 목록 조회 실패: {str(e)}")
 
 
+@router.get("/destinations/all", summary="전체 대상 스트리밍 조회")
+async def stream_all_destinations(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    사용 가능한 모든 대상(Destination)을 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_destinations(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"대상 전체 조회 실패: {str(e)}")
+
+
 @router.get("/destinations/{destination_id}", summary="특정 대상 조회")
-async def get_destination(destination_id: str):
+async def get_destination(request: Request, destination_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 대상의 상세 정보를 조회합니다.
     
     - **destination_id**: 대상 ID
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_destination(destination_id, stream=True))
         destination = await client.get_destination(destination_id)
         return destination
     except Exception as e:
@@ -46,7 +73,9 @@ async def get_destination(destination_id: str):
 
 @router.get("/dataflows", summary="데이터 플로우 목록 조회")
 async def list_dataflows(
-    limit: int = Query(10, ge=1, le=100, description="조회할 데이터 플로우 수")
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="조회할 데이터 플로우 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     활성 데이터 플로우 목록을 조회합니다.
@@ -54,20 +83,42 @@ async def list_dataflows(
     데이터 플로우는 AEP에서 대상으로 데이터를 전송하는 파이프라인입니다.
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_dataflows(limit=limit, stream=True))
         dataflows = await client.get_dataflows(limit=limit)
         return dataflows
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 플로우 목록 조회 실패: {str(e)}")
 
 
+@router.get("/dataflows/all", summary="전체 데이터 플로우 스트리밍 조회")
+async def stream_all_dataflows(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    모든 데이터 플로우를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_dataflows(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 플로우 전체 조회 실패: {str(e)}")
+
+
 @router.get("/dataflows/{dataflow_id}", summary="특정 데이터 플로우 조회")
-async def get_dataflow(dataflow_id: str):
+async def get_dataflow(request: Request, dataflow_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 데이터 플로우의 상세 정보를 조회합니다.
     
     - **dataflow_id**: 데이터 플로우 ID
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_dataflow(dataflow_id, stream=True))
         dataflow = await client.get_dataflow(dataflow_id)
         return dataflow
     except Exception as e:
@@ -76,8 +127,10 @@ async def get_dataflow(dataflow_id: str):
 
 @router.get("/dataflows/{dataflow_id}/runs", summary="데이터 플로우 실행 이력 조회")
 async def list_dataflow_runs(
+    request: Request,
     dataflow_id: str,
-    limit: int = Query(10, ge=1, le=100, description="조회할 실행 이력 수")
+    limit: int = Query(10, ge=1, le=100, description="조회할 실행 이력 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     특정 데이터 플로우의 실행 이력을 조회합니다.
@@ -86,14 +139,70 @@ async def list_dataflow_runs(
     - **limit**: 조회할 실행 이력 수
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_dataflow_runs(dataflow_id, limit=limit, stream=True))
         runs = await client.get_dataflow_runs(dataflow_id, limit=limit)
         return runs
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 플로우 실행 이력 조회 실패: {str(e)}")
 
 
+@router.get("/dataflows/{dataflow_id}/runs/all", summary="데이터 플로우 전체 실행 이력 스트리밍 조회")
+async def stream_all_dataflow_runs(
+    dataflow_id: str,
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    특정 데이터 플로우의 모든 실행 이력을 조회합니다.
+    
+    - **dataflow_id**: 데이터 플로우 ID
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_dataflow_runs(dataflow_id, page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 플로우 실행 이력 전체 조회 실패: {str(e)}")
+
+
+@router.get("/dataflow-runs/stats", summary="전체 데이터 플로우 실행 통계")
+async def get_dataflow_run_stats(monitor: DataflowRunMonitor = Depends(get_dataflow_monitor)):
+    """
+    모든 데이터 플로우의 실행 이력을 모아 플로우별 통계를 계산합니다.
+    
+    - **recordsPerSecond**: 완료된 실행의 입력 레코드 합계 / 소요 시간 합계
+    - **durationSeconds**: 실행 소요 시간 백분위수 (p50/p90/p99/max)
+    - **failureRate / recordFailureRate**: 실패한 실행 비율 / 실패한 레코드 비율
+    - **lagSeconds**: 마지막으로 성공한 실행이 끝난 뒤 지난 시간
+    
+    실행 이력은 실행 ID 기준으로 서버에 보관되며 새 실행과 진행 중이던 실행만 다시 조회합니다.
+    `DATAFLOW_MONITOR_INTERVAL` 이내에 수집한 결과가 있으면 업스트림을 호출하지 않습니다.
+    """
+    try:
+        return await monitor.snapshot()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 플로우 실행 통계 조회 실패: {str(e)}")
+
+
+@router.get("/dataflow-runs/events", summary="데이터 플로우 실행 통계 스트리밍 (SSE)")
+async def stream_dataflow_run_stats(monitor: DataflowRunMonitor = Depends(get_dataflow_monitor)):
+    """
+    데이터 플로우 실행 통계를 Server-Sent Events(`text/event-stream`)로 전달합니다.
+    
+    이벤트:
+    - `stats`: `/dataflow-runs/stats`와 같은 형식, 통계가 바뀔 때마다 (연결 직후 최신 통계 1회 포함)
+    - `error`: 수집 실패 (다음 주기에 다시 시도)
+    
+    구독자 수와 관계없이 서버는 하나의 수집 루프로만 업스트림을 조회합니다.
+    """
+    return sse_response(monitor.subscribe(heartbeat=settings.sse_heartbeat_interval))
+
+
 @router.get("/connection-specs", summary="연결 스펙 목록 조회")
-async def list_connection_specs():
+async def list_connection_specs(request: Request, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     사용 가능한 연결 스펙(Connection Spec) 목록을 조회합니다.
     
@@ -106,6 +215,8 @@ async def list_connection_specs():
     - Email Marketing Platforms
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_connection_specs(stream=True))
         specs = await client.get_connection_specs()
         return specs
     except Exception as e:
@@ -2,17 +2,41 @@
 Identity Service API 라우터
 Identity Namespace 및 Identity Graph 관리
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import List
-from models.identity import IdentityNamespace, IdentityGraphResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from models.identity import IdentityNamespace, IdentityGraphResponse, IdentityClusterBatchRequest
+from config import settings
 from services.adobe_client import AdobeAPIClient
+from services.namespace_registry import NamespaceRegistry
+from dependencies import get_adobe_client, get_namespace_registry
+from responses import validated_response
 
 router = APIRouter()
-client = AdobeAPIClient()
+
+
+async def normalize_namespace(namespace: Optional[str], registry: NamespaceRegistry) -> Optional[str]:
+    """
+    Namespace 코드(대소문자 무시) 또는 숫자 ID를 AEP에 등록된 코드로 변환
+    
+    레지스트리에 없는 값이면 400을 반환합니다.
+    Namespace 목록을 아직 불러오지 못한 경우에는 입력값을 그대로 넘깁니다.
+    """
+    if not namespace:
+        return namespace
+    resolved = await registry.resolve(namespace)
+    if resolved is not None:
+        return resolved.code
+    if not registry.loaded:
+        return namespace
+    raise HTTPException(status_code=400, detail=f"알 수 없는 Identity Namespace: {namespace}")
 
 
 @router.get("/namespaces", response_model=List[IdentityNamespace], summary="Identity Namespace 목록 조회")
-async def list_namespaces():
+async def list_namespaces(
+    id_type: Optional[str] = Query(None, alias="idType", description="ID 타입으로 필터링 (EMAIL, PHONE, COOKIE 등)"),
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    registry: NamespaceRegistry = Depends(get_namespace_registry)
+):
     """
     사용 가능한 모든 Identity Namespace를 조회합니다.
     
@@ -21,21 +45,40 @@ async def list_namespaces():
     - **Email**: 이메일 주소
     - **Phone**: 전화번호
     - **Custom**: 사용자 정의 Namespace
+    
+    - **idType**: 지정하면 Namespace 레지스트리의 idType 색인에서 바로 조회합니다.
     """
     try:
+        if id_type:
+            by_type = await registry.by_id_type(id_type)
+            if registry.loaded:
+                return by_type
         namespaces = await client.get_identity_namespaces()
-        return namespaces
+        if id_type:
+            namespaces = [ns for ns in namespaces if str(ns.get("idType", "")).upper() == id_type.upper()]
+        return validated_response(namespaces, List[IdentityNamespace])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Namespace 목록 조회 실패: {str(e)}")
 
 
 @router.get("/namespaces/{namespace_id}", response_model=IdentityNamespace, summary="특정 Namespace 조회")
-async def get_namespace(namespace_id: int):
+async def get_namespace(
+    namespace_id: int,
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    registry: NamespaceRegistry = Depends(get_namespace_registry)
+):
     """
     특정 Identity Namespace의 상세 정보를 조회합니다.
     
     - **namespace_id**: Namespace ID (숫자)
+    
+    Namespace 레지스트리에서 조회하며, 목록을 불러오지 못한 경우에만 업스트림을 호출합니다.
     """
+    namespace = await registry.get_by_id(namespace_id)
+    if namespace is not None:
+        return namespace
+    if registry.loaded:
+        raise HTTPException(status_code=404, detail=f"Namespace 조회 실패: {namespace_id}를 찾을 수 없습니다")
     try:
         namespace = await client.get_identity_namespace(namespace_id)
         return namespace
@@ -47,7 +90,9 @@ async def get_namespace(namespace_id: int):
 async def get_identity_graph(
     xid: str = Query(None, description="Experience Cloud ID"),
     namespace: str = Query(None, description="Identity Namespace 코드"),
-    identity_id: str = Query(None, alias="id", description="Identity 값")
+    identity_id: str = Query(None, alias="id", description="Identity 값"),
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    registry: NamespaceRegistry = Depends(get_namespace_registry)
 ):
     """
     특정 Identity와 연결된 Identity Graph를 조회합니다.
@@ -55,6 +100,7 @@ async def get_identity_graph(
     다음 중 하나의 조합으로 조회 가능:
     - **xid**: Experience Cloud ID만 사용
     - **namespace + identity_id**: Namespace 코드와 Identity 값 조합
+      (코드는 대소문자를 구분하지 않으며 숫자 Namespace ID도 사용 가능)
     
     예시:
     - `?xid=CJKdkdkdj8dkjKJS`
@@ -65,6 +111,8 @@ async def get_identity_graph(
             status_code=400,
             detail="xid 또는 (namespace + id) 조합이 필요합니다"
         )
+    if not xid:
+        namespace = await normalize_namespace(namespace, registry)
     
     try:
         graph = await client.get_identity_graph(
@@ -81,7 +129,9 @@ async def get_identity_graph(
 async def get_cluster_members(
     xid: str = Query(None, description="Experience Cloud ID"),
     namespace: str = Query(None, description="Identity Namespace 코드"),
-    identity_id: str = Query(None, alias="id", description="Identity 값")
+    identity_id: str = Query(None, alias="id", description="Identity 값"),
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    registry: NamespaceRegistry = Depends(get_namespace_registry)
 ):
     """
     Identity Cluster의 모든 멤버를 조회합니다.
@@ -91,6 +141,8 @@ async def get_cluster_members(
             status_code=400,
             detail="xid 또는 (namespace + id) 조합이 필요합니다"
         )
+    if not xid:
+        namespace = await normalize_namespace(namespace, registry)
     
     try:
         members = await client.get_cluster_members(
@@ -101,3 +153,46 @@ async def get_cluster_members(
         return members
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"클러스터 멤버 조회 실패: {str(e)}")
+
+
+@router.post("/cluster-members/batch", summary="클러스터 멤버 일괄 조회")
+async def get_cluster_members_batch(
+    request: IdentityClusterBatchRequest,
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    registry: NamespaceRegistry = Depends(get_namespace_registry)
+):
+    """
+    여러 Identity의 클러스터 멤버를 한 번에 조회합니다.
+    
+    - **xids**: Experience Cloud ID 목록
+    - **compositeXids**: Namespace ID(nsid) + Identity 값 조합 목록
+    
+    입력은 서비스의 호출당 최대 개수 단위로 나뉘어 동시에 조회된 뒤 하나의 응답으로 합쳐집니다.
+    일부 청크가 실패하면 `errors`에 기록되고 나머지 결과는 정상 반환됩니다.
+    """
+    total = len(request.xids or []) + len(request.composite_xids or [])
+    if total == 0:
+        raise HTTPException(status_code=400, detail="xids 또는 compositeXids가 필요합니다")
+    if total > settings.identity_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.identity_batch_max_items}개까지 조회할 수 있습니다"
+        )
+    unknown = []
+    for nsid in sorted({c.nsid for c in request.composite_xids or []}):
+        if await registry.get_by_id(nsid) is None:
+            unknown.append(nsid)
+    if unknown and registry.loaded:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 Namespace ID: {', '.join(map(str, unknown))}"
+        )
+    
+    try:
+        return await client.get_cluster_members_batch(
+            xids=request.xids,
+            composite_xids=[c.model_dump() for c in request.composite_xids or []],
+            graph_type=request.graph_type
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"클러스터 멤버 일괄 조회 실패: {str(e)}")
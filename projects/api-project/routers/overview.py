@@ -0,0 +1,108 @@
+"""
+Overview API 라우터
+대시보드용 주요 리소스 요약을 동시에 조회하여 한 번에 반환
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from services.adobe_client import AdobeAPIClient
+from dependencies import get_adobe_client
+from config import settings
+
+router = APIRouter()
+
+# 섹션 이름 → 조회 함수 (각 라우터의 기본 요청과 같은 파라미터를 사용해 응답 캐시를 공유)
+OVERVIEW_SECTIONS: Dict[str, Callable[[AdobeAPIClient, int], Awaitable[Any]]] = {
+    "schemas": lambda client, limit: client.get_schemas(limit=limit),
+    "classes": lambda client, limit: client.get_classes(limit=limit),
+    "namespaces": lambda client, limit: client.get_identity_namespaces(),
+    "merge_policies": lambda client, limit: client.get_merge_policies(limit=limit),
+    "segment_definitions": lambda client, limit: client.get_segment_definitions(limit=limit),
+    "segment_jobs": lambda client, limit: client.get_segment_jobs(limit=limit),
+    "destinations": lambda client, limit: client.get_destinations(limit=limit),
+    "dataflows": lambda client, limit: client.get_dataflows(limit=limit),
+}
+
+# 목록 응답에서 항목이 들어 있는 키
+ITEM_KEYS = ("results", "children", "segments", "items")
+
+
+def _count(data: Any) -> Optional[int]:
+    if isinstance(data, list):
+        return len(data)
+    if isinstance(data, dict):
+        for key in ITEM_KEYS:
+            if isinstance(data.get(key), list):
+                return len(data[key])
+    return None
+
+
+@router.get("/overview", summary="주요 리소스 요약 동시 조회")
+async def get_overview(
+    deadline: Optional[float] = Query(None, gt=0, le=60, description="전체 제한 시간 (초, 기본값 OVERVIEW_DEADLINE)"),
+    limit: int = Query(10, ge=1, le=100, description="섹션별 조회 수"),
+    sections: Optional[List[str]] = Query(None, description="조회할 섹션 (생략 시 전체)"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    스키마, 클래스, Namespace, Merge Policy, 세그먼트 정의/작업, 대상, 데이터 플로우를 동시에 조회합니다.
+
+    - **deadline**: 전체 제한 시간. 시간 안에 끝난 섹션만 결과에 포함되고 나머지는 취소됩니다.
+    - **limit**: 섹션별 조회 수
+    - **sections**: 조회할 섹션 목록 (예: `?sections=schemas&sections=dataflows`)
+
+    섹션별 `status`는 `ok`(성공), `error`(조회 실패), `timeout`(제한 시간 초과) 중 하나이며,
+    일부 섹션이 실패해도 응답은 200입니다. 전체 소요 시간은 각 호출 시간의 합이 아니라 가장 느린 호출 시간입니다.
+    """
+    names = sections or list(OVERVIEW_SECTIONS)
+    unknown = [name for name in names if name not in OVERVIEW_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 섹션: {', '.join(unknown)} (사용 가능: {', '.join(OVERVIEW_SECTIONS)})"
+        )
+    deadline = deadline or settings.overview_deadline
+
+    started = time.monotonic()
+    finished_at: Dict[str, float] = {}
+
+    async def run(name: str) -> Any:
+        try:
+            return await OVERVIEW_SECTIONS[name](client, limit)
+        finally:
+            finished_at[name] = time.monotonic()
+
+    tasks = {name: asyncio.create_task(run(name)) for name in dict.fromkeys(names)}
+    try:
+        await asyncio.wait(tasks.values(), timeout=deadline)
+        timed_out = {name for name, task in tasks.items() if not task.done()}
+    finally:
+        # 기한을 넘긴 섹션(또는 요청 자체가 취소된 경우 남은 섹션 전부)은 취소하고
+        # 정리(서킷 브레이커 시험 요청 반환 등)가 끝날 때까지 기다림
+        unfinished = [task for task in tasks.values() if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for name, task in tasks.items():
+        if name in timed_out:
+            result[name] = {"status": "timeout"}
+            continue
+        section: Dict[str, Any] = {"durationMs": round((finished_at[name] - started) * 1000, 1)}
+        error = task.exception()
+        if error is not None:
+            section.update(status="error", error=str(error) or type(error).__name__)
+        else:
+            data = task.result()
+            section.update(status="ok", count=_count(data), data=data)
+        result[name] = section
+
+    return {
+        "complete": all(section["status"] == "ok" for section in result.values()),
+        "deadline": deadline,
+        "elapsedMs": round((time.monotonic() - started) * 1000, 1),
+        "sections": result,
+    }
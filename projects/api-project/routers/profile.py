@@ -2,13 +2,15 @@
 Real-Time Customer Profile API 라우터
 프로필 조회 및 Merge Policy 관리
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
-from models.profile import ProfileEntity, MergePolicy
+from models.profile import ProfileEntity, MergePolicy, ProfileBatchRequest
+from config import settings
 from services.adobe_client import AdobeAPIClient
+from dependencies import get_adobe_client
+from responses import ndjson_response, upstream_response, validated_response
 
 router = APIRouter()
-client = AdobeAPIClient()
 
 
 @router.get("/entities", response_model=ProfileEntity, summary="프로필 조회")
@@ -16,7 +18,8 @@ async def get_profile_entity(
     schema_name: str = Query("_xdm.context.profile", alias="schema.name", description="스키마 이름"),
     entity_id: str = Query(..., alias="entityId", description="엔티티 ID"),
     entity_id_ns: str = Query(..., alias="entityIdNS", description="엔티티 ID Namespace"),
-    merge_policy_id: Optional[str] = Query(None, alias="mergePolicyId", description="Merge Policy ID")
+    merge_policy_id: Optional[str] = Query(None, alias="mergePolicyId", description="Merge Policy ID"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     특정 프로필의 통합된 뷰를 조회합니다.
@@ -42,9 +45,40 @@ async def get_profile_entity(
         raise HTTPException(status_code=404, detail=f"프로필 조회 실패: {str(e)}")
 
 
+@router.post("/entities/batch", summary="프로필 일괄 조회")
+async def get_profile_entities_batch(
+    request: ProfileBatchRequest,
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    여러 프로필을 한 번의 요청으로 조회합니다.
+    
+    - **entities**: (entityId, entityIdNS) 목록 (중복은 한 번만 조회)
+    - **concurrency**: 업스트림 동시 요청 수
+    
+    결과는 조회가 끝나는 순서대로 NDJSON으로 스트리밍되며,
+    각 줄의 `status`가 `ok`이면 `profile`, `error`이면 `error` 필드를 포함합니다.
+    일부 항목이 실패해도 나머지 결과는 계속 반환됩니다.
+    """
+    if len(request.entities) > settings.profile_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.profile_batch_max_items}개까지 조회할 수 있습니다"
+        )
+    
+    entities = [(ref.entity_id, ref.entity_id_ns) for ref in request.entities]
+    return await ndjson_response(client.iter_profile_entities(
+        entities,
+        schema_name=request.schema_name,
+        merge_policy_id=request.merge_policy_id,
+        concurrency=request.concurrency
+    ))
+
+
 @router.get("/merge-policies", response_model=List[MergePolicy], summary="Merge Policy 목록 조회")
 async def list_merge_policies(
-    limit: int = Query(10, ge=1, le=100, description="조회할 정책 수")
+    limit: int = Query(10, ge=1, le=100, description="조회할 정책 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     사용 가능한 모든 Merge Policy를 조회합니다.
@@ -57,13 +91,31 @@ async def list_merge_policies(
     """
     try:
         policies = await client.get_merge_policies(limit=limit)
-        return policies
+        return validated_response(policies, List[MergePolicy])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Merge Policy 목록 조회 실패: {str(e)}")
 
 
+@router.get("/merge-policies/all", summary="전체 Merge Policy 스트리밍 조회")
+async def stream_all_merge_policies(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    사용 가능한 모든 Merge Policy를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_merge_policies(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Merge Policy 전체 조회 실패: {str(e)}")
+
+
 @router.get("/merge-policies/{policy_id}", response_model=MergePolicy, summary="특정 Merge Policy 조회")
-async def get_merge_policy(policy_id: str):
+async def get_merge_policy(policy_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 Merge Policy의 상세 정보를 조회합니다.
     
@@ -78,7 +130,9 @@ async def get_merge_policy(policy_id: str):
 
 @router.get("/preview", summary="프로필 미리보기")
 async def preview_profiles(
-    limit: int = Query(10, ge=1, le=50, description="조회할 프로필 수")
+    request: Request,
+    limit: int = Query(10, ge=1, le=50, description="조회할 프로필 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     프로필 데이터를 미리보기합니다 (샘플링).
@@ -86,6 +140,8 @@ async def preview_profiles(
     실제 프로덕션 환경에서는 제한적으로 사용해야 합니다.
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.preview_profiles(limit=limit, stream=True))
         preview = await client.preview_profiles(limit=limit)
         return preview
     except Exception as e:
@@ -2,19 +2,21 @@
 Schema Registry API 라우터
 XDM 스키마, 클래스, 필드 그룹 관리
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from models.schema import SchemaModel, ClassModel, FieldGroupModel
 from services.adobe_client import AdobeAPIClient
+from dependencies import get_adobe_client
+from responses import ndjson_response, validated_response
 
 router = APIRouter()
-client = AdobeAPIClient()
 
 
 @router.get("/schemas", response_model=List[SchemaModel], summary="스키마 목록 조회")
 async def list_schemas(
     limit: int = Query(10, ge=1, le=100, description="조회할 스키마 수"),
-    offset: int = Query(0, ge=0, description="오프셋")
+    offset: int = Query(0, ge=0, description="오프셋"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     테넌트의 모든 XDM 스키마 목록을 조회합니다.
@@ -24,13 +26,31 @@ async def list_schemas(
     """
     try:
         schemas = await client.get_schemas(limit=limit, offset=offset)
-        return schemas
+        return validated_response(schemas, List[SchemaModel])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스키마 목록 조회 실패: {str(e)}")
 
 
+@router.get("/schemas/all", summary="전체 스키마 스트리밍 조회")
+async def stream_all_schemas(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    테넌트의 모든 XDM 스키마를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_schemas(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스키마 전체 조회 실패: {str(e)}")
+
+
 @router.get("/schemas/{schema_id}", response_model=SchemaModel, summary="특정 스키마 조회")
-async def get_schema(schema_id: str):
+async def get_schema(schema_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 스키마의 상세 정보를 조회합니다.
     
@@ -45,7 +65,8 @@ async def get_schema(schema_id: str):
 
 @router.get("/classes", response_model=List[ClassModel], summary="클래스 목록 조회")
 async def list_classes(
-    limit: int = Query(10, ge=1, le=100, description="조회할 클래스 수")
+    limit: int = Query(10, ge=1, le=100, description="조회할 클래스 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     사용 가능한 XDM 클래스 목록을 조회합니다.
@@ -56,15 +77,34 @@ async def list_classes(
     """
     try:
         classes = await client.get_classes(limit=limit)
-        return classes
+        return validated_response(classes, List[ClassModel])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"클래스 목록 조회 실패: {str(e)}")
 
 
+@router.get("/classes/all", summary="전체 클래스 스트리밍 조회")
+async def stream_all_classes(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    사용 가능한 모든 XDM 클래스를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_classes(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"클래스 전체 조회 실패: {str(e)}")
+
+
 @router.get("/fieldgroups", response_model=List[FieldGroupModel], summary="필드 그룹 목록 조회")
 async def list_field_groups(
     limit: int = Query(10, ge=1, le=100, description="조회할 필드 그룹 수"),
-    class_id: Optional[str] = Query(None, description="특정 클래스에 속한 필드 그룹만 조회")
+    class_id: Optional[str] = Query(None, description="특정 클래스에 속한 필드 그룹만 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     사용 가능한 필드 그룹 목록을 조회합니다.
@@ -73,14 +113,36 @@ async def list_field_groups(
     """
     try:
         field_groups = await client.get_field_groups(limit=limit, class_id=class_id)
-        return field_groups
+        return validated_response(field_groups, List[FieldGroupModel])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"필드 그룹 목록 조회 실패: {str(e)}")
 
 
+@router.get("/fieldgroups/all", summary="전체 필드 그룹 스트리밍 조회")
+async def stream_all_field_groups(
+    class_id: Optional[str] = Query(None, description="특정 클래스에 속한 필드 그룹만 조회"),
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    사용 가능한 모든 필드 그룹을 조회합니다.
+    
+    - **class_id**: 특정 클래스에 속한 필드 그룹만 필터링
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_field_groups(page_size=page_size, class_id=class_id, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"필드 그룹 전체 조회 실패: {str(e)}")
+
+
 @router.get("/datatypes", summary="데이터 타입 목록 조회")
 async def list_data_types(
-    limit: int = Query(10, ge=1, le=100, description="조회할 데이터 타입 수")
+    limit: int = Query(10, ge=1, le=100, description="조회할 데이터 타입 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     사용 가능한 데이터 타입 목록을 조회합니다.
@@ -90,3 +152,21 @@ async def list_data_types(
         return data_types
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 타입 목록 조회 실패: {str(e)}")
+
+
+@router.get("/datatypes/all", summary="전체 데이터 타입 스트리밍 조회")
+async def stream_all_data_types(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    사용 가능한 모든 데이터 타입을 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_data_types(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 타입 전체 조회 실패: {str(e)}")
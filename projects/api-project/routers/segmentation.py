@@ -2,18 +2,23 @@
 Segmentation API 라우터
 세그먼트 정의 및 작업 관리
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 from services.adobe_client import AdobeAPIClient
+from services.job_monitor import SegmentJobMonitor
+from dependencies import get_adobe_client, get_segment_job_monitor
+from config import settings
+from responses import ndjson_response, sse_response, upstream_response
 
 router = APIRouter()
-client = AdobeAPIClient()
 
 
 @router.get("/segment-definitions", summary="세그먼트 정의 목록 조회")
 async def list_segment_definitions(
+    request: Request,
     limit: int = Query(10, ge=1, le=100, description="조회할 세그먼트 수"),
-    page: int = Query(0, ge=0, description="페이지 번호")
+    page: int = Query(0, ge=0, description="페이지 번호"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     모든 세그먼트 정의를 조회합니다.
@@ -24,20 +29,42 @@ async def list_segment_definitions(
     - **page**: 페이지 번호
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_segment_definitions(limit=limit, page=page, stream=True))
         segments = await client.get_segment_definitions(limit=limit, page=page)
         return segments
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"세그먼트 정의 목록 조회 실패: {str(e)}")
 
 
+@router.get("/segment-definitions/all", summary="전체 세그먼트 정의 스트리밍 조회")
+async def stream_all_segment_definitions(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    모든 세그먼트 정의를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_segment_definitions(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세그먼트 정의 전체 조회 실패: {str(e)}")
+
+
 @router.get("/segment-definitions/{segment_id}", summary="특정 세그먼트 정의 조회")
-async def get_segment_definition(segment_id: str):
+async def get_segment_definition(request: Request, segment_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 세그먼트 정의의 상세 정보를 조회합니다.
     
     - **segment_id**: 세그먼트 정의 ID
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_segment_definition(segment_id, stream=True))
         segment = await client.get_segment_definition(segment_id)
         return segment
     except Exception as e:
@@ -46,8 +73,10 @@ async def get_segment_definition(segment_id: str):
 
 @router.get("/segment-jobs", summary="세그먼트 작업 목록 조회")
 async def list_segment_jobs(
+    request: Request,
     limit: int = Query(10, ge=1, le=100, description="조회할 작업 수"),
-    status: Optional[str] = Query(None, description="작업 상태 필터 (PROCESSING, SUCCEEDED, FAILED)")
+    status: Optional[str] = Query(None, description="작업 상태 필터 (PROCESSING, SUCCEEDED, FAILED)"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     세그먼트 평가 작업 목록을 조회합니다.
@@ -58,29 +87,74 @@ async def list_segment_jobs(
     - **status**: 작업 상태 필터
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_segment_jobs(limit=limit, status=status, stream=True))
         jobs = await client.get_segment_jobs(limit=limit, status=status)
         return jobs
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"세그먼트 작업 목록 조회 실패: {str(e)}")
 
 
+@router.get("/segment-jobs/all", summary="전체 세그먼트 작업 스트리밍 조회")
+async def stream_all_segment_jobs(
+    status: Optional[str] = Query(None, description="작업 상태 필터 (PROCESSING, SUCCEEDED, FAILED)"),
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    모든 세그먼트 평가 작업을 조회합니다.
+    
+    - **status**: 작업 상태 필터
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_segment_jobs(page_size=page_size, status=status, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세그먼트 작업 전체 조회 실패: {str(e)}")
+
+
 @router.get("/segment-jobs/{job_id}", summary="특정 세그먼트 작업 조회")
-async def get_segment_job(job_id: str):
+async def get_segment_job(request: Request, job_id: str, client: AdobeAPIClient = Depends(get_adobe_client)):
     """
     특정 세그먼트 작업의 상태를 조회합니다.
     
     - **job_id**: 세그먼트 작업 ID
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_segment_job(job_id, stream=True))
         job = await client.get_segment_job(job_id)
         return job
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"세그먼트 작업 조회 실패: {str(e)}")
 
 
+@router.get("/segment-jobs/{job_id}/events", summary="세그먼트 작업 진행 상황 스트리밍 (SSE)")
+async def stream_segment_job_events(job_id: str, monitor: SegmentJobMonitor = Depends(get_segment_job_monitor)):
+    """
+    세그먼트 작업의 상태 변경을 Server-Sent Events(`text/event-stream`)로 전달합니다.
+    
+    - **job_id**: 세그먼트 작업 ID
+    
+    이벤트:
+    - `status`: 작업 정보가 바뀔 때마다 전체 작업 정보 (연결 직후 최신 상태 1회 포함)
+    - `end`: SUCCEEDED/FAILED/CANCELLED 도달 시 최종 작업 정보, 이후 스트림 종료
+    - `error`: 조회 실패 (일시적 오류는 폴링을 계속하며, 작업이 없으면 스트림 종료)
+    
+    같은 작업을 여러 클라이언트가 구독해도 서버는 하나의 폴러로만 업스트림을 조회합니다.
+    """
+    poller = monitor.watch(job_id)
+    return sse_response(poller.broadcaster.subscribe(heartbeat=settings.sse_heartbeat_interval))
+
+
 @router.get("/audiences", summary="오디언스 목록 조회")
 async def list_audiences(
-    limit: int = Query(10, ge=1, le=100, description="조회할 오디언스 수")
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="조회할 오디언스 수"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
 ):
     """
     평가된 오디언스(세그먼트 결과) 목록을 조회합니다.
@@ -88,21 +162,50 @@ async def list_audiences(
     오디언스는 세그먼트 정의를 평가한 결과로 생성된 프로필 집합입니다.
     """
     try:
+        if settings.passthrough_streaming:
+            return upstream_response(request, await client.get_audiences(limit=limit, stream=True))
         audiences = await client.get_audiences(limit=limit)
         return audiences
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"오디언스 목록 조회 실패: {str(e)}")
 
 
+@router.get("/audiences/all", summary="전체 오디언스 스트리밍 조회")
+async def stream_all_audiences(
+    page_size: int = Query(100, ge=1, le=100, description="페이지당 조회 수"),
+    prefetch: bool = Query(True, description="현재 페이지 전송 중 다음 페이지 미리 조회"),
+    client: AdobeAPIClient = Depends(get_adobe_client)
+):
+    """
+    평가된 모든 오디언스를 조회합니다.
+    
+    모든 페이지를 따라가며 결과를 NDJSON(`application/x-ndjson`)으로 스트리밍합니다.
+    전체 목록을 메모리에 모으지 않으므로 대량 조회에 적합합니다.
+    """
+    try:
+        return await ndjson_response(client.iter_audiences(page_size=page_size, prefetch=prefetch))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"오디언스 전체 조회 실패: {str(e)}")
+
+
 @router.post("/segment-jobs", summary="세그먼트 작업 생성")
-async def create_segment_job(segment_ids: List[str]):
+async def create_segment_job(
+    segment_ids: List[str],
+    stream: bool = Query(False, description="생성 후 진행 상황을 SSE로 바로 스트리밍"),
+    client: AdobeAPIClient = Depends(get_adobe_client),
+    monitor: SegmentJobMonitor = Depends(get_segment_job_monitor)
+):
     """
     새로운 세그먼트 평가 작업을 생성합니다.
     
     - **segment_ids**: 평가할 세그먼트 ID 목록
+    - **stream**: true면 생성된 작업의 `/segment-jobs/{job_id}/events` 스트림을 바로 반환
     """
     try:
         job = await client.create_segment_job(segment_ids)
-        return job
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"세그먼트 작업 생성 실패: {str(e)}")
+    if stream and job.get("id"):
+        poller = monitor.watch(job["id"])
+        return sse_response(poller.broadcaster.subscribe(heartbeat=settings.sse_heartbeat_interval))
+    return job
@@ -2,39 +2,516 @@
 Adobe Experience Platform API 클라이언트
 비동기 HTTP 클라이언트를 사용한 AEP API 호출
 """
+import asyncio
+import contextlib
+import importlib.util
+import time
 import httpx
-from typing import List, Optional, Dict, Any
-from config import settings, get_aep_headers
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from config import settings
+from services.cache import CacheEntry, LRUResponseCache, ResponseCache
+from services.identity_cache import XID_NAMESPACE, IdentityClusterCache
+from services.singleflight import SingleFlight
+from services.concurrency import bounded_as_completed
+from services.token_manager import TokenManager
+from services.rate_limiter import RateLimiter, endpoint_family, parse_retry_after
+from services.metrics import UPSTREAM_IN_FLIGHT, UPSTREAM_REQUEST_DURATION, observe_upstream_response
+from services.resilience import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    RetryPolicy,
+    hedged,
+)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    공유 커넥션 풀 생성
+    
+    Keep-Alive 및 HTTP/2(h2 패키지 설치 시)를 사용하여
+    요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 합니다.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    timeout = httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout)
+    http2 = settings.http2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
 
 
 class AdobeAPIClient:
     """Adobe Experience Platform API 클라이언트"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         self.base_url = settings.platform_gateway
-        self.timeout = 30.0
+        self.timeout = settings.http_timeout
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        if cache is None and settings.cache_enabled:
+            cache = LRUResponseCache(
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes,
+            )
+        self.cache = cache
+        self.identity_cache = (
+            IdentityClusterCache(settings.identity_cache_ttl, settings.identity_cache_max_identities)
+            if settings.identity_cache_enabled else None
+        )
+        self.singleflight = SingleFlight() if settings.singleflight_enabled else None
+        self.rate_limiter = (
+            RateLimiter(settings.rate_limits, burst=settings.rate_limit_burst)
+            if settings.rate_limit_enabled else None
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=settings.retry_max_attempts if settings.retry_enabled else 1,
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay,
+        )
+        self.retry_budget = RetryBudget(settings.retry_budget_ratio, settings.retry_budget_min)
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.latency = LatencyTracker()
+        self.tokens = TokenManager(lambda: self.http_client)
     
-    async def _make_request(
+    async def start(self) -> None:
+        """커넥션 풀 초기화 및 Access Token 발급/자동 갱신 시작 (앱 시작 시 호출)"""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        await self.tokens.start()
+    
+    async def aclose(self) -> None:
+        """토큰 갱신 중지 및 커넥션 풀 종료 (앱 종료 시 호출)"""
+        await self.tokens.stop()
+        if self._http_client is not None and self._owns_http_client:
+            await self._http_client.aclose()
+        self._http_client = None
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (start() 전에 사용하면 지연 생성)"""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 수 제한용 세마포어"""
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.http_max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    def circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """호스트별 서킷 브레이커 (비활성화 시 None)"""
+        if not settings.circuit_breaker_enabled:
+            return None
+        host = httpx.URL(url).host
+        breaker = self._circuit_breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=settings.circuit_failure_threshold,
+                reset_timeout=settings.circuit_reset_timeout,
+            )
+            self._circuit_breakers[host] = breaker
+        return breaker
+    
+    async def _send(
         self,
         method: str,
-        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
         params: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """공통 HTTP 요청 메서드"""
-        url = f"{self.base_url}{endpoint}"
-        headers = get_aep_headers()
+        json_data: Optional[Dict[str, Any]] = None,
+        hedge: bool = False,
+        stream: bool = False
+    ) -> httpx.Response:
+        """
+        장애 대응 정책을 적용한 요청 전송 (상태 코드 검사는 호출자가 수행)
+        
+        stream=True면 본문을 읽지 않은 응답을 반환하므로 호출자가 aclose()해야 합니다.
+        
+        - 서킷이 열려 있으면 CircuitOpenError로 즉시 실패
+        - 멱등 요청의 5xx/네트워크 오류는 지수 백오프 + 지터로 재시도 (재시도 예산 범위 내)
+        - hedge=True이고 헤징이 켜져 있으면 p95 지연 후 동일 요청을 한 번 더 전송
+        - 401 응답이면 Access Token을 갱신하여 한 번만 다시 전송
+        """
+        breaker = self.circuit_breaker(url)
+        retryable = method in IDEMPOTENT_METHODS
+        path = httpx.URL(url).path
+        self.retry_budget.record_request()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.request(
+        async def send_once() -> httpx.Response:
+            return await self._send_once(method, url, headers, params, json_data, stream)
+        
+        attempt = 0
+        reauthenticated = False
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            started = time.monotonic()
+            try:
+                if hedge and retryable and not stream and settings.hedging_enabled:
+                    response = await hedged(send_once, self._hedge_delay(path))
+                else:
+                    response = await send_once()
+            except httpx.TransportError:
+                if breaker is not None:
+                    breaker.record_failure()
+                if not (retryable and self._should_retry(attempt)):
+                    raise
+            except BaseException:
+                # 취소되거나 예상하지 못한 예외로 끝나도 half_open 시험 요청 자리가 남지 않게 함
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if not (retryable and self._should_retry(attempt)):
+                        return response
+                    await response.aclose()
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    if response.status_code == 401 and self.tokens.can_refresh and not reauthenticated:
+                        reauthenticated = True
+                        await response.aclose()
+                        headers = await self.tokens.reauthenticate(headers)
+                        continue
+                    if hedge:
+                        self.latency.record(path, time.monotonic() - started)
+                    return response
+            await asyncio.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+    
+    def _should_retry(self, attempt: int) -> bool:
+        """남은 시도 횟수와 재시도 예산 확인"""
+        return attempt + 1 < self.retry_policy.max_attempts and self.retry_budget.try_spend()
+    
+    def _hedge_delay(self, path: str) -> float:
+        """헤징 지연: 최근 응답 시간의 p95 (표본 부족 시 기본값)"""
+        delay = self.latency.percentile(path, settings.hedge_percentile)
+        if delay is None:
+            return settings.hedge_default_delay
+        return max(settings.hedge_min_delay, delay)
+    
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """
+        공유 커넥션 풀로 요청 1회 전송
+        
+        속도 제한이 켜져 있으면 API 계열별 토큰 버킷에서 순서대로 대기한 뒤 전송하고,
+        429 응답은 Retry-After만큼 기다렸다가 rate_limit_max_retries 횟수까지 다시 시도합니다.
+        """
+        family = endpoint_family(httpx.URL(url).path)
+        bucket = self.rate_limiter.bucket(family) if self.rate_limiter else None
+        metrics = settings.metrics_enabled
+        in_flight = UPSTREAM_IN_FLIGHT.labels(family) if metrics else None
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await bucket.acquire()
+            request = self.http_client.build_request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
                 json=json_data
             )
+            async with self._host_semaphore(url):
+                if metrics:
+                    in_flight.inc()
+                try:
+                    response = await self.http_client.send(request, stream=stream)
+                except httpx.TransportError:
+                    if metrics:
+                        observe_upstream_response(family, method, "error", None)
+                    raise
+                finally:
+                    if metrics:
+                        in_flight.dec()
+            if metrics:
+                size = response.headers.get("content-length") if stream else len(response.content)
+                observe_upstream_response(family, method, response.status_code, int(size) if size is not None else None)
+            if bucket is None:
+                return response
+            if response.status_code == 429:
+                bucket.on_throttled(parse_retry_after(response.headers.get("Retry-After")))
+                if attempt < settings.rate_limit_max_retries:
+                    attempt += 1
+                    await response.aclose()
+                    continue
+            else:
+                bucket.on_success()
+            return response
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        hedge: bool = False,
+        stream: bool = False
+    ) -> Any:
+        """
+        공통 HTTP 요청 메서드
+        
+        - hedge=True면 GET 요청에 헤징 적용
+        - stream=True면 요청 병합을 거치지 않고 본문을 읽지 않은 httpx.Response를 그대로 반환
+          (상태 코드 검사 없음, 호출자가 aclose() 필요, 신선한 캐시 항목이 있으면 그 내용으로 만든 응답)
+        - 호출 시간은 API 계열별 aep_upstream_request_duration_seconds 메트릭으로 기록 (METRICS_ENABLED일 때)
+        """
+        url = f"{self.base_url}{endpoint}"
+        started = time.perf_counter()
+        try:
+            request_headers = await self.tokens.headers()
+            if headers:
+                request_headers = {**request_headers, **headers}
+            
+            if stream:
+                cached = await self._fresh_cache_entry(endpoint, params, request_headers) if method == "GET" else None
+                if cached is not None:
+                    return httpx.Response(200, json=cached.data, headers={"ETag": cached.etag} if cached.etag else None)
+                return await self._send(method, url, request_headers, params, json_data, stream=True)
+            if method == "GET":
+                return await self._get(url, endpoint, params, request_headers, hedge)
+            
+            response = await self._send(method, url, request_headers, params, json_data)
+            response.raise_for_status()
+            return response.json()
+        finally:
+            if settings.metrics_enabled:
+                UPSTREAM_REQUEST_DURATION.labels(endpoint_family(endpoint), method).observe(time.perf_counter() - started)
+    
+    async def _get(
+        self,
+        url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        hedge: bool = False
+    ) -> Dict[str, Any]:
+        """
+        GET 요청 처리
+        
+        신선한 캐시 항목이 있으면 바로 반환하고, 그렇지 않으면 동일 키의 진행 중 요청에
+        합류(singleflight)하여 업스트림 호출을 한 번만 수행합니다.
+        """
+        key = self._request_key(endpoint, params, headers)
+        ttl = self._cache_ttl(endpoint) if self.cache is not None else None
+        entry = await self._fresh_cache_entry(endpoint, params, headers, key) if ttl else None
+        if entry is not None:
+            return entry.data
+        
+        if self.singleflight is None:
+            return await self._fetch_get(url, key, params, headers, ttl, hedge)
+        return await self.singleflight.do(
+            key, lambda: self._fetch_get(url, key, params, headers, ttl, hedge)
+        )
+    
+    async def _fetch_get(
+        self,
+        url: str,
+        key: Tuple[Any, ...],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        ttl: Optional[float],
+        hedge: bool = False
+    ) -> Dict[str, Any]:
+        """업스트림 GET 호출 (캐시 대상이면 ETag 재검증 후 결과 저장)"""
+        if not ttl:
+            response = await self._send("GET", url, headers, params, hedge=hedge)
             response.raise_for_status()
             return response.json()
+        return await self._cached_fetch(url, key, params, headers, ttl)
+    
+    async def refresh(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        캐시 대상 GET 응답을 신선도와 관계없이 업스트림에서 다시 가져와 캐시 갱신
+        
+        기존 항목에 ETag가 있으면 재검증(304)만 수행합니다. 캐시 대상이 아니면 일반 GET과 같습니다.
+        """
+        ttl = self._cache_ttl(endpoint) if self.cache is not None else None
+        if not ttl:
+            return await self._make_request("GET", endpoint, params=params)
+        
+        url = f"{self.base_url}{endpoint}"
+        headers = await self.tokens.headers()
+        key = self._request_key(endpoint, params, headers)
+        if self.singleflight is None:
+            return await self._cached_fetch(url, key, params, headers, ttl)
+        return await self.singleflight.do(
+            key, lambda: self._cached_fetch(url, key, params, headers, ttl)
+        )
+    
+    # 응답 캐시
+    async def _fresh_cache_entry(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        key: Optional[Tuple[Any, ...]] = None
+    ) -> Optional[CacheEntry]:
+        """신선한 캐시 항목 (캐시 대상이 아니거나 없거나 만료되었으면 None)"""
+        if self.cache is None or not self._cache_ttl(endpoint):
+            return None
+        entry = await self.cache.get(key or self._request_key(endpoint, params, headers))
+        if entry is None or not entry.is_fresh():
+            return None
+        self.cache.stats.hits += 1
+        return entry
+    
+    def _cache_ttl(self, endpoint: str) -> Optional[float]:
+        """엔드포인트에 해당하는 TTL (가장 긴 prefix 기준, 없으면 캐시하지 않음)"""
+        matched = None
+        for prefix in settings.cache_ttls:
+            if endpoint.startswith(prefix) and (matched is None or len(prefix) > len(matched)):
+                matched = prefix
+        return settings.cache_ttls[matched] if matched is not None else None
+    
+    @staticmethod
+    def _request_key(
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str]
+    ) -> Tuple[Any, ...]:
+        """(sandbox, endpoint, params, Accept) 조합의 요청 키 (캐시 및 요청 병합에 사용)"""
+        param_items = tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+        return (headers.get("x-sandbox-name"), endpoint, param_items, headers.get("Accept"))
+    
+    async def _cached_fetch(
+        self,
+        url: str,
+        key: Tuple[Any, ...],
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        ttl: float
+    ) -> Dict[str, Any]:
+        """
+        캐시 항목 갱신용 업스트림 호출
+        
+        만료된 항목에 ETag가 있으면 If-None-Match로 재검증하고,
+        304 응답이면 본문을 다시 받지 않고 기존 항목의 TTL만 연장합니다.
+        """
+        entry = await self.cache.get(key)
+        if entry is not None and entry.etag:
+            headers = {**headers, "If-None-Match": entry.etag}
+        response = await self._send("GET", url, headers, params)
+        
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats.revalidations += 1
+            entry.expires_at = time.monotonic() + ttl
+            await self.cache.set(key, entry)
+            return entry.data
+        
+        self.cache.stats.misses += 1
+        response.raise_for_status()
+        data = response.json()
+        await self.cache.set(key, CacheEntry(
+            data=data,
+            etag=response.headers.get("ETag"),
+            expires_at=time.monotonic() + ttl,
+            size=len(response.content),
+        ))
+        return data
+    
+    # 페이지네이션
+    async def _paginate(
+        self,
+        endpoint: str,
+        items_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        목록 엔드포인트의 모든 페이지를 순회하며 항목을 하나씩 반환
+        
+        prefetch=True이면 현재 페이지를 소비하는 동안 다음 페이지를 미리 요청합니다.
+        순회를 중간에 멈추면 진행 중인 prefetch 요청은 취소됩니다.
+        """
+        params = dict(params or {})
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._make_request("GET", endpoint, params=params)
+        )
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                next_params = self._next_page_params(page, params)
+                if next_params is not None and prefetch:
+                    pending = asyncio.ensure_future(
+                        self._make_request("GET", endpoint, params=next_params)
+                    )
+                for item in (page.get(items_key) or []) if isinstance(page, dict) else []:
+                    yield item
+                if next_params is not None and not prefetch:
+                    pending = asyncio.ensure_future(
+                        self._make_request("GET", endpoint, params=next_params)
+                    )
+                params = next_params
+        finally:
+            if pending is not None:
+                if not pending.done():
+                    pending.cancel()
+                # 취소된 요청은 정리가 끝날 때까지 기다리고, 이미 실패한 요청은 예외를 회수하여
+                # "Task exception was never retrieved" 경고를 막음
+                with contextlib.suppress(BaseException):
+                    await pending
+    
+    @staticmethod
+    def _next_page_params(page: Any, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        응답의 페이지 정보로 다음 페이지 요청 파라미터 계산 (마지막 페이지면 None)
+        
+        - Schema Registry / Segment Jobs: `_page.next` → `start`
+        - Flow Service 등: `_links.next.href` / `link.next`의 쿼리(continuationToken 등) 병합
+        - Segment Definitions: `page.totalPages` 기준으로 `page` 증가
+        """
+        if not isinstance(page, dict):
+            return None
+        
+        page_info = page.get("_page") or {}
+        if page_info.get("next"):
+            next_params = {**params, "start": page_info["next"]}
+            return next_params if next_params != params else None
+        
+        links = page.get("_links") or page.get("link") or {}
+        href = links.get("next")
+        if isinstance(href, dict):
+            href = href.get("href")
+        if href:
+            query = dict(parse_qsl(urlsplit(href).query))
+            next_params = {**params, **query}
+            return next_params if next_params != params else None
+        
+        paging = page.get("page")
+        if isinstance(paging, dict) and "page" in params:
+            current = int(params["page"])
+            if current + 1 < int(paging.get("totalPages") or 0):
+                return {**params, "page": current + 1}
+        return None
     
     # Schema Registry API
     async def get_schemas(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
@@ -43,6 +520,13 @@ class AdobeAPIClient:
         result = await self._make_request("GET", "/data/foundation/schemaregistry/tenant/schemas", params=params)
         return result.get("results", [])
     
+    def iter_schemas(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 스키마 순회 (페이지 자동 추적)"""
+        return self._paginate(
+            "/data/foundation/schemaregistry/tenant/schemas", "results",
+            params={"limit": page_size}, prefetch=prefetch
+        )
+    
     async def get_schema(self, schema_id: str) -> Dict[str, Any]:
         """특정 스키마 조회"""
         return await self._make_request("GET", f"/data/foundation/schemaregistry/tenant/schemas/{schema_id}")
@@ -53,6 +537,13 @@ class AdobeAPIClient:
         result = await self._make_request("GET", "/data/foundation/schemaregistry/global/classes", params=params)
         return result.get("results", [])
     
+    def iter_classes(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 클래스 순회"""
+        return self._paginate(
+            "/data/foundation/schemaregistry/global/classes", "results",
+            params={"limit": page_size}, prefetch=prefetch
+        )
+    
     async def get_field_groups(self, limit: int = 10, class_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """필드 그룹 목록 조회"""
         params = {"limit": limit}
@@ -61,12 +552,34 @@ class AdobeAPIClient:
         result = await self._make_request("GET", "/data/foundation/schemaregistry/global/fieldgroups", params=params)
         return result.get("results", [])
     
+    def iter_field_groups(
+        self,
+        page_size: int = 100,
+        class_id: Optional[str] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """전체 필드 그룹 순회"""
+        params = {"limit": page_size}
+        if class_id:
+            params["property"] = f"meta:intendedToExtend=={class_id}"
+        return self._paginate(
+            "/data/foundation/schemaregistry/global/fieldgroups", "results",
+            params=params, prefetch=prefetch
+        )
+    
     async def get_data_types(self, limit: int = 10) -> List[Dict[str, Any]]:
         """데이터 타입 목록 조회"""
         params = {"limit": limit}
         result = await self._make_request("GET", "/data/foundation/schemaregistry/global/datatypes", params=params)
         return result.get("results", [])
     
+    def iter_data_types(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 데이터 타입 순회"""
+        return self._paginate(
+            "/data/foundation/schemaregistry/global/datatypes", "results",
+            params={"limit": page_size}, prefetch=prefetch
+        )
+    
     # Identity Service API
     async def get_identity_namespaces(self) -> List[Dict[str, Any]]:
         """Identity Namespace 목록 조회"""
@@ -82,14 +595,27 @@ class AdobeAPIClient:
         namespace: Optional[str] = None,
         identity_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Identity Graph 조회"""
+        """
+        Identity Graph 조회
+        
+        identity_cache가 있으면 같은 클러스터의 어느 멤버로 조회하든 TTL 동안 로컬에서 응답합니다.
+        """
+        cache = self.identity_cache
+        if cache is not None:
+            cached = cache.get_xid(xid) if xid else cache.get(namespace, identity_id)
+            if cached is not None:
+                return cached
+        
         params = {}
         if xid:
             params["xid"] = xid
         else:
             params["namespace"] = namespace
             params["nsid"] = identity_id
-        return await self._make_request("GET", "/data/core/identity/cluster/members", params=params)
+        graph = await self._make_request("GET", "/data/core/identity/cluster/members", params=params, hedge=True)
+        if cache is not None and isinstance(graph, dict):
+            cache.put(graph, (XID_NAMESPACE, xid) if xid else (namespace, identity_id))
+        return graph
     
     async def get_cluster_members(
         self,
@@ -100,6 +626,56 @@ class AdobeAPIClient:
         """클러스터 멤버 조회"""
         return await self.get_identity_graph(xid, namespace, identity_id)
     
+    async def get_cluster_members_batch(
+        self,
+        xids: Optional[List[str]] = None,
+        composite_xids: Optional[List[Dict[str, Any]]] = None,
+        graph_type: str = "Private Graph",
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 Identity의 클러스터 멤버 일괄 조회
+        
+        입력을 중복 제거한 뒤 서비스의 호출당 최대 개수(chunk_size) 단위로 나누어
+        동시에 호출하고, 결과를 입력 순서대로 합쳐 반환합니다.
+        실패한 청크는 errors에 기록되며 나머지 결과는 그대로 반환됩니다.
+        """
+        chunk_size = chunk_size or settings.identity_batch_chunk_size
+        bodies: List[Dict[str, Any]] = []
+        if xids:
+            unique_xids = list(dict.fromkeys(xids))
+            for i in range(0, len(unique_xids), chunk_size):
+                bodies.append({"xids": unique_xids[i:i + chunk_size], "graph-type": graph_type})
+        if composite_xids:
+            unique_composites = list({(c["nsid"], c["id"]): c for c in composite_xids}.values())
+            for i in range(0, len(unique_composites), chunk_size):
+                bodies.append({"compositeXids": unique_composites[i:i + chunk_size], "graph-type": graph_type})
+        
+        async def fetch(index: int) -> Dict[str, Any]:
+            return await self._make_request(
+                "POST", "/data/core/identity/clusters/members",
+                json_data=bodies[index], headers={"x-uis-cst-ctx": "stub"}
+            )
+        
+        chunk_results: List[List[Dict[str, Any]]] = [[] for _ in bodies]
+        errors: List[Dict[str, Any]] = []
+        results = bounded_as_completed(
+            range(len(bodies)), fetch, concurrency or settings.identity_batch_concurrency
+        )
+        async for index, result, error in results:
+            if error is None:
+                chunk_results[index] = result.get("response", [])
+            else:
+                ids = bodies[index].get("xids") or bodies[index].get("compositeXids")
+                errors.append({"chunk": index, "size": len(ids), "error": str(error)})
+        
+        return {
+            "response": [member for chunk in chunk_results for member in chunk],
+            "chunks": len(bodies),
+            "errors": errors,
+        }
+    
     # Profile API
     async def get_profile_entity(
         self,
@@ -116,7 +692,37 @@ class AdobeAPIClient:
         }
         if merge_policy_id:
             params["mergePolicyId"] = merge_policy_id
-        return await self._make_request("GET", "/data/core/ups/access/entities", params=params)
+        return await self._make_request("GET", "/data/core/ups/access/entities", params=params, hedge=True)
+    
+    async def iter_profile_entities(
+        self,
+        entities: List[Tuple[str, str]],
+        schema_name: str = "_xdm.context.profile",
+        merge_policy_id: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        여러 프로필 엔티티를 동시 조회하여 완료 순서대로 반환
+        
+        (entity_id, entity_id_ns) 중복은 한 번만 조회하며, 항목별 실패는
+        status="error" 결과로 반환하고 나머지 조회는 계속 진행합니다.
+        """
+        unique = list(dict.fromkeys(entities))
+        
+        async def fetch(ref: Tuple[str, str]) -> Dict[str, Any]:
+            entity_id, entity_id_ns = ref
+            return await self.get_profile_entity(schema_name, entity_id, entity_id_ns, merge_policy_id)
+        
+        results = bounded_as_completed(unique, fetch, concurrency or settings.profile_batch_concurrency)
+        async for (entity_id, entity_id_ns), profile, error in results:
+            item: Dict[str, Any] = {"entityId": entity_id, "entityIdNS": entity_id_ns}
+            if error is None:
+                item.update(status="ok", profile=profile)
+            else:
+                item.update(status="error", error=str(error))
+                if isinstance(error, httpx.HTTPStatusError):
+                    item["statusCode"] = error.response.status_code
+            yield item
     
     async def get_merge_policies(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Merge Policy 목록 조회"""
@@ -124,40 +730,76 @@ class AdobeAPIClient:
         result = await self._make_request("GET", "/data/core/ups/config/mergePolicies", params=params)
         return result.get("children", [])
     
+    def iter_merge_policies(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 Merge Policy 순회"""
+        return self._paginate(
+            "/data/core/ups/config/mergePolicies", "children",
+            params={"limit": page_size}, prefetch=prefetch
+        )
+    
     async def get_merge_policy(self, policy_id: str) -> Dict[str, Any]:
         """특정 Merge Policy 조회"""
         return await self._make_request("GET", f"/data/core/ups/config/mergePolicies/{policy_id}")
     
-    async def preview_profiles(self, limit: int = 10) -> Dict[str, Any]:
-        """프로필 미리보기"""
+    async def preview_profiles(self, limit: int = 10, stream: bool = False) -> Any:
+        """프로필 미리보기 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit}
-        return await self._make_request("GET", "/data/core/ups/preview", params=params)
+        return await self._make_request("GET", "/data/core/ups/preview", params=params, stream=stream)
     
     # Segmentation API
-    async def get_segment_definitions(self, limit: int = 10, page: int = 0) -> Dict[str, Any]:
-        """세그먼트 정의 목록 조회"""
+    async def get_segment_definitions(self, limit: int = 10, page: int = 0, stream: bool = False) -> Any:
+        """세그먼트 정의 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit, "page": page}
-        return await self._make_request("GET", "/data/core/ups/segment/definitions", params=params)
+        return await self._make_request("GET", "/data/core/ups/segment/definitions", params=params, stream=stream)
+    
+    def iter_segment_definitions(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 세그먼트 정의 순회"""
+        return self._paginate(
+            "/data/core/ups/segment/definitions", "segments",
+            params={"limit": page_size, "page": 0}, prefetch=prefetch
+        )
     
-    async def get_segment_definition(self, segment_id: str) -> Dict[str, Any]:
-        """특정 세그먼트 정의 조회"""
-        return await self._make_request("GET", f"/data/core/ups/segment/definitions/{segment_id}")
+    async def get_segment_definition(self, segment_id: str, stream: bool = False) -> Any:
+        """특정 세그먼트 정의 조회 (stream=True면 업스트림 응답 그대로 반환)"""
+        return await self._make_request("GET", f"/data/core/ups/segment/definitions/{segment_id}", stream=stream)
     
-    async def get_segment_jobs(self, limit: int = 10, status: Optional[str] = None) -> Dict[str, Any]:
-        """세그먼트 작업 목록 조회"""
+    async def get_segment_jobs(self, limit: int = 10, status: Optional[str] = None, stream: bool = False) -> Any:
+        """세그먼트 작업 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit}
         if status:
             params["status"] = status
-        return await self._make_request("GET", "/data/core/ups/segment/jobs", params=params)
+        return await self._make_request("GET", "/data/core/ups/segment/jobs", params=params, stream=stream)
     
-    async def get_segment_job(self, job_id: str) -> Dict[str, Any]:
-        """특정 세그먼트 작업 조회"""
-        return await self._make_request("GET", f"/data/core/ups/segment/jobs/{job_id}")
+    def iter_segment_jobs(
+        self,
+        page_size: int = 100,
+        status: Optional[str] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """전체 세그먼트 작업 순회"""
+        params = {"limit": page_size}
+        if status:
+            params["status"] = status
+        return self._paginate(
+            "/data/core/ups/segment/jobs", "children",
+            params=params, prefetch=prefetch
+        )
     
-    async def get_audiences(self, limit: int = 10) -> Dict[str, Any]:
-        """오디언스 목록 조회"""
+    async def get_segment_job(self, job_id: str, stream: bool = False) -> Any:
+        """특정 세그먼트 작업 조회 (stream=True면 업스트림 응답 그대로 반환)"""
+        return await self._make_request("GET", f"/data/core/ups/segment/jobs/{job_id}", stream=stream)
+    
+    async def get_audiences(self, limit: int = 10, stream: bool = False) -> Any:
+        """오디언스 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit}
-        return await self._make_request("GET", "/data/core/ups/audiences", params=params)
+        return await self._make_request("GET", "/data/core/ups/audiences", params=params, stream=stream)
+    
+    def iter_audiences(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 오디언스 순회"""
+        return self._paginate(
+            "/data/core/ups/audiences", "children",
+            params={"limit": page_size}, prefetch=prefetch
+        )
     
     async def create_segment_job(self, segment_ids: List[str]) -> Dict[str, Any]:
         """세그먼트 작업 생성"""
@@ -165,29 +807,56 @@ class AdobeAPIClient:
         return await self._make_request("POST", "/data/core/ups/segment/jobs", json_data=json_data)
     
     # Destinations API
-    async def get_destinations(self, limit: int = 10) -> Dict[str, Any]:
-        """대상 목록 조회"""
+    async def get_destinations(self, limit: int = 10, stream: bool = False) -> Any:
+        """대상 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit}
-        return await self._make_request("GET", "/data/foundation/flowservice/destinations", params=params)
+        return await self._make_request("GET", "/data/foundation/flowservice/destinations", params=params, stream=stream)
+    
+    def iter_destinations(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 대상 순회"""
+        return self._paginate(
+            "/data/foundation/flowservice/destinations", "items",
+            params={"limit": page_size}, prefetch=prefetch
+        )
     
-    async def get_destination(self, destination_id: str) -> Dict[str, Any]:
-        """특정 대상 조회"""
-        return await self._make_request("GET", f"/data/foundation/flowservice/destinations/{destination_id}")
+    async def get_destination(self, destination_id: str, stream: bool = False) -> Any:
+        """특정 대상 조회 (stream=True면 업스트림 응답 그대로 반환)"""
+        return await self._make_request("GET", f"/data/foundation/flowservice/destinations/{destination_id}", stream=stream)
     
-    async def get_dataflows(self, limit: int = 10) -> Dict[str, Any]:
-        """데이터 플로우 목록 조회"""
+    async def get_dataflows(self, limit: int = 10, stream: bool = False) -> Any:
+        """데이터 플로우 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"limit": limit}
-        return await self._make_request("GET", "/data/foundation/flowservice/flows", params=params)
+        return await self._make_request("GET", "/data/foundation/flowservice/flows", params=params, stream=stream)
     
-    async def get_dataflow(self, dataflow_id: str) -> Dict[str, Any]:
-        """특정 데이터 플로우 조회"""
-        return await self._make_request("GET", f"/data/foundation/flowservice/flows/{dataflow_id}")
+    def iter_dataflows(self, page_size: int = 100, prefetch: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """전체 데이터 플로우 순회"""
+        return self._paginate(
+            "/data/foundation/flowservice/flows", "items",
+            params={"limit": page_size}, prefetch=prefetch
+        )
     
-    async def get_dataflow_runs(self, dataflow_id: str, limit: int = 10) -> Dict[str, Any]:
-        """데이터 플로우 실행 이력 조회"""
+    async def get_dataflow(self, dataflow_id: str, stream: bool = False) -> Any:
+        """특정 데이터 플로우 조회 (stream=True면 업스트림 응답 그대로 반환)"""
+        return await self._make_request("GET", f"/data/foundation/flowservice/flows/{dataflow_id}", stream=stream)
+    
+    async def get_dataflow_runs(self, dataflow_id: str, limit: int = 10, stream: bool = False) -> Any:
+        """데이터 플로우 실행 이력 조회 (stream=True면 업스트림 응답 그대로 반환)"""
         params = {"property": f"flowId=={dataflow_id}", "limit": limit}
-        return await self._make_request("GET", "/data/foundation/flowservice/runs", params=params)
+        return await self._make_request("GET", "/data/foundation/flowservice/runs", params=params, stream=stream)
+    
+    def iter_dataflow_runs(
+        self,
+        dataflow_id: str,
+        page_size: int = 100,
+        prefetch: bool = True,
+        orderby: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """특정 데이터 플로우의 전체 실행 이력 순회 (orderby 예: `-createdAt`는 최신순)"""
+        params = {"property": f"flowId=={dataflow_id}", "limit": page_size}
+        if orderby:
+            params["orderby"] = orderby
+        return self._paginate("/data/foundation/flowservice/runs", "items", params=params, prefetch=prefetch)
     
-    async def get_connection_specs(self) -> Dict[str, Any]:
-        """연결 스펙 목록 조회"""
-        return await self._make_request("GET", "/data/foundation/flowservice/connectionSpecs")
+    async def get_connection_specs(self, stream: bool = False) -> Any:
+        """연결 스펙 목록 조회 (stream=True면 업스트림 응답 그대로 반환)"""
+        return await self._make_request("GET", "/data/foundation/flowservice/connectionSpecs", stream=stream)
@@ -0,0 +1,73 @@
+"""
+이벤트 브로드캐스트
+하나의 서버 측 작업(폴링 등)에서 나온 이벤트를 여러 구독자에게 전달
+"""
+import asyncio
+from typing import Any, AsyncIterator, Optional, Set, Tuple
+
+# (이벤트 이름, 데이터)
+Event = Tuple[str, Any]
+
+_CLOSED = object()
+
+
+class Broadcaster:
+    """
+    최신 상태 중심의 이벤트 팬아웃
+
+    - 새 구독자는 마지막으로 발행된 이벤트를 즉시 받습니다.
+    - 구독자별 대기열이 가득 차면 가장 오래된 이벤트를 버리므로, 느린 구독자가
+      발행자를 막지 않고 중간 상태만 건너뜁니다.
+    - close() 이후 구독자는 남은 이벤트를 받은 뒤 종료됩니다.
+    """
+
+    def __init__(self, queue_size: int = 16):
+        self.queue_size = queue_size
+        self.latest: Optional[Event] = None
+        self.closed = False
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, name: str, data: Any) -> None:
+        self.latest = (name, data)
+        for queue in self._subscribers:
+            self._put(queue, self.latest)
+
+    def close(self) -> None:
+        self.closed = True
+        for queue in self._subscribers:
+            self._put(queue, _CLOSED)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, item: Any) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    async def subscribe(self, heartbeat: Optional[float] = None) -> AsyncIterator[Optional[Event]]:
+        """
+        이벤트 구독
+
+        heartbeat초 동안 이벤트가 없으면 None을 반환하여 호출자가 연결 유지 신호를 보낼 수 있게 합니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if self.latest is not None:
+            queue.put_nowait(self.latest)
+        if self.closed:
+            self._put(queue, _CLOSED)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if item is _CLOSED:
+                    return
+                yield item
+        finally:
+            self._subscribers.discard(queue)
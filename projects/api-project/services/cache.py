@@ -0,0 +1,134 @@
+"""
+AEP API 응답 캐시
+TTL + LRU 기반 인메모리 캐시 (ETag 재검증 지원)
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class CacheEntry:
+    """캐시 항목 (파싱된 응답, ETag, 만료 시각, 본문 크기)"""
+
+    __slots__ = ("data", "etag", "expires_at", "size")
+
+    def __init__(self, data: Any, etag: Optional[str], expires_at: float, size: int):
+        self.data = data
+        self.etag = etag
+        self.expires_at = expires_at
+        self.size = size
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """TTL 이내인지 여부"""
+        return (now if now is not None else time.monotonic()) < self.expires_at
+
+
+class CacheStats:
+    """캐시 사용 통계 (용량 산정용)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
+
+
+class ResponseCache:
+    """
+    응답 캐시 인터페이스
+
+    AdobeAPIClient는 이 인터페이스만 사용하므로 Redis 등 외부 저장소 구현으로 교체할 수 있습니다.
+    반환되는 data는 여러 요청이 공유하므로 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """항목 조회 (만료된 항목도 재검증용으로 반환)"""
+        raise NotImplementedError
+
+    async def set(self, key: Hashable, entry: CacheEntry) -> None:
+        """항목 저장"""
+        raise NotImplementedError
+
+    async def delete(self, key: Hashable) -> None:
+        """항목 삭제"""
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """전체 삭제"""
+        raise NotImplementedError
+
+    def info(self) -> Dict[str, Any]:
+        """통계 및 사용량"""
+        return self.stats.as_dict()
+
+
+class LRUResponseCache(ResponseCache):
+    """
+    인메모리 LRU 캐시
+
+    항목 수와 응답 본문 바이트 합계 두 가지 기준으로 크기를 제한하며,
+    한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    async def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: Hashable, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            # 한도보다 큰 응답은 캐시하지 않음
+            await self.delete(key)
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous.size
+        self._entries[key] = entry
+        self.current_bytes += entry.size
+        self._evict()
+
+    async def delete(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def _evict(self) -> None:
+        """한도를 초과한 만큼 LRU 항목 제거"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self.current_bytes -= entry.size
+            self.stats.evictions += 1
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,50 @@
+"""
+동시 실행 헬퍼
+동시 실행 수를 제한한 fan-out과 완료 순서대로 결과 수집
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_as_completed(
+    items: Iterable[T],
+    fn: Callable[[T], Awaitable[R]],
+    concurrency: int
+) -> AsyncIterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """
+    items 각각에 fn을 최대 concurrency개까지 동시에 실행하고 완료되는 순서대로 반환
+
+    (item, 결과, 예외) 튜플을 반환하며, 한 항목의 실패가 나머지 처리를 중단시키지 않습니다.
+    워커 수만큼만 Task를 만들기 때문에 입력이 많아도 메모리 사용량이 일정합니다.
+    순회를 중간에 멈추면 실행 중인 워커는 취소됩니다.
+    """
+    source = iter(items)
+    results: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, concurrency) * 2)
+    done_marker = object()
+
+    async def worker():
+        for item in source:
+            try:
+                result = await fn(item)
+            except Exception as e:
+                await results.put((item, None, e))
+            else:
+                await results.put((item, result, None))
+        await results.put(done_marker)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+    remaining = len(workers)
+    try:
+        while remaining:
+            entry = await results.get()
+            if entry is done_marker:
+                remaining -= 1
+                continue
+            yield entry
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
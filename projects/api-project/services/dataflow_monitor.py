@@ -0,0 +1,265 @@
+"""
+데이터 플로우 실행 모니터
+모든 데이터 플로우의 실행 이력을 증분 수집하여 플로우별 처리량/소요 시간/실패율/지연 통계 계산
+"""
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from services.broadcast import Broadcaster
+from services.concurrency import bounded_as_completed
+
+if TYPE_CHECKING:
+    from services.adobe_client import AdobeAPIClient
+
+logger = logging.getLogger(__name__)
+
+# 아직 끝나지 않은 실행 상태 (다음 수집 때 다시 조회)
+ACTIVE_RUN_STATUSES = frozenset({"inProgress", "pending", "queued", "running"})
+# 끝난 실행 상태 (완료 시각이 없어도 다시 조회하지 않음)
+FINISHED_RUN_STATUSES = frozenset({"success", "partialSuccess", "failed", "cancelled"})
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """최근접 순위(nearest-rank) 백분위수 (values는 정렬된 목록)"""
+    if not values:
+        return None
+    rank = max(1, int(-(-q * len(values) // 100)))
+    return values[min(rank, len(values)) - 1]
+
+
+def _run_summary(run: Dict[str, Any]) -> Dict[str, Any]:
+    """통계 계산에 필요한 필드만 추출 (시각은 ms, 소요 시간은 초)"""
+    metrics = run.get("metrics") or {}
+    durations = metrics.get("durationSummary") or {}
+    records = metrics.get("recordSummary") or {}
+    started = durations.get("startedAtUTC") or run.get("createdAt")
+    completed = durations.get("completedAtUTC")
+    status = (metrics.get("statusSummary") or {}).get("status") or run.get("status") or "unknown"
+    return {
+        "id": run.get("id"),
+        "createdAt": run.get("createdAt") or started or 0,
+        "startedAt": started,
+        "completedAt": completed,
+        "status": status,
+        # 상태로 판단하고, 알 수 없는 상태만 완료 시각 유무로 판단 (시작 전에 실패/취소된 실행은 완료 시각이 없음)
+        "active": status in ACTIVE_RUN_STATUSES or (status not in FINISHED_RUN_STATUSES and not completed),
+        "duration": (completed - started) / 1000 if started and completed else None,
+        "inputRecords": records.get("inputRecordCount") or 0,
+        "failedRecords": records.get("failedRecordCount") or 0,
+    }
+
+
+class FlowRuns:
+    """데이터 플로우 하나의 실행 이력 (실행 ID 기준, 최신 max_runs개만 유지)"""
+
+    def __init__(self, flow_id: str, name: Optional[str] = None):
+        self.flow_id = flow_id
+        self.name = name
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.error: Optional[str] = None
+
+    def oldest_active(self) -> Optional[int]:
+        active = [run["createdAt"] for run in self.runs.values() if run["active"]]
+        return min(active) if active else None
+
+    def trim(self, max_runs: int) -> None:
+        if len(self.runs) > max_runs:
+            newest = sorted(self.runs.values(), key=lambda run: run["createdAt"], reverse=True)[:max_runs]
+            self.runs = {run["id"]: run for run in newest}
+
+    def stats(self, now_ms: float) -> Dict[str, Any]:
+        runs = list(self.runs.values())
+        finished = [run for run in runs if not run["active"]]
+        failed = [run for run in finished if run["status"] == "failed"]
+        durations = sorted(run["duration"] for run in finished if run["duration"])
+        total_records = sum(run["inputRecords"] for run in finished if run["duration"])
+        total_seconds = sum(durations)
+        input_records = sum(run["inputRecords"] for run in finished)
+        last_success = max(
+            (run["completedAt"] for run in finished if run["status"] != "failed" and run["completedAt"]), default=None
+        )
+        latest = max(runs, key=lambda run: run["createdAt"], default=None)
+        return {
+            "flowId": self.flow_id,
+            "name": self.name,
+            "runs": len(runs),
+            "activeRuns": len(runs) - len(finished),
+            "failedRuns": len(failed),
+            "failureRate": round(len(failed) / len(finished), 4) if finished else None,
+            "recordFailureRate": (
+                round(sum(run["failedRecords"] for run in finished) / input_records, 4) if input_records else None
+            ),
+            "recordsPerSecond": round(total_records / total_seconds, 1) if total_seconds else None,
+            "durationSeconds": {
+                "p50": percentile(durations, 50),
+                "p90": percentile(durations, 90),
+                "p99": percentile(durations, 99),
+                "max": durations[-1] if durations else None,
+            },
+            # 마지막으로 성공한 실행이 끝난 뒤 지난 시간
+            "lagSeconds": round((now_ms - last_success) / 1000, 1) if last_success else None,
+            "lastRunStatus": latest["status"] if latest else None,
+            "error": self.error,
+        }
+
+
+class DataflowRunMonitor:
+    """
+    전체 데이터 플로우 실행 이력 수집기
+
+    - 데이터 플로우 목록을 순회하며 플로우별 실행 이력을 최대 concurrency개씩 동시에 조회합니다.
+    - 실행 이력은 최신순(`orderby=-createdAt`)으로 읽고, 이미 수집한 완료 실행이면서
+      진행 중이던 가장 오래된 실행보다 이전이면 페이지 순회를 멈춥니다 (증분 수집).
+    - 구독자가 있는 동안 interval마다 수집하고 통계가 바뀌면 `stats` 이벤트를 발행하며,
+      구독자가 idle_timeout 동안 없으면 수집을 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        client: "AdobeAPIClient",
+        interval: float = 60.0,
+        concurrency: int = 8,
+        max_runs_per_flow: int = 500,
+        page_size: int = 100,
+        incremental_page_size: int = 10,
+        idle_timeout: float = 120.0
+    ):
+        self.client = client
+        self.interval = interval
+        self.concurrency = concurrency
+        self.max_runs_per_flow = max_runs_per_flow
+        self.page_size = page_size
+        self.incremental_page_size = incremental_page_size
+        self.idle_timeout = idle_timeout
+        self.flows: Dict[str, FlowRuns] = {}
+        self.broadcaster = Broadcaster()
+        self.refreshed_at: Optional[float] = None
+        self.refresh_seconds: Optional[float] = None
+        self.runs_fetched = 0
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # 수집
+    async def refresh(self) -> Dict[str, Any]:
+        """전체 플로우 실행 이력 증분 수집 후 통계 반환 (동시 호출은 하나로 합침)"""
+        if self._refresh_lock.locked():
+            async with self._refresh_lock:
+                return self.stats()
+        async with self._refresh_lock:
+            started = time.monotonic()
+            flows: Dict[str, FlowRuns] = {}
+            async for flow in self.client.iter_dataflows(page_size=self.page_size):
+                flow_id = flow.get("id")
+                if flow_id:
+                    flows[flow_id] = self.flows.get(flow_id) or FlowRuns(flow_id)
+                    flows[flow_id].name = flow.get("name")
+            self.flows = flows
+
+            results = bounded_as_completed(list(flows.values()), self._refresh_flow, self.concurrency)
+            async for flow_runs, fetched, error in results:
+                flow_runs.error = str(error) if error is not None else None
+                if error is None:
+                    self.runs_fetched += fetched
+                else:
+                    logger.warning("데이터 플로우 실행 이력 수집 실패 (%s): %s", flow_runs.flow_id, error)
+            self.refreshed_at = time.time()
+            self.refresh_seconds = round(time.monotonic() - started, 3)
+            return self.stats()
+
+    async def _refresh_flow(self, flow_runs: FlowRuns) -> int:
+        """최신 실행부터 읽어 새 실행/진행 중이던 실행만 반영, 읽은 실행 수 반환"""
+        oldest_active = flow_runs.oldest_active()
+        fetched = 0
+        # 이미 수집한 플로우는 대부분 새 실행이 몇 개뿐이므로 작은 페이지로 시작
+        page_size = self.incremental_page_size if flow_runs.runs else self.page_size
+        runs = self.client.iter_dataflow_runs(
+            flow_runs.flow_id, page_size=page_size, prefetch=False, orderby="-createdAt"
+        )
+        try:
+            async for run in runs:
+                summary = _run_summary(run)
+                known = flow_runs.runs.get(summary["id"])
+                if known is not None and not known["active"] and (
+                    oldest_active is None or summary["createdAt"] < oldest_active
+                ):
+                    break
+                flow_runs.runs[summary["id"]] = summary
+                fetched += 1
+                if fetched >= self.max_runs_per_flow:
+                    break
+        finally:
+            await runs.aclose()
+        flow_runs.trim(self.max_runs_per_flow)
+        return fetched
+
+    # 통계
+    def stats(self) -> Dict[str, Any]:
+        now_ms = time.time() * 1000
+        flows = [flow_runs.stats(now_ms) for flow_runs in self.flows.values()]
+        finished = sum(flow["runs"] - flow["activeRuns"] for flow in flows)
+        failed = sum(flow["failedRuns"] for flow in flows)
+        return {
+            "refreshedAt": self.refreshed_at,
+            "refreshSeconds": self.refresh_seconds,
+            "runsFetched": self.runs_fetched,
+            "summary": {
+                "flows": len(flows),
+                "runs": sum(flow["runs"] for flow in flows),
+                "activeRuns": sum(flow["activeRuns"] for flow in flows),
+                "failureRate": round(failed / finished, 4) if finished else None,
+                "flowsWithErrors": sum(1 for flow in flows if flow["error"]),
+                "maxLagSeconds": max((flow["lagSeconds"] for flow in flows if flow["lagSeconds"] is not None), default=None),
+            },
+            "flows": flows,
+        }
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """interval 이내에 수집한 통계가 있으면 그대로, 아니면 다시 수집"""
+        if self.refreshed_at is not None and time.time() - self.refreshed_at < self.interval:
+            return self.stats()
+        return await self.refresh()
+
+    # 구독
+    def subscribe(self, heartbeat: Optional[float] = None):
+        """통계 SSE 구독 (수집 루프가 멈춰 있으면 시작)"""
+        if self._task is None or self._task.done():
+            if self.broadcaster.closed:
+                self.broadcaster = Broadcaster()
+            self._task = asyncio.create_task(self._run())
+        return self.broadcaster.subscribe(heartbeat=heartbeat)
+
+    async def _run(self) -> None:
+        last: Optional[List[Dict[str, Any]]] = None
+        idle_since = time.monotonic()
+        try:
+            while True:
+                try:
+                    stats = await self.refresh()
+                except Exception as e:
+                    self.broadcaster.publish("error", {"error": str(e)})
+                    # error가 재생 이벤트(latest)를 대신하므로 다음 통계는 바뀌지 않았어도 다시 발행
+                    last = None
+                else:
+                    # 지연 시간은 매번 달라지므로 비교에서 제외
+                    comparable = [{**flow, "lagSeconds": None} for flow in stats["flows"]]
+                    if comparable != last:
+                        self.broadcaster.publish("stats", stats)
+                        last = comparable
+                if self.broadcaster.subscriber_count:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since >= self.idle_timeout:
+                    return
+                await asyncio.sleep(self.interval)
+        finally:
+            self.broadcaster.close()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
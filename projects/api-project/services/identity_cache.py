@@ -0,0 +1,228 @@
+"""
+Identity 클러스터 캐시
+Identity Graph 응답을 모든 멤버 (namespace, id)로 색인하여 같은 클러스터 조회를 로컬에서 처리
+"""
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# xid로 조회한 결과도 같은 색인에서 찾기 위한 가상 Namespace
+XID_NAMESPACE = "__xid__"
+
+IdentityKey = Tuple[str, str]
+
+
+class IdentityCacheStats:
+    """클러스터 캐시 통계"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.merges = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "merges": self.merges,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class _Cluster:
+    """루트 노드에 저장되는 클러스터 정보 (멤버 노드, 응답 Identity 목록, 응답의 나머지 필드, 만료 시각)"""
+
+    __slots__ = ("nodes", "identities", "xid", "fields", "expires_at")
+
+    def __init__(self, nodes: List[int], identities: List[Dict[str, Any]], xid: Optional[str], expires_at: float):
+        self.nodes = nodes
+        self.identities = identities
+        self.xid = xid
+        self.fields: Dict[str, Any] = {}
+        self.expires_at = expires_at
+
+
+class IdentityClusterCache:
+    """
+    Union-Find 기반 Identity 클러스터 캐시
+
+    - 각 Identity는 정수 노드 하나이며 parent/size 배열로 클러스터를 관리합니다 (경로 압축 + 크기 기준 합치기).
+    - 새 응답의 멤버가 이미 다른 클러스터에 있으면 두 클러스터를 합치고, 만료 시각은 더 이른 쪽을 따릅니다.
+    - max_identities를 넘으면 가장 오래 사용하지 않은 클러스터를 멤버 전체와 함께 제거하며,
+      비워진 노드 번호는 재사용합니다.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_identities: int = 100000):
+        self.ttl = ttl
+        self.max_identities = max_identities
+        self._nodes: Dict[IdentityKey, int] = {}
+        self._keys: List[Optional[IdentityKey]] = []
+        self._parent: List[int] = []
+        self._size: List[int] = []
+        self._free: List[int] = []
+        # 루트 노드 → 클러스터 (LRU 순서)
+        self._clusters: "OrderedDict[int, _Cluster]" = OrderedDict()
+        self.stats = IdentityCacheStats()
+
+    @staticmethod
+    def key(namespace: str, identity_id: str) -> IdentityKey:
+        return (namespace.casefold(), identity_id)
+
+    # 조회/저장
+    def get(self, namespace: str, identity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        멤버 하나로 클러스터 조회 (없거나 만료되었으면 None)
+
+        저장한 응답과 같은 형태의 사본을 반환하므로 호출자가 수정해도 캐시에는 영향이 없습니다.
+        """
+        node = self._nodes.get(self.key(namespace, identity_id))
+        if node is None:
+            self.stats.misses += 1
+            return None
+        root = self._find(node)
+        cluster = self._clusters.get(root)
+        if cluster is None:
+            # 클러스터 없이 남은 노드는 조회되지 않도록 정리 (정상 동작에서는 생기지 않음)
+            self._nodes.pop(self.key(namespace, identity_id), None)
+            self.stats.misses += 1
+            return None
+        if time.monotonic() >= cluster.expires_at:
+            self._remove(root)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._clusters.move_to_end(root)
+        self.stats.hits += 1
+        graph = copy.deepcopy({**cluster.fields, "identities": cluster.identities})
+        if cluster.xid:
+            graph["xid"] = cluster.xid
+        return graph
+
+    def get_xid(self, xid: str) -> Optional[Dict[str, Any]]:
+        return self.get(XID_NAMESPACE, xid)
+
+    def put(self, response: Dict[str, Any], *query: IdentityKey) -> None:
+        """
+        Identity Graph 응답 저장
+
+        응답의 모든 멤버와 xid, 조회에 사용한 (namespace, id)를 같은 클러스터로 묶습니다.
+        identities 외의 최상위 필드도 사본으로 보관하며, 클러스터를 합치면 새 응답의 값을 따릅니다.
+        """
+        members: Dict[IdentityKey, Dict[str, Any]] = {}
+        for identity in response.get("identities") or []:
+            if identity.get("namespace") and identity.get("id") is not None:
+                members.setdefault(self.key(identity["namespace"], str(identity["id"])), copy.deepcopy(identity))
+        keys = list(members)
+        xid = response.get("xid")
+        if xid:
+            keys.append(self.key(XID_NAMESPACE, xid))
+        keys.extend(self.key(*q) for q in query)
+        if not keys:
+            return
+
+        now = time.monotonic()
+        for k in keys:
+            # 만료된 클러스터는 합치지 않고 새 응답으로 대체
+            node = self._nodes.get(k)
+            if node is not None and self._clusters[self._find(node)].expires_at <= now:
+                self._remove(self._find(node))
+                self.stats.expirations += 1
+
+        new_keys = [k for k in dict.fromkeys(keys) if k not in self._nodes]
+        nodes = [self._node(k) for k in keys]
+        # 합쳐지는 기존 클러스터 중 가장 큰 것을 기준으로 나머지와 새 멤버를 덧붙임
+        roots = {self._find(n) for n in nodes}
+        merged = sorted(
+            (self._clusters.pop(root) for root in roots if root in self._clusters),
+            key=lambda c: len(c.nodes), reverse=True
+        )
+        if len(merged) > 1:
+            self.stats.merges += len(merged) - 1
+        expires_at = now + self.ttl
+        if merged:
+            cluster = merged[0]
+            cluster.expires_at = min(expires_at, *(c.expires_at for c in merged))
+        else:
+            cluster = _Cluster([], [], None, expires_at)
+        for other in merged[1:]:
+            cluster.nodes.extend(other.nodes)
+            cluster.identities.extend(other.identities)
+            cluster.fields = {**other.fields, **cluster.fields}
+        # 키 순서를 유지하도록 identities 자리는 남겨 두고 값은 get()에서 채움
+        cluster.fields.update(
+            (k, None if k == "identities" else copy.deepcopy(v)) for k, v in response.items()
+        )
+        cluster.nodes.extend(self._nodes[k] for k in new_keys)
+        cluster.identities.extend(members[k] for k in new_keys if k in members)
+        cluster.xid = xid or cluster.xid or next((c.xid for c in merged if c.xid), None)
+
+        root = self._find(nodes[0])
+        for n in nodes[1:]:
+            root = self._union(root, n)
+        self._clusters[root] = cluster
+        self._evict()
+
+    # Union-Find
+    def _node(self, key: IdentityKey) -> int:
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+        if self._free:
+            node = self._free.pop()
+            self._keys[node] = key
+            self._parent[node] = node
+            self._size[node] = 1
+        else:
+            node = len(self._parent)
+            self._keys.append(key)
+            self._parent.append(node)
+            self._size.append(1)
+        self._nodes[key] = node
+        return node
+
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def _union(self, a: int, b: int) -> int:
+        a, b = self._find(a), self._find(b)
+        if a == b:
+            return a
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size[b]
+        return a
+
+    # 제거
+    def _remove(self, root: int) -> None:
+        cluster = self._clusters.pop(root)
+        for node in cluster.nodes:
+            self._nodes.pop(self._keys[node], None)
+            self._keys[node] = None
+            self._parent[node] = node
+            self._size[node] = 1
+            self._free.append(node)
+
+    def _evict(self) -> None:
+        while len(self._nodes) > self.max_identities and len(self._clusters) > 1:
+            root = next(iter(self._clusters))
+            self._remove(root)
+            self.stats.evictions += 1
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "clusters": len(self._clusters),
+            "identities": len(self._nodes),
+            "max_identities": self.max_identities,
+        }
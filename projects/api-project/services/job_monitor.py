@@ -0,0 +1,155 @@
+"""
+세그먼트 작업 진행 상황 모니터
+작업마다 하나의 서버 측 폴러가 상태를 조회하고 변경 사항을 모든 SSE 구독자에게 전달
+"""
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import httpx
+
+from services.broadcast import Broadcaster
+
+if TYPE_CHECKING:
+    from services.adobe_client import AdobeAPIClient
+
+logger = logging.getLogger(__name__)
+
+# 더 이상 상태가 바뀌지 않는 작업 상태
+TERMINAL_JOB_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+
+class SegmentJobPoller:
+    """
+    세그먼트 작업 하나의 상태 폴러
+
+    - 작업 상태(status)가 바뀌면 min_interval로 돌아가고, 그 외에는 조회할 때마다
+      backoff배씩 간격을 늘려 max_interval까지 대기합니다.
+    - 응답이 이전과 다를 때만 `status` 이벤트를 발행하며, 종료 상태에 도달하면
+      최종 작업 정보로 `end` 이벤트를 발행하고 멈춥니다.
+    - 구독자가 idle_timeout 동안 없으면 폴링을 중단합니다.
+    """
+
+    def __init__(
+        self,
+        client: "AdobeAPIClient",
+        job_id: str,
+        min_interval: float = 2.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        idle_timeout: float = 30.0
+    ):
+        self.client = client
+        self.job_id = job_id
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.idle_timeout = idle_timeout
+        self.broadcaster = Broadcaster()
+        self.interval = min_interval
+        self.polls = 0
+        self.status: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "SegmentJobPoller":
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.broadcaster.close()
+
+    @property
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    async def _run(self) -> None:
+        last: Optional[Dict[str, Any]] = None
+        idle_since = time.monotonic()
+        try:
+            while True:
+                try:
+                    job = await self.client.get_segment_job(self.job_id)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 429 and e.response.status_code < 500:
+                        # 작업이 없거나 권한이 없으면 재시도해도 결과가 같음
+                        self.broadcaster.publish("error", {"jobId": self.job_id, "error": str(e)})
+                        return
+                    job = None
+                    self.broadcaster.publish("error", {"jobId": self.job_id, "error": str(e)})
+                except Exception as e:
+                    job = None
+                    self.broadcaster.publish("error", {"jobId": self.job_id, "error": str(e)})
+                self.polls += 1
+
+                if job is not None:
+                    status = job.get("status")
+                    if status in TERMINAL_JOB_STATUSES:
+                        self.status = status
+                        self.broadcaster.publish("end", job)
+                        return
+                    if job != last:
+                        self.broadcaster.publish("status", job)
+                    self.interval = (
+                        self.min_interval if status != self.status
+                        else min(self.max_interval, self.interval * self.backoff)
+                    )
+                    self.status = status
+                    last = job
+                else:
+                    # error가 재생 이벤트(latest)를 대신하므로 다음 정상 응답은 바뀌지 않았어도 다시 발행
+                    last = None
+                    self.interval = min(self.max_interval, self.interval * self.backoff)
+
+                if self.broadcaster.subscriber_count:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since >= self.idle_timeout:
+                    return
+                await asyncio.sleep(self.interval)
+        finally:
+            self.broadcaster.close()
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "subscribers": self.broadcaster.subscriber_count,
+            "polls": self.polls,
+            "interval": round(self.interval, 2),
+            "done": self.done,
+        }
+
+
+class SegmentJobMonitor:
+    """작업 ID별 공유 폴러 관리 (같은 작업을 여러 구독자가 보더라도 업스트림 조회는 하나)"""
+
+    def __init__(self, client: "AdobeAPIClient", **poller_options: float):
+        self.client = client
+        self.poller_options = poller_options
+        self._pollers: Dict[str, SegmentJobPoller] = {}
+
+    def watch(self, job_id: str) -> SegmentJobPoller:
+        """실행 중인 폴러를 반환하거나 새로 시작"""
+        poller = self._pollers.get(job_id)
+        if poller is None or poller.done:
+            poller = SegmentJobPoller(self.client, job_id, **self.poller_options).start()
+            self._pollers[job_id] = poller
+            poller._task.add_done_callback(lambda _, p=poller: self._forget(p))
+        return poller
+
+    def _forget(self, poller: SegmentJobPoller) -> None:
+        if self._pollers.get(poller.job_id) is poller:
+            del self._pollers[poller.job_id]
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(poller.stop() for poller in list(self._pollers.values())))
+        self._pollers.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return {job_id: poller.info() for job_id, poller in self._pollers.items()}
@@ -0,0 +1,187 @@
+"""
+Prometheus 메트릭
+라우터 경로별/업스트림 API 계열별 지연 시간, 진행 중 요청 수, 상태 코드, 응답 크기, 커넥션 풀 사용률
+
+레이블에는 실제 ID가 들어간 경로 대신 라우트 템플릿(`/schemas/{schema_id}`)과
+API 계열(schemaregistry, ups ...)만 사용하여 시계열 수가 늘어나지 않도록 합니다.
+"""
+import time
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from starlette.routing import Match
+
+from config import settings
+
+if TYPE_CHECKING:
+    from services.adobe_client import AdobeAPIClient
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# 라우트에 매칭되지 않은 요청(404 등)은 하나의 레이블로 묶음
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "aep_api_http_request_duration_seconds",
+    "API 서버 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS = Counter(
+    "aep_api_http_requests_total",
+    "API 서버 응답 수",
+    ["method", "route", "status"],
+)
+HTTP_IN_FLIGHT = Gauge(
+    "aep_api_http_requests_in_flight",
+    "API 서버에서 처리 중인 요청 수",
+    ["method", "route"],
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "aep_api_http_response_size_bytes",
+    "API 서버 응답 본문 크기",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "aep_upstream_request_duration_seconds",
+    "AEP API 호출 시간 (캐시, 요청 병합, 재시도, 속도 제한 대기 포함)",
+    ["family", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_RESPONSES = Counter(
+    "aep_upstream_responses_total",
+    "AEP API 응답 수 (재시도 포함 실제 전송 기준, 네트워크 오류는 status=error)",
+    ["family", "method", "status"],
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    "aep_upstream_requests_in_flight",
+    "AEP API로 전송 중인 요청 수",
+    ["family"],
+)
+UPSTREAM_RESPONSE_SIZE = Histogram(
+    "aep_upstream_response_size_bytes",
+    "AEP API 응답 본문 크기 (스트리밍 응답은 Content-Length 기준)",
+    ["family"],
+    buckets=SIZE_BUCKETS,
+)
+
+
+def observe_upstream_response(family: str, method: str, status: Any, size: Optional[int]) -> None:
+    """업스트림 응답 1건 기록"""
+    UPSTREAM_RESPONSES.labels(family, method, str(status)).inc()
+    if size is not None:
+        UPSTREAM_RESPONSE_SIZE.labels(family).observe(size)
+
+
+def route_template(scope: dict) -> str:
+    """요청 경로에 해당하는 라우트 템플릿 (예: /api/schema-registry/schemas/{schema_id})"""
+    app = scope.get("app")
+    routes = getattr(getattr(app, "router", None), "routes", ())
+    partial = None
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path", None)
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 메트릭 수집 ASGI 미들웨어
+
+    스트리밍 응답(NDJSON 등)도 본문 전송이 끝날 때까지의 시간과 전체 크기를 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        in_flight = HTTP_IN_FLIGHT.labels(method, route)
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(size)
+            in_flight.dec()
+
+
+class PoolCollector:
+    """
+    AdobeAPIClient 커넥션 풀 사용률 수집기 (스크레이프 시점에 계산)
+
+    httpx 내부 풀(httpcore) 상태를 읽으므로 구조를 알 수 없으면 해당 값은 생략합니다.
+    """
+
+    def __init__(self, client: "AdobeAPIClient"):
+        self.client = client
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        connections = GaugeMetricFamily(
+            "aep_upstream_pool_connections",
+            "AEP API 커넥션 풀 연결 수 (active: 요청 처리 중, idle: Keep-Alive 대기)",
+            labels=["state"],
+        )
+        pool = getattr(getattr(self.client._http_client, "_transport", None), "_pool", None)
+        pool_connections = getattr(pool, "connections", None)
+        if pool_connections is not None:
+            idle = sum(1 for connection in pool_connections if connection.is_idle())
+            connections.add_metric(["active"], len(pool_connections) - idle)
+            connections.add_metric(["idle"], idle)
+        yield connections
+
+        waiting = getattr(pool, "_requests", None)
+        if waiting is not None:
+            yield GaugeMetricFamily(
+                "aep_upstream_pool_requests",
+                "커넥션 풀에 할당되었거나 연결을 기다리는 요청 수",
+                value=len(waiting),
+            )
+
+        yield GaugeMetricFamily(
+            "aep_upstream_pool_max_connections",
+            "커넥션 풀 최대 연결 수",
+            value=settings.http_max_connections,
+        )
+
+        slots = GaugeMetricFamily(
+            "aep_upstream_host_slots_in_use",
+            "호스트별 동시 요청 제한 중 사용 중인 슬롯 수",
+            labels=["host"],
+        )
+        limit = settings.http_max_connections_per_host
+        for host, semaphore in self.client._host_semaphores.items():
+            slots.add_metric([host], limit - semaphore._value)
+        yield slots
+
+    def register(self) -> "PoolCollector":
+        REGISTRY.register(self)
+        return self
+
+    def unregister(self) -> None:
+        REGISTRY.unregister(self)
@@ -0,0 +1,181 @@
+"""
+Identity Namespace 레지스트리
+Namespace 목록을 코드/숫자 ID/idType으로 색인하여 검증과 단건 조회를 로컬에서 처리
+"""
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from models.identity import IdentityNamespace
+
+if TYPE_CHECKING:
+    from services.adobe_client import AdobeAPIClient
+
+logger = logging.getLogger(__name__)
+
+NAMESPACES_ENDPOINT = "/data/core/idnamespace/identities"
+
+
+class NamespaceRegistry:
+    """
+    Identity Namespace 색인
+
+    - 코드는 대소문자를 구분하지 않고 조회하며, 응답에는 AEP에 등록된 원래 코드를 사용합니다.
+    - 목록은 refresh_interval마다 클라이언트(응답 캐시)에서 다시 확인하고, 바뀐 항목만 색인에 반영합니다.
+    - 알 수 없는 코드/ID가 들어오면 miss_refresh_interval 간격으로 업스트림 재검증을 한 번 시도합니다
+      (방금 생성된 Custom Namespace 대응).
+    - 목록을 한 번도 불러오지 못했다면 loaded가 False이며, 호출자는 검증 없이 AEP에 판단을 맡깁니다.
+    """
+
+    def __init__(
+        self,
+        client: "AdobeAPIClient",
+        refresh_interval: float = 60.0,
+        miss_refresh_interval: float = 10.0
+    ):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.miss_refresh_interval = miss_refresh_interval
+        self._by_id: Dict[int, IdentityNamespace] = {}
+        self._by_code: Dict[str, IdentityNamespace] = {}
+        self._by_id_type: Dict[str, Dict[int, IdentityNamespace]] = {}
+        self._raw: Dict[int, Dict[str, Any]] = {}
+        self._source: Optional[List[Dict[str, Any]]] = None
+        self._checked_at = 0.0
+        self._forced_at = 0.0
+        self._lock = asyncio.Lock()
+        self.loaded = False
+        self.version = 0
+        self.last_error: Optional[str] = None
+
+    # 조회
+    async def get_by_id(self, namespace_id: int) -> Optional[IdentityNamespace]:
+        await self.ensure_fresh()
+        namespace = self._by_id.get(namespace_id)
+        if namespace is None and await self._refresh_on_miss():
+            namespace = self._by_id.get(namespace_id)
+        return namespace
+
+    async def resolve(self, value: Union[str, int]) -> Optional[IdentityNamespace]:
+        """Namespace 코드(대소문자 무시) 또는 숫자 ID로 조회"""
+        await self.ensure_fresh()
+        namespace = self._lookup(value)
+        if namespace is None and await self._refresh_on_miss():
+            namespace = self._lookup(value)
+        return namespace
+
+    async def by_id_type(self, id_type: str) -> List[IdentityNamespace]:
+        """idType(EMAIL, PHONE, COOKIE 등)별 Namespace 목록"""
+        await self.ensure_fresh()
+        return list(self._by_id_type.get(id_type.upper(), {}).values())
+
+    def _lookup(self, value: Union[str, int]) -> Optional[IdentityNamespace]:
+        if isinstance(value, int):
+            return self._by_id.get(value)
+        value = value.strip()
+        namespace = self._by_code.get(value.casefold())
+        if namespace is None and value.isdigit():
+            namespace = self._by_id.get(int(value))
+        return namespace
+
+    # 갱신
+    async def ensure_fresh(self) -> None:
+        """refresh_interval이 지났으면 목록 재확인 (실패해도 기존 색인 유지)"""
+        if time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning("Namespace 레지스트리 갱신 실패: %s", e)
+
+    async def refresh(self, force: bool = False) -> int:
+        """
+        Namespace 목록을 다시 가져와 색인 갱신
+
+        force=True면 캐시 신선도와 관계없이 업스트림에 재검증합니다.
+        반환값은 추가/변경/삭제된 항목 수입니다.
+        """
+        async with self._lock:
+            try:
+                if force:
+                    data = await self.client.refresh(NAMESPACES_ENDPOINT)
+                else:
+                    data = await self.client.get_identity_namespaces()
+            except Exception as e:
+                self.last_error = str(e)
+                raise
+            finally:
+                self._checked_at = time.monotonic()
+            self.last_error = None
+            return self._apply(data)
+
+    async def _refresh_on_miss(self) -> bool:
+        """색인에 없는 값이 들어왔을 때 강제 갱신 (최소 간격 내 재시도는 생략)"""
+        if time.monotonic() - self._forced_at < self.miss_refresh_interval:
+            return False
+        self._forced_at = time.monotonic()
+        try:
+            return await self.refresh(force=True) > 0
+        except Exception as e:
+            logger.warning("Namespace 레지스트리 갱신 실패: %s", e)
+            return False
+
+    def _apply(self, data: List[Dict[str, Any]]) -> int:
+        """이전 목록과 비교하여 바뀐 항목만 색인에 반영"""
+        self.loaded = True
+        if data is self._source:
+            # 캐시 적중/304 재검증이면 같은 객체가 그대로 반환됨
+            return 0
+        self._source = data
+
+        seen = set()
+        changed = 0
+        for item in data:
+            namespace_id = item.get("id")
+            seen.add(namespace_id)
+            if self._raw.get(namespace_id) == item:
+                continue
+            current = self._by_id.get(namespace_id)
+            try:
+                namespace = IdentityNamespace.model_validate(item)
+            except ValueError as e:
+                logger.warning("Namespace 항목 무시 (id=%s): %s", namespace_id, e)
+                continue
+            if current is not None:
+                self._unindex(current)
+            self._index(namespace)
+            self._raw[namespace_id] = item
+            changed += 1
+
+        for namespace_id in [nid for nid in self._by_id if nid not in seen]:
+            self._unindex(self._by_id[namespace_id])
+            self._raw.pop(namespace_id, None)
+            changed += 1
+
+        if changed:
+            self.version += 1
+        return changed
+
+    def _index(self, namespace: IdentityNamespace) -> None:
+        self._by_id[namespace.id] = namespace
+        self._by_code[namespace.code.casefold()] = namespace
+        self._by_id_type.setdefault(namespace.idType.upper(), {})[namespace.id] = namespace
+
+    def _unindex(self, namespace: IdentityNamespace) -> None:
+        self._by_id.pop(namespace.id, None)
+        if self._by_code.get(namespace.code.casefold()) is namespace:
+            del self._by_code[namespace.code.casefold()]
+        by_type = self._by_id_type.get(namespace.idType.upper(), {})
+        by_type.pop(namespace.id, None)
+        if not by_type:
+            self._by_id_type.pop(namespace.idType.upper(), None)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "version": self.version,
+            "namespaces": len(self._by_id),
+            "id_types": {id_type: len(items) for id_type, items in self._by_id_type.items()},
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,157 @@
+"""
+클라이언트 측 요청 속도 제한
+API 계열별 적응형 토큰 버킷 (429 / Retry-After 반영)
+"""
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveTokenBucket:
+    """
+    적응형 토큰 버킷
+
+    - 대기 요청은 asyncio.Lock(FIFO) 순서대로 토큰을 받으므로 먼저 온 요청이 먼저 처리됩니다.
+    - 429 응답 시 속도를 decrease_factor만큼 줄이고 Retry-After 동안 모든 요청을 멈춥니다.
+    - 성공 응답마다 max_rate의 recovery_ratio만큼 속도를 회복합니다 (AIMD).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_rate: float,
+        burst: int,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        recovery_ratio: float = 0.05
+    ):
+        self.name = name
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.capacity = max(1, burst)
+        self.decrease_factor = decrease_factor
+        self.recovery_ratio = recovery_ratio
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """토큰 1개 획득까지 대기 (대기한 시간을 초 단위로 반환)"""
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def on_success(self) -> None:
+        """정상 응답: 속도를 조금씩 회복"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_ratio)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """429 응답: 속도를 줄이고 Retry-After(없으면 토큰 1개 생성 시간) 동안 일시 정지"""
+        now = time.monotonic()
+        self.throttled += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.tokens = 0.0
+        self._updated = now
+        pause = retry_after if retry_after is not None else 1.0 / self.rate
+        self._blocked_until = max(self._blocked_until, now + pause)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "avg_wait_seconds": round(self.total_wait / self.acquired, 4) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait, 4),
+            "paused_seconds": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+        }
+
+
+# 엔드포인트 경로 → API 계열
+ENDPOINT_FAMILIES = {
+    "/data/foundation/schemaregistry": "schemaregistry",
+    "/data/core/ups": "ups",
+    "/data/core/idnamespace": "identity",
+    "/data/core/identity": "identity",
+    "/data/foundation/flowservice": "flowservice",
+}
+
+
+def endpoint_family(path: str) -> str:
+    """요청 경로가 속한 API 계열 (알 수 없으면 default)"""
+    for prefix, family in ENDPOINT_FAMILIES.items():
+        if path.startswith(prefix):
+            return family
+    return "default"
+
+
+class RateLimiter:
+    """API 계열별 AdaptiveTokenBucket 모음"""
+
+    def __init__(self, rates: Dict[str, float], burst: int = 10, **bucket_options: Any):
+        self.rates = rates
+        self.burst = burst
+        self.bucket_options = bucket_options
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+
+    def bucket(self, family: str) -> AdaptiveTokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            rate = self.rates.get(family, self.rates.get("default", 10.0))
+            bucket = AdaptiveTokenBucket(family, rate, self.burst, **self.bucket_options)
+            self._buckets[family] = bucket
+        return bucket
+
+    def bucket_for_path(self, path: str) -> AdaptiveTokenBucket:
+        return self.bucket(endpoint_family(path))
+
+    def info(self) -> Dict[str, Dict[str, Any]]:
+        return {name: bucket.info() for name, bucket in self._buckets.items()}
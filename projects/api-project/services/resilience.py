@@ -0,0 +1,167 @@
+"""
+업스트림 장애 대응
+재시도(지수 백오프 + 지터), 재시도 예산, 호스트별 서킷 브레이커, 지연 시간 기반 요청 헤징
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 재시도해도 안전한 메서드와 일시적 장애로 보는 상태 코드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"업스트림({host}) 서킷 열림 - {retry_in:.1f}초 후 재시도 가능")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """지수 백오프 + Full Jitter 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (0 ~ min(max_delay, base * 2^attempt) 사이 무작위)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    재시도 예산
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도 1회에 토큰 1개를 사용합니다.
+    업스트림 전체 장애 시 재시도가 부하를 몇 배로 키우지 않도록 재시도 비율을 제한합니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = min_tokens
+        self.tokens = min_tokens
+        self.retries = 0
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커
+
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 모든 요청 즉시 실패
+    - half_open: 시험 요청 1개만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_request(self) -> None:
+        """요청 가능 여부 확인 (불가능하면 CircuitOpenError)"""
+        if self.state == self.OPEN:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_timeout:
+                raise CircuitOpenError(self.host, self.reset_timeout - elapsed)
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenError(self.host, 0.0)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """결과 없이 끝난 요청(취소 등)의 시험 요청 자리 반환 (실패로 세지 않음)"""
+        self._trial_in_flight = False
+
+
+class LatencyTracker:
+    """최근 응답 시간 표본으로 백분위 계산 (헤징 지연 산정용)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """표본이 min_samples 미만이면 None"""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def hedged(send: Callable[[], Awaitable[T]], delay: float) -> T:
+    """
+    헤징 요청
+
+    첫 요청이 delay 안에 끝나지 않으면 동일한 요청을 하나 더 보내고,
+    먼저 성공한 결과를 반환한 뒤 나머지는 취소합니다. 둘 다 실패하면 마지막 예외를 전달합니다.
+    """
+    first = asyncio.ensure_future(send())
+    pending = {first}
+    error: Optional[BaseException] = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return first.result()
+
+        pending.add(asyncio.ensure_future(send()))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
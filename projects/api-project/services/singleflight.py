@@ -0,0 +1,47 @@
+"""
+동일 요청 병합 (Singleflight)
+동시에 들어온 같은 키의 요청을 하나의 업스트림 호출로 합칩니다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    진행 중인 호출을 키 단위로 공유하는 헬퍼
+
+    첫 호출자(leader)가 실제 작업을 별도 Task로 시작하고, 완료 전에 같은 키로 들어온
+    호출자는 그 Task의 결과(또는 예외)를 함께 받습니다. 작업은 Task로 분리되어 있으므로
+    한 호출자가 취소되어도 나머지 대기자에게는 영향이 없습니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    @property
+    def inflight(self) -> int:
+        """현재 진행 중인 고유 호출 수"""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """key에 대한 진행 중 호출이 있으면 합류하고, 없으면 fn()을 실행"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 모든 대기자가 취소된 경우에도 미회수 예외 경고가 남지 않도록 조회
+            task.exception()
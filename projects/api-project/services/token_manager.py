@@ -0,0 +1,132 @@
+"""
+Adobe IMS Access Token 관리
+OAuth 2.0 Server-to-Server(Client Credentials) 토큰을 메모리에 보관하고 만료 전에 갱신
+"""
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from config import settings, get_aep_headers
+
+logger = logging.getLogger(__name__)
+
+# rtcdp-demo/scripts/auth_helper.py(AEPAuthHelper)와 동일한 기본 scope
+DEFAULT_OAUTH_SCOPES = "openid,AdobeID,read_organizations,additional_info.projectedProductContext,session"
+
+
+class TokenManager:
+    """
+    Access Token 관리자
+
+    - CLIENT_SECRET이 설정되어 있으면 IMS에서 Client Credentials 토큰을 발급받고,
+      만료(expires_in) refresh_margin초 전에 백그라운드에서 미리 갱신합니다.
+    - 동시에 여러 요청이 갱신을 요구해도 IMS 호출은 한 번만 수행합니다.
+    - 설정되어 있지 않으면 .env의 ACCESS_TOKEN을 그대로 사용합니다 (갱신 불가).
+    - sandbox별 공통 헤더를 토큰이 바뀔 때만 다시 만들어 재사용합니다.
+    """
+
+    def __init__(self, http_client: Callable[[], httpx.AsyncClient]):
+        self._http_client = http_client
+        self.can_refresh = bool(settings.api_key and settings.client_secret)
+        self.refresh_margin = settings.token_refresh_margin
+        self._token: Optional[str] = None if self.can_refresh else settings.access_token
+        self._expires_at = 0.0 if self.can_refresh else float("inf")
+        self._refresh_task: Optional[asyncio.Future] = None
+        self._background_task: Optional[asyncio.Task] = None
+        self._headers: Dict[Optional[str], Dict[str, str]] = {}
+        self.refreshes = 0
+        self.failures = 0
+
+    @property
+    def expires_in(self) -> float:
+        """현재 토큰의 남은 유효 시간 (초)"""
+        return self._expires_at - time.monotonic()
+
+    async def start(self) -> None:
+        """최초 토큰 발급 및 백그라운드 갱신 시작"""
+        if not self.can_refresh or self._background_task is not None:
+            return
+        try:
+            await self.get_token()
+        except Exception as e:
+            logger.warning("초기 Access Token 발급 실패 (요청 시 재시도): %s", e)
+        if settings.token_auto_refresh:
+            self._background_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 중지"""
+        if self._background_task is not None:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except asyncio.CancelledError:
+                pass
+            self._background_task = None
+
+    async def get_token(self, force_refresh: bool = False) -> Optional[str]:
+        """유효한 Access Token 반환 (만료 임박 시 갱신)"""
+        if not self.can_refresh:
+            return self._token
+        if not force_refresh and self._token and self.expires_in > self.refresh_margin:
+            return self._token
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        return await asyncio.shield(self._refresh_task)
+
+    async def headers(self, sandbox_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        sandbox별 AEP 공통 헤더 (토큰이 바뀌지 않았다면 미리 만든 dict 재사용)
+
+        반환된 dict는 공유되므로 수정하지 말고 복사해서 사용해야 합니다.
+        """
+        token = await self.get_token()
+        cached = self._headers.get(sandbox_name)
+        if cached is None or cached["Authorization"] != f"Bearer {token}":
+            cached = get_aep_headers(access_token=token, sandbox_name=sandbox_name)
+            self._headers[sandbox_name] = cached
+        return cached
+
+    async def reauthenticate(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        401 응답 후 재시도용 헤더
+
+        실패한 요청이 사용한 토큰이 현재 토큰이면 강제로 갱신하고,
+        다른 요청이 이미 갱신했다면 새 토큰만 반영합니다.
+        """
+        used = headers.get("Authorization", "")
+        token = await self.get_token(force_refresh=used == f"Bearer {self._token}")
+        return {**headers, "Authorization": f"Bearer {token}"}
+
+    async def _refresh(self) -> str:
+        """IMS Client Credentials 토큰 발급"""
+        response = await self._http_client().post(
+            f"{settings.ims_endpoint}/ims/token/v3",
+            data={
+                "client_id": settings.client_id or settings.api_key,
+                "client_secret": settings.client_secret,
+                "grant_type": "client_credentials",
+                "scope": settings.scopes or DEFAULT_OAUTH_SCOPES,
+            },
+        )
+        if response.status_code != 200:
+            self.failures += 1
+            response.raise_for_status()
+        result = response.json()
+        self._token = result["access_token"]
+        self._expires_at = time.monotonic() + float(result.get("expires_in", 86400))
+        self.refreshes += 1
+        return self._token
+
+    async def _refresh_loop(self) -> None:
+        """만료 refresh_margin초 전마다 토큰 갱신 (실패 시 30초 후 재시도)"""
+        while True:
+            delay = max(1.0, self.expires_in - self.refresh_margin)
+            await asyncio.sleep(delay)
+            try:
+                await self.get_token(force_refresh=True)
+            except Exception as e:
+                logger.warning("Access Token 갱신 실패: %s", e)
+                await asyncio.sleep(30.0)
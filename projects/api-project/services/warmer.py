@@ -0,0 +1,105 @@
+"""
+참조 데이터 캐시 예열
+자주 바뀌지 않는 AEP 참조 데이터를 시작 시 미리 조회하고 주기적으로 갱신
+"""
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from services.concurrency import bounded_as_completed
+
+if TYPE_CHECKING:
+    from services.adobe_client import AdobeAPIClient
+
+logger = logging.getLogger(__name__)
+
+# 예열 대상 → (엔드포인트, 파라미터)
+# 파라미터는 라우터 기본 요청과 같아야 같은 캐시 키로 저장됩니다.
+WARMUP_TARGETS: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {
+    "identity_namespaces": ("/data/core/idnamespace/identities", None),
+    "merge_policies": ("/data/core/ups/config/mergePolicies", {"limit": 10}),
+    "classes": ("/data/foundation/schemaregistry/global/classes", {"limit": 10}),
+    "connection_specs": ("/data/foundation/flowservice/connectionSpecs", None),
+}
+
+
+class CacheWarmer:
+    """
+    캐시 예열기
+
+    - start()는 백그라운드에서 모든 대상을 동시에 조회하고, 끝나면 ready가 설정됩니다.
+      (일부 대상이 실패하거나 timeout을 넘겨도 예열 단계는 끝난 것으로 보고 상태에 기록)
+    - 이후 refresh_interval마다 ETag 재검증으로 캐시를 갱신하여 사용자 요청이 만료된 항목을 만나지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        client: "AdobeAPIClient",
+        targets: List[str],
+        concurrency: int = 4,
+        timeout: float = 30.0,
+        refresh_interval: float = 240.0
+    ):
+        unknown = [name for name in targets if name not in WARMUP_TARGETS]
+        if unknown:
+            raise ValueError(f"알 수 없는 예열 대상: {', '.join(unknown)}")
+        self.client = client
+        self.targets = targets
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self.ready = asyncio.Event()
+        self.status: Dict[str, Dict[str, Any]] = {name: {"ok": False, "refreshes": 0} for name in targets}
+        self.warmup_seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """예열 및 주기적 갱신 시작 (예열 완료를 기다리지 않음)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def warm(self) -> None:
+        """모든 대상 동시 조회 (대상별 실패는 상태에만 기록)"""
+        results = bounded_as_completed(self.targets, self._warm_one, self.concurrency)
+        async for name, elapsed, error in results:
+            status = self.status[name]
+            if error is None:
+                status.update(ok=True, error=None, duration_ms=round(elapsed * 1000, 1), refreshed_at=time.time())
+                status["refreshes"] += 1
+            else:
+                status.update(ok=False, error=str(error) or type(error).__name__)
+                logger.warning("캐시 예열 실패 (%s): %s", name, status["error"])
+
+    async def _warm_one(self, name: str) -> float:
+        endpoint, params = WARMUP_TARGETS[name]
+        started = time.monotonic()
+        await asyncio.wait_for(self.client.refresh(endpoint, params), timeout=self.timeout)
+        return time.monotonic() - started
+
+    async def _run(self) -> None:
+        started = time.monotonic()
+        try:
+            await self.warm()
+        finally:
+            self.warmup_seconds = round(time.monotonic() - started, 3)
+            self.ready.set()
+        while self.refresh_interval > 0:
+            await asyncio.sleep(self.refresh_interval)
+            await self.warm()
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready.is_set(),
+            "warmup_seconds": self.warmup_seconds,
+            "targets": self.status,
+        }
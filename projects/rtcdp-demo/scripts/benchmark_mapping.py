@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+매핑 스펙 변환 벤치마크
+
+csv_to_xdm.py의 손으로 작성한 행 변환 함수와 mappings/ 스펙을 컴파일한 변환 함수가
+같은 레코드를 만드는지 확인하고, 같은 행 목록에 대한 변환 속도(rows/sec)를 비교합니다.
+CSV 읽기와 JSON 직렬화는 양쪽이 같으므로 행 변환만 측정합니다.
+
+사용법:
+    python benchmark_mapping.py
+    python benchmark_mapping.py --rows 500000 --repeat 7
+"""
+
+import argparse
+import gc
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from csv_to_xdm import (
+    DATA_DIR, MAPPINGS_DIR, customer_row_to_xdm, order_item_row_to_xdm, order_row_to_xdm,
+    product_row_to_xdm, read_csv_rows, web_event_row_to_xdm,
+)
+from xdm_mapping import load_mapping
+
+# 스펙 파일 → 같은 입력을 변환하는 손으로 작성한 함수
+HAND_WRITTEN: Dict[str, Callable[..., Optional[dict]]] = {
+    "customer.json": customer_row_to_xdm,
+    "order.json": order_row_to_xdm,
+    "web-events.json": web_event_row_to_xdm,
+    "product.json": product_row_to_xdm,
+}
+HAND_WRITTEN_JOIN = {"order.json": order_item_row_to_xdm}
+
+
+def _without_created_at(record: Optional[dict]) -> Optional[dict]:
+    """변환 시각(createdAt)은 매번 달라지므로 비교에서 제외"""
+    if record and "createdAt" in record.get("_rtcdpDemo", {}):
+        record = {**record, "_rtcdpDemo": {**record["_rtcdpDemo"], "createdAt": None}}
+    return record
+
+
+def _load_rows(csv_path: Path, count: int) -> List[Dict[str, str]]:
+    """CSV 행을 count개가 될 때까지 반복하여 메모리에 올림"""
+    rows = list(read_csv_rows(csv_path))
+    if not rows:
+        return rows
+    return [rows[i % len(rows)] for i in range(max(count, len(rows)))]
+
+
+def _run(fn: Callable[..., Optional[dict]], args: List[tuple]) -> float:
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for a in args:
+            fn(*a)
+        return time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def _compare(label: str, hand: Callable, compiled: Callable, args: List[tuple], repeat: int) -> bool:
+    matches = all(
+        _without_created_at(hand(*a)) == _without_created_at(compiled(*a)) for a in args[:10000]
+    )
+    # 번갈아 측정하여 CPU 상태 변화가 한쪽에만 반영되지 않게 함
+    hand_best = compiled_best = float("inf")
+    for _ in range(repeat):
+        hand_best = min(hand_best, _run(hand, args))
+        compiled_best = min(compiled_best, _run(compiled, args))
+    hand_rate, compiled_rate = len(args) / hand_best, len(args) / compiled_best
+    print(f"{label:<28}{'yes' if matches else 'NO':>7}{hand_rate:>16,.0f}{compiled_rate:>16,.0f}"
+          f"{compiled_rate / hand_rate:>9.2f}x")
+    return matches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compiled mapping vs hand-written converter benchmark")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="CSV 입력 폴더")
+    parser.add_argument("--mappings", type=Path, default=MAPPINGS_DIR, help="매핑 스펙 폴더")
+    parser.add_argument("--rows", type=int, default=200000, help="측정에 사용할 행 수 (샘플 행 반복)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args(argv)
+
+    print(f"{'mapping':<28}{'match':>7}{'hand rows/s':>16}{'compiled rows/s':>16}{'ratio':>10}")
+    ok = True
+    for spec_name, hand in HAND_WRITTEN.items():
+        mapping = load_mapping(args.mappings / spec_name)
+        rows = _load_rows(args.data_dir / mapping.source, args.rows)
+        if mapping.join is None:
+            ok &= _compare(spec_name, hand, mapping.transform, [(row,) for row in rows], args.repeat)
+            continue
+
+        join_rows = _load_rows(args.data_dir / mapping.join.source, args.rows)
+        ok &= _compare(f"{spec_name} (join)", HAND_WRITTEN_JOIN[spec_name], mapping.join.transform,
+                       [(row,) for row in join_rows], args.repeat)
+        items = [HAND_WRITTEN_JOIN[spec_name](row) for row in join_rows[:3]]
+        ok &= _compare(spec_name, hand, mapping.transform, [(row, items) for row in rows], args.repeat)
+
+    if not ok:
+        raise SystemExit("compiled mapping output differs from hand-written converter")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+CSV 정렬-병합 조인
+두 CSV를 키 컬럼 순서로 읽어 한 번에 병합하며, 정렬되지 않은 입력은 메모리 한도만큼씩
+정렬한 런(run)을 디스크에 쓴 뒤 병합하여 입력 크기와 관계없이 메모리 사용량을 제한
+"""
+
+import csv
+import heapq
+import itertools
+import os
+import pickle
+import sys
+import tempfile
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+Row = Dict[str, str]
+
+# 기본 정렬 메모리 한도 (바이트)
+DEFAULT_MEMORY_BUDGET = 256 << 20
+# 한 번에 병합하는 런 파일 수 (넘으면 여러 단계로 병합)
+MERGE_FAN_IN = 64
+# 런 파일에 한 번에 pickle하는 행 수
+SPILL_BLOCK_ROWS = 1024
+
+
+def read_rows(csv_path: Path) -> Iterator[Row]:
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def is_sorted_by(csv_path: Path, key: str) -> bool:
+    """key 컬럼이 파일 순서대로 오름차순(문자열 비교)인지 확인 (정렬되지 않았으면 처음 어긋난 곳에서 중단)"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if key not in header:
+            raise ValueError(f"{csv_path.name}에 '{key}' 컬럼이 없습니다")
+        index = header.index(key)
+        previous = None
+        for row in reader:
+            if not row:
+                continue
+            value = row[index] if index < len(row) else ''
+            if previous is not None and value < previous:
+                return False
+            previous = value
+    return True
+
+
+def _row_size(row: Row) -> int:
+    """메모리 한도 계산용 행 크기 추정 (dict + 값 문자열)"""
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+
+def _write_run(rows: Iterator[Row], directory: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        while True:
+            block = list(itertools.islice(rows, SPILL_BLOCK_ROWS))
+            if not block:
+                break
+            pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str) -> Iterator[Row]:
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def _merge_runs(paths: List[str], key: str) -> Iterator[Row]:
+    """
+    정렬된 런 파일 병합
+
+    heapq.merge는 키가 같으면 앞 런의 행을 먼저 내보내고, 런은 파일 순서대로 만들어지므로
+    같은 키의 행은 원래 파일 순서를 유지합니다.
+    """
+    return heapq.merge(*(_read_run(path) for path in paths), key=itemgetter(key))
+
+
+def iter_sorted_rows(csv_path: Path, key: str, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                     tmp_dir: Optional[Path] = None) -> Iterator[Row]:
+    """
+    key 컬럼 순으로 정렬된 CSV 행 (같은 키끼리는 파일 순서 유지)
+
+    이미 정렬되어 있으면 파일을 그대로 스트리밍합니다. 아니면 memory_budget 바이트만큼씩
+    읽어 정렬한 런을 tmp_dir에 쓰고, 런이 MERGE_FAN_IN개를 넘으면 단계별로 병합한 뒤
+    마지막 병합 결과를 반환합니다. 런 파일은 순회가 끝나거나 중단되면 삭제됩니다.
+    """
+    if is_sorted_by(csv_path, key):
+        yield from read_rows(csv_path)
+        return
+
+    sort_key = itemgetter(key)
+    with tempfile.TemporaryDirectory(prefix="csv_join_", dir=tmp_dir) as directory:
+        runs: List[str] = []
+        buffer: List[Row] = []
+        size = 0
+        for row in read_rows(csv_path):
+            buffer.append(row)
+            size += _row_size(row)
+            if size >= memory_budget:
+                buffer.sort(key=sort_key)
+                runs.append(_write_run(iter(buffer), directory))
+                buffer, size = [], 0
+        buffer.sort(key=sort_key)
+        if not runs:
+            # 메모리 한도 안에 들어오면 디스크를 쓰지 않음
+            yield from buffer
+            return
+        if buffer:
+            runs.append(_write_run(iter(buffer), directory))
+        del buffer
+        print(f"     {csv_path.name}: not sorted by {key}, spilled {len(runs)} sorted runs", flush=True)
+
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[i:i + MERGE_FAN_IN]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                merged.append(_write_run(_merge_runs(group, key), directory))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+        yield from _merge_runs(runs, key)
+
+
+def sort_merge_join(left_csv: Path, right_csv: Path, key: str,
+                    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                    tmp_dir: Optional[Path] = None) -> Iterator[Tuple[Row, List[Row]]]:
+    """
+    left의 각 행과 같은 key 값을 가진 right 행 목록을 key 순서로 반환
+
+    right에 짝이 없는 left 행은 빈 목록과 함께 반환하고, left에 없는 right 행은 버립니다.
+    두 입력 모두 이미 정렬되어 있으면 정렬 확인 후 파일을 한 번 더 읽는 스트리밍 병합이며,
+    메모리에는 현재 키의 right 행만 남습니다. 정렬이 필요하면 두 입력이 memory_budget을 나눠 씁니다.
+    """
+    budget = memory_budget // 2
+    right_groups = itertools.groupby(iter_sorted_rows(right_csv, key, budget, tmp_dir), itemgetter(key))
+    group_key, group = None, []
+    exhausted = False
+    for row in iter_sorted_rows(left_csv, key, budget, tmp_dir):
+        value = row[key]
+        while not exhausted and (group_key is None or group_key < value):
+            try:
+                group_key, rows = next(right_groups)
+            except StopIteration:
+                exhausted = True
+                group_key, group = None, []
+                break
+            group = list(rows)
+        yield row, (group if group_key == value else [])
@@ -3,23 +3,42 @@
 CSV to XDM JSON 변환 스크립트
 
 samples/data/ 폴더의 CSV 파일들을 AEP에 수집 가능한 XDM JSON 형식으로 변환합니다.
+레코드를 한 건씩 변환해 바로 파일에 쓰므로 입력 크기와 관계없이 메모리 사용량이 일정합니다.
 
 사용법:
-    python csv_to_xdm.py
+    python csv_to_xdm.py                      # NDJSON (한 줄에 레코드 하나)
+    python csv_to_xdm.py --format json        # JSON 배열 (공백 없는 compact 형식)
+    python csv_to_xdm.py --format json --pretty
+    python csv_to_xdm.py --data-dir ./extracts --output-dir ./out
+    python csv_to_xdm.py --workers 0          # CPU 코어 수만큼 프로세스로 청크 병렬 변환
+    python csv_to_xdm.py --workers 8 --parts  # 청크마다 part-NNNNN 파일로 저장
+    python csv_to_xdm.py --format parquet --compression zstd   # Parquet (pyarrow 필요)
 
 출력:
-    schemas/ 폴더에 XDM JSON 파일 생성
-    - customer-data.json
-    - order-data.json
-    - web-events-data.json
-    - product-data.json
+    schemas/ 폴더에 XDM 파일 생성 (확장자는 형식에 따라 .ndjson / .json / .parquet)
+    - customer-data
+    - order-data
+    - web-events-data
+    - product-data
 """
 
+import argparse
 import csv
+import io
 import json
 import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from csv_join import DEFAULT_MEMORY_BUDGET, sort_merge_join
+from xdm_mapping import CompiledMapping, load_mappings
+from xdm_parquet import (
+    COMPRESSIONS, DEFAULT_COMPRESSION, DEFAULT_ROW_GROUP_SIZE, ParquetWriter, load_arrow_schema, require_pyarrow,
+)
 
 
 # 경로 설정
@@ -27,9 +46,58 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 DATA_DIR = PROJECT_DIR.parent.parent / "samples" / "data"
 OUTPUT_DIR = PROJECT_DIR / "schemas"
+MAPPINGS_DIR = PROJECT_DIR / "mappings"
+SCHEMAS_DIR = PROJECT_DIR / "schemas"
+
+# 출력 이름 → Parquet 스키마를 만들 XDM 스키마 파일 (SCHEMAS_DIR 기준)
+SCHEMA_FILES = {
+    "customer-data": "profile-schema.json",
+    "order-data": "commerce-event-schema.json",
+    "web-events-data": "web-event-schema.json",
+    "product-data": "product-lookup-schema.json",
+}
+
+
+def read_csv_rows(csv_path: Path) -> Iterator[Dict[str, str]]:
+    """CSV 행을 하나씩 읽어 반환 (파일 전체를 메모리에 올리지 않음)"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def customer_row_to_xdm(row: Dict[str, str]) -> dict:
+    """customer.csv 한 행 → XDM Profile 레코드"""
+    # 날짜 형식 변환 (YYYY-MM-DD → ISO 8601)
+    join_date = row['join_date']
+    if join_date and 'T' not in join_date:
+        join_date = f"{join_date}T00:00:00Z"
+
+    return {
+        "person": {
+            "name": {
+                "firstName": row['first_name'],
+                "lastName": row['last_name']
+            }
+        },
+        "personalEmail": {
+            "address": row['email']
+        },
+        "mobilePhone": {
+            "number": row['phone']
+        },
+        "_rtcdpDemo": {
+            "customerId": row['customer_id'],
+            "loyaltyPoints": int(row['loyalty_points']),
+            "membershipStatus": row['membership_status'],
+            "joinDate": join_date,
+            "address": {
+                "city": row['city'],
+                "country": row['country']
+            }
+        }
+    }
 
 
-def convert_customer_to_xdm(csv_path: Path) -> list:
+def convert_customer_to_xdm(csv_path: Path) -> Iterator[dict]:
     """
     customer.csv를 XDM Profile JSON으로 변환
 
@@ -47,49 +115,69 @@ def convert_customer_to_xdm(csv_path: Path) -> list:
         - membership_status → _rtcdpDemo.membershipStatus
         - join_date → _rtcdpDemo.joinDate
     """
-    records = []
+    for row in read_csv_rows(csv_path):
+        yield customer_row_to_xdm(row)
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # 날짜 형식 변환 (YYYY-MM-DD → ISO 8601)
-            join_date = row['join_date']
-            if join_date and 'T' not in join_date:
-                join_date = f"{join_date}T00:00:00Z"
-
-            xdm_record = {
-                "person": {
-                    "name": {
-                        "firstName": row['first_name'],
-                        "lastName": row['last_name']
-                    }
-                },
-                "personalEmail": {
-                    "address": row['email']
-                },
-                "mobilePhone": {
-                    "number": row['phone']
-                },
-                "_rtcdpDemo": {
-                    "customerId": row['customer_id'],
-                    "loyaltyPoints": int(row['loyalty_points']),
-                    "membershipStatus": row['membership_status'],
-                    "joinDate": join_date,
-                    "address": {
-                        "city": row['city'],
-                        "country": row['country']
-                    }
-                }
-            }
-            records.append(xdm_record)
 
-    return records
+def order_item_row_to_xdm(row: Dict[str, str]) -> dict:
+    """order_item.csv 한 행 → productListItems 항목"""
+    return {
+        "SKU": row['product_id'],
+        "quantity": int(row['quantity']),
+        "priceTotal": float(row['total_price']),
+        "currencyCode": "USD"
+    }
 
 
-def convert_orders_to_xdm(orders_csv: Path, items_csv: Path) -> list:
+def order_row_to_xdm(row: Dict[str, str], items: list) -> dict:
+    """order.csv 한 행 + 해당 주문의 productListItems → XDM Commerce Event 레코드"""
+    order_id = row['order_id']
+
+    # 날짜 형식 변환
+    order_date = row['order_date']
+    if order_date and 'T' not in order_date:
+        order_date = f"{order_date}T00:00:00Z"
+
+    return {
+        "_id": f"commerce-{order_id}",
+        "timestamp": order_date,
+        "eventType": "commerce.purchases",
+        "identityMap": {
+            "CustomerID": [{
+                "id": row['customer_id'],
+                "primary": True,
+                "authenticatedState": "authenticated"
+            }]
+        },
+        "commerce": {
+            "order": {
+                "purchaseID": order_id,
+                "priceTotal": float(row['total_amount']),
+                "currencyCode": "USD"
+            },
+            "purchases": {
+                "value": 1
+            }
+        },
+        "productListItems": items,
+        "_rtcdpDemo": {
+            "orderId": order_id,
+            "orderStatus": row['status'],
+            "paymentMethod": row['payment_method'],
+            "shippingAddress": row['shipping_address']
+        }
+    }
+
+
+def convert_orders_to_xdm(orders_csv: Path, items_csv: Path, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                          tmp_dir: Optional[Path] = None) -> Iterator[dict]:
     """
     order.csv + order_item.csv를 XDM Experience Event JSON으로 변환
 
+    두 파일을 order_id 순서로 정렬-병합 조인하므로 주문 항목 전체를 메모리에 올리지 않습니다
+    (csv_join.sort_merge_join). 정렬되지 않은 입력은 memory_budget 단위로 디스크에 정렬한 뒤 병합하며,
+    이때 출력 순서는 order_id 순입니다.
+
     order.csv 컬럼:
         order_id, customer_id, order_date, total_amount, status,
         payment_method, shipping_address
@@ -108,68 +196,78 @@ def convert_orders_to_xdm(orders_csv: Path, items_csv: Path) -> list:
         - status → _rtcdpDemo.orderStatus
         - payment_method → _rtcdpDemo.paymentMethod
     """
-    # order_item을 order_id로 그룹핑
-    items_by_order = {}
-    with open(items_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            order_id = row['order_id']
-            if order_id not in items_by_order:
-                items_by_order[order_id] = []
-            items_by_order[order_id].append({
-                "SKU": row['product_id'],
-                "quantity": int(row['quantity']),
-                "priceTotal": float(row['total_price']),
-                "currencyCode": "USD"
-            })
-
-    # 주문 레코드 생성
-    records = []
-    with open(orders_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            order_id = row['order_id']
-
-            # 날짜 형식 변환
-            order_date = row['order_date']
-            if order_date and 'T' not in order_date:
-                order_date = f"{order_date}T00:00:00Z"
-
-            xdm_record = {
-                "_id": f"commerce-{order_id}",
-                "timestamp": order_date,
-                "eventType": "commerce.purchases",
-                "identityMap": {
-                    "CustomerID": [{
-                        "id": row['customer_id'],
-                        "primary": True,
-                        "authenticatedState": "authenticated"
-                    }]
-                },
-                "commerce": {
-                    "order": {
-                        "purchaseID": order_id,
-                        "priceTotal": float(row['total_amount']),
-                        "currencyCode": "USD"
-                    },
-                    "purchases": {
-                        "value": 1
-                    }
-                },
-                "productListItems": items_by_order.get(order_id, []),
-                "_rtcdpDemo": {
-                    "orderId": order_id,
-                    "orderStatus": row['status'],
-                    "paymentMethod": row['payment_method'],
-                    "shippingAddress": row['shipping_address']
+    # 주문별 order_item 행을 병합하며 주문 레코드 생성
+    for row, item_rows in sort_merge_join(orders_csv, items_csv, 'order_id', memory_budget, tmp_dir):
+        yield order_row_to_xdm(row, [order_item_row_to_xdm(item) for item in item_rows])
+
+
+# eventType 매핑
+EVENT_TYPE_MAP = {
+    "page_view": "web.webpagedetails.pageViews",
+    "add_to_cart": "commerce.productListAdds",
+    "purchase": "commerce.purchases",
+    "product_view": "commerce.productViews"
+}
+
+
+def web_event_row_to_xdm(row: Dict[str, str]) -> Optional[dict]:
+    """sample-web-events.csv 한 행 → XDM Web Event 레코드 (빈 행이면 None)"""
+    # 빈 행 스킵
+    if not row.get('eventId'):
+        return None
+
+    # eventType 변환
+    raw_event_type = row['eventType']
+    xdm_event_type = EVENT_TYPE_MAP.get(raw_event_type, f"web.{raw_event_type}")
+
+    xdm_record = {
+        "_id": f"web-{row['eventId']}",
+        "timestamp": row['timestamp'],
+        "eventType": xdm_event_type,
+        "identityMap": {
+            "ECID": [{
+                "id": row['personId'],
+                "primary": True,
+                "authenticatedState": "ambiguous"
+            }]
+        },
+        "web": {
+            "webPageDetails": {
+                "URL": row['pageUrl'],
+                "name": row['pageName'],
+                "pageViews": {
+                    "value": 1 if raw_event_type == "page_view" else 0
                 }
             }
-            records.append(xdm_record)
+        },
+        "device": {
+            "type": row['device']
+        },
+        "_rtcdpDemo": {
+            "eventId": row['eventId'],
+            "eventType": raw_event_type
+        }
+    }
+
+    # 리퍼러 URL (있는 경우에만)
+    if row.get('referrerUrl'):
+        xdm_record["web"]["webReferrer"] = {
+            "URL": row['referrerUrl']
+        }
+
+    # 브라우저 뷰포트 정보 (있는 경우에만)
+    if row.get('browserWidth') and row.get('browserHeight'):
+        xdm_record["environment"] = {
+            "browserDetails": {
+                "viewportWidth": int(row['browserWidth']),
+                "viewportHeight": int(row['browserHeight'])
+            }
+        }
 
-    return records
+    return xdm_record
 
 
-def convert_web_events_to_xdm(csv_path: Path) -> list:
+def convert_web_events_to_xdm(csv_path: Path) -> Iterator[dict]:
     """
     sample-web-events.csv를 XDM Experience Event JSON으로 변환
 
@@ -188,77 +286,30 @@ def convert_web_events_to_xdm(csv_path: Path) -> list:
         - device → device.type
         - browserWidth/Height → environment.browserDetails
     """
-    records = []
-
-    # eventType 매핑
-    event_type_map = {
-        "page_view": "web.webpagedetails.pageViews",
-        "add_to_cart": "commerce.productListAdds",
-        "purchase": "commerce.purchases",
-        "product_view": "commerce.productViews"
+    for row in read_csv_rows(csv_path):
+        xdm_record = web_event_row_to_xdm(row)
+        if xdm_record is not None:
+            yield xdm_record
+
+
+def product_row_to_xdm(row: Dict[str, str]) -> dict:
+    """product.csv 한 행 → XDM Lookup 레코드"""
+    return {
+        "_rtcdpDemo": {
+            "productId": row['product_id'],
+            "productName": row['name'],
+            "category": row['category'],
+            "price": float(row['price']),
+            "stockQuantity": int(row['stock_quantity']),
+            "description": row['description'],
+            "brand": row['brand'],
+            "isActive": True,
+            "createdAt": datetime.now().isoformat() + "Z"
+        }
     }
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # 빈 행 스킵
-            if not row.get('eventId'):
-                continue
-
-            # eventType 변환
-            raw_event_type = row['eventType']
-            xdm_event_type = event_type_map.get(raw_event_type, f"web.{raw_event_type}")
-
-            xdm_record = {
-                "_id": f"web-{row['eventId']}",
-                "timestamp": row['timestamp'],
-                "eventType": xdm_event_type,
-                "identityMap": {
-                    "ECID": [{
-                        "id": row['personId'],
-                        "primary": True,
-                        "authenticatedState": "ambiguous"
-                    }]
-                },
-                "web": {
-                    "webPageDetails": {
-                        "URL": row['pageUrl'],
-                        "name": row['pageName'],
-                        "pageViews": {
-                            "value": 1 if raw_event_type == "page_view" else 0
-                        }
-                    }
-                },
-                "device": {
-                    "type": row['device']
-                },
-                "_rtcdpDemo": {
-                    "eventId": row['eventId'],
-                    "eventType": raw_event_type
-                }
-            }
-
-            # 리퍼러 URL (있는 경우에만)
-            if row.get('referrerUrl'):
-                xdm_record["web"]["webReferrer"] = {
-                    "URL": row['referrerUrl']
-                }
-
-            # 브라우저 뷰포트 정보 (있는 경우에만)
-            if row.get('browserWidth') and row.get('browserHeight'):
-                xdm_record["environment"] = {
-                    "browserDetails": {
-                        "viewportWidth": int(row['browserWidth']),
-                        "viewportHeight": int(row['browserHeight'])
-                    }
-                }
-
-            records.append(xdm_record)
-
-    return records
 
-
-def convert_products_to_xdm(csv_path: Path) -> list:
+def convert_products_to_xdm(csv_path: Path) -> Iterator[dict]:
     """
     product.csv를 XDM Lookup JSON으로 변환
 
@@ -274,87 +325,446 @@ def convert_products_to_xdm(csv_path: Path) -> list:
         - description → _rtcdpDemo.description
         - brand → _rtcdpDemo.brand
     """
-    records = []
+    for row in read_csv_rows(csv_path):
+        yield product_row_to_xdm(row)
+
+
+def convert_with_mapping(mapping: CompiledMapping, data_dir: Path, memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                         tmp_dir: Optional[Path] = None) -> Iterator[dict]:
+    """
+    매핑 스펙(xdm_mapping)으로 CSV 변환
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    스펙에 join이 있으면 join 대상 CSV를 on 컬럼 기준으로 정렬-병합 조인하여 각 행의 joined 필드에 넣습니다.
+    """
+    csv_path = data_dir / mapping.source
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
         reader = csv.DictReader(f)
-        for row in reader:
-            xdm_record = {
-                "_rtcdpDemo": {
-                    "productId": row['product_id'],
-                    "productName": row['name'],
-                    "category": row['category'],
-                    "price": float(row['price']),
-                    "stockQuantity": int(row['stock_quantity']),
-                    "description": row['description'],
-                    "brand": row['brand'],
-                    "isActive": True,
-                    "createdAt": datetime.now().isoformat() + "Z"
-                }
-            }
-            records.append(xdm_record)
+        mapping.check_columns(reader.fieldnames or [], csv_path)
+        transform = mapping.transform
+        if mapping.join is None:
+            for row in reader:
+                record = transform(row)
+                if record is not None:
+                    yield record
+            return
+
+        join_path = data_dir / mapping.join.source
+        with open(join_path, 'r', encoding='utf-8', newline='') as jf:
+            mapping.join.check_columns(next(csv.reader(jf), []), join_path)
+        transform_item = mapping.join.transform
+        for row, item_rows in sort_merge_join(csv_path, join_path, mapping.join_on, memory_budget, tmp_dir):
+            items = [item for item in map(transform_item, item_rows) if item is not None]
+            record = transform(row, items)
+            if record is not None:
+                yield record
+
+
+class NDJSONWriter:
+    """레코드를 한 줄에 하나씩 쓰는 NDJSON 작성기"""
+
+    extension = ".ndjson"
+
+    def __init__(self, output_path: Path, pretty: bool = False):
+        self.output_path = output_path
+        self.pretty = pretty
+        self.file = open(output_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    @staticmethod
+    def encode(record: dict, pretty: bool = False) -> str:
+        """레코드 하나를 이 형식의 문자열로 직렬화 (병렬 변환 시 작업 프로세스에서 호출)"""
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+    def write(self, record: dict):
+        self.write_encoded([self.encode(record, self.pretty)])
+
+    def write_encoded(self, texts: List[str]):
+        """encode()로 직렬화한 레코드 여러 개를 한 번에 기록"""
+        if texts:
+            self.file.write('\n'.join(texts))
+            self.file.write('\n')
+            self.count += len(texts)
+
+    def close(self):
+        self.file.close()
+
+
+class JSONArrayWriter(NDJSONWriter):
+    """레코드를 JSON 배열로 이어 쓰는 작성기 (pretty=True면 들여쓰기 2칸)"""
+
+    extension = ".json"
+
+    def __init__(self, output_path: Path, pretty: bool = False):
+        super().__init__(output_path, pretty=pretty)
+        self.file.write('[')
+
+    @staticmethod
+    def encode(record: dict, pretty: bool = False) -> str:
+        if pretty:
+            text = json.dumps(record, indent=2, ensure_ascii=False)
+            return '\n  ' + text.replace('\n', '\n  ')
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+    def write_encoded(self, texts: List[str]):
+        if texts:
+            if self.count:
+                self.file.write(',')
+            self.file.write(','.join(texts))
+            self.count += len(texts)
+
+    def close(self):
+        self.file.write('\n]\n' if self.pretty and self.count else ']\n')
+        self.file.close()
+
+
+WRITERS = {
+    "ndjson": NDJSONWriter,
+    "json": JSONArrayWriter,
+    "parquet": ParquetWriter,
+}
+
+
+class Progress:
+    """변환 진행 상황 출력 (interval초마다 누적 건수와 rows/sec)"""
+
+    def __init__(self, label: str, interval: float = 5.0):
+        self.label = label
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.count = 0
+
+    def update(self, count: int = 1):
+        self.count += count
+        now = time.perf_counter()
+        if self.interval and now - self.last_report >= self.interval:
+            self.last_report = now
+            print(f"     {self.label}: {self.count:,} records ({self.rate():,.0f} rows/sec)", flush=True)
+
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+
+def write_records(records: Iterable[dict], output_path: Path, fmt: str = "ndjson",
+                  pretty: bool = False, progress_interval: float = 5.0,
+                  writer_options: Optional[Dict[str, Any]] = None) -> int:
+    """
+    레코드 스트림을 파일에 저장
 
-    return records
+    레코드를 받는 즉시 기록하므로 (Parquet은 행 그룹 단위) 전체 목록을 메모리에 모으지 않습니다.
+    writer_options는 작성기 생성자에 전달됩니다 (예: Parquet schema, compression).
+    저장한 레코드 수를 반환합니다.
+    """
+    writer = WRITERS[fmt](output_path, pretty=pretty, **(writer_options or {}))
+    progress = Progress(output_path.name, progress_interval)
+    try:
+        for record in records:
+            writer.write(record)
+            progress.update()
+    finally:
+        writer.close()
+    print(f"  -> {output_path.name}: {writer.count:,} records "
+          f"({time.perf_counter() - progress.started:.2f}s, {progress.rate():,.0f} rows/sec)")
+    return writer.count
+
+
+# 병렬 변환
+def iter_record_boundaries(csv_path: Path, chunk_size: int, block_size: int = 1 << 20) -> Iterator[int]:
+    """
+    chunk_size 바이트마다 가장 가까운 레코드 경계 오프셋을 반환
 
+    레코드 경계는 따옴표 밖에 있는 줄바꿈 바로 다음 위치입니다. 파일을 블록 단위로 읽으며
+    따옴표 개수의 홀짝으로 필드 안의 줄바꿈을 구분하므로 (이스케이프된 ""는 두 번 세어져 상쇄)
+    여러 줄에 걸친 필드가 청크 사이에서 잘리지 않습니다.
+    첫 번째 값은 헤더 행의 끝, 마지막 값은 파일 크기입니다.
+    """
+    target = 0
+    last = 0
+    in_quotes = False
+    with open(csv_path, 'rb') as f:
+        base = 0
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            i = 0
+            while True:
+                if base + len(block) <= target:
+                    # 목표 위치 전까지는 따옴표 개수만 셈
+                    in_quotes ^= bool(block.count(b'"', i) & 1)
+                    break
+                j = max(i, target - base)
+                in_quotes ^= bool(block.count(b'"', i, j) & 1)
+                k = block.find(b'\n', j)
+                if k < 0:
+                    in_quotes ^= bool(block.count(b'"', j) & 1)
+                    break
+                in_quotes ^= bool(block.count(b'"', j, k) & 1)
+                i = k + 1
+                if not in_quotes:
+                    last = base + i
+                    yield last
+                    target = last + chunk_size
+            base += len(block)
+    if base > last:
+        yield base
+
+
+class ChunkTask(NamedTuple):
+    """작업 프로세스에 전달하는 CSV 청크 변환 작업"""
+    csv_path: Path
+    start: int
+    end: int
+    fieldnames: List[str]
+    row_to_xdm: Callable[[Dict[str, str]], Optional[dict]]
+    writer_cls: type
+    pretty: bool
+    part_path: Optional[Path] = None
+    writer_options: Optional[Dict[str, Any]] = None
+
+
+def convert_chunk(task: ChunkTask) -> Tuple[int, List[str]]:
+    """
+    CSV 바이트 구간 하나를 변환 (프로세스 풀에서 실행)
 
-def save_json(data: list, output_path: Path, pretty: bool = True):
-    """JSON 파일 저장"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
-    print(f"  -> {output_path.name}: {len(data)} records")
+    part_path가 있으면 파트 파일에 직접 쓰고 (레코드 수, [])를,
+    없으면 (레코드 수, 직렬화한 레코드 목록)을 반환합니다.
+    """
+    with open(task.csv_path, 'rb') as f:
+        f.seek(task.start)
+        text = f.read(task.end - task.start).decode('utf-8')
+
+    texts = []
+    for row in csv.DictReader(io.StringIO(text, newline=''), fieldnames=task.fieldnames):
+        record = task.row_to_xdm(row)
+        if record is not None:
+            texts.append(task.writer_cls.encode(record, task.pretty))
+
+    if task.part_path is None:
+        return len(texts), texts
+    writer = task.writer_cls(task.part_path, pretty=task.pretty, **(task.writer_options or {}))
+    try:
+        writer.write_encoded(texts)
+    finally:
+        writer.close()
+    return len(texts), []
+
+
+def write_records_parallel(csv_path: Path, row_to_xdm: Callable[[Dict[str, str]], Optional[dict]],
+                           output_path: Path, fmt: str = "ndjson", pretty: bool = False,
+                           workers: int = 2, chunk_size: int = 16 << 20, parts: bool = False,
+                           progress_interval: float = 5.0,
+                           writer_options: Optional[Dict[str, Any]] = None) -> int:
+    """
+    CSV를 레코드 경계에 맞춘 바이트 청크로 나눠 프로세스 풀에서 변환
 
+    - parts=False: 청크 결과를 입력 순서대로 output_path 하나에 이어 씁니다.
+    - parts=True: 확장자를 뺀 output_path 폴더에 청크마다 part-NNNNN 파일을 씁니다.
 
-def main():
+    동시에 처리 중인 청크는 workers * 2개로 제한하여 느린 기록이 메모리를 늘리지 않게 합니다.
+    저장한 레코드 수를 반환합니다.
+    """
+    writer_cls = WRITERS[fmt]
+    boundaries = iter_record_boundaries(csv_path, chunk_size)
+    header_end = next(boundaries, 0)
+    with open(csv_path, 'rb') as f:
+        header = f.read(header_end).decode('utf-8')
+    fieldnames = next(csv.reader(io.StringIO(header, newline='')), [])
+    if isinstance(row_to_xdm, CompiledMapping):
+        # 작업 프로세스의 KeyError 대신 단일 프로세스 변환과 같은 오류로 알림
+        row_to_xdm.check_columns(fieldnames, csv_path)
+
+    part_dir = output_path.with_suffix('')
+    if parts:
+        part_dir.mkdir(parents=True, exist_ok=True)
+        for stale in part_dir.glob(f"part-*{writer_cls.extension}"):
+            stale.unlink()
+
+    def tasks() -> Iterator[ChunkTask]:
+        start = header_end
+        for index, end in enumerate(boundaries):
+            part_path = part_dir / f"part-{index:05d}{writer_cls.extension}" if parts else None
+            yield ChunkTask(csv_path, start, end, fieldnames, row_to_xdm, writer_cls, pretty, part_path,
+                            writer_options)
+            start = end
+
+    writer = None if parts else writer_cls(output_path, pretty=pretty, **(writer_options or {}))
+    progress = Progress(part_dir.name if parts else output_path.name, progress_interval)
+    chunks = 0
+
+    def collect(future) -> None:
+        nonlocal chunks
+        count, texts = future.result()
+        if writer is not None:
+            writer.write_encoded(texts)
+        chunks += 1
+        progress.update(count)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for task in tasks():
+                pending.append(executor.submit(convert_chunk, task))
+                # 앞선 청크부터 순서대로 기록
+                while len(pending) >= workers * 2 or (pending and pending[0].done()):
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+    finally:
+        if writer is not None:
+            writer.close()
+
+    target = f"{part_dir.name}/ ({chunks} parts)" if parts else output_path.name
+    print(f"  -> {target}: {progress.count:,} records, {workers} workers "
+          f"({time.perf_counter() - progress.started:.2f}s, {progress.rate():,.0f} rows/sec)")
+    return progress.count
+
+
+def positive_int(value: str) -> int:
+    """1 이상의 정수만 허용하는 argparse 타입"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """0 이상의 정수만 허용하는 argparse 타입"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 합니다: {value}")
+    return number
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="CSV to XDM conversion")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="CSV 입력 폴더")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="XDM 출력 폴더")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="ndjson",
+                        help="출력 형식 (ndjson: 한 줄에 레코드 하나, json: JSON 배열, parquet: pyarrow 필요)")
+    parser.add_argument("--pretty", action="store_true", help="JSON 배열을 들여쓰기하여 저장 (--format json)")
+    parser.add_argument("--compression", choices=COMPRESSIONS, default=DEFAULT_COMPRESSION,
+                        help="Parquet 압축 방식 (--format parquet)")
+    parser.add_argument("--row-group-size", type=positive_int, default=DEFAULT_ROW_GROUP_SIZE,
+                        help="Parquet 행 그룹 크기 (행 수, --format parquet)")
+    parser.add_argument("--progress-interval", type=float, default=5.0,
+                        help="진행 상황 출력 간격 (초, 0이면 완료 시에만 출력)")
+    parser.add_argument("--workers", type=non_negative_int, default=1,
+                        help="병렬 변환 프로세스 수 (1: 단일 프로세스, 0: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=positive_int, default=16,
+                        help="병렬 변환 시 청크 크기 (MB)")
+    parser.add_argument("--parts", action="store_true",
+                        help="파일 하나로 합치지 않고 청크마다 part-NNNNN 파일로 저장")
+    parser.add_argument("--join-memory", type=positive_int, default=DEFAULT_MEMORY_BUDGET >> 20,
+                        help="주문/주문 항목 조인 시 정렬 메모리 한도 (MB, 넘으면 디스크에 나눠 정렬)")
+    parser.add_argument("--tmp-dir", type=Path, default=None, help="조인 정렬 임시 파일 폴더 (기본: 시스템 임시 폴더)")
+    parser.add_argument("--mappings", type=Path, nargs="?", const=MAPPINGS_DIR, default=None,
+                        help=f"내장 변환 대신 매핑 스펙 폴더의 모든 스펙으로 변환 (기본 폴더: {MAPPINGS_DIR})")
+    args = parser.parse_args(argv)
+    if args.format == "parquet":
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            parser.error(str(e))
+    return args
+
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
+    data_dir = args.data_dir
+    output_dir = args.output_dir
+    ext = WRITERS[args.format].extension
+    workers = args.workers or os.cpu_count() or 1
+    join_memory = args.join_memory << 20
+
+    def writer_options(name: str, schema_file: Optional[str] = None) -> Dict[str, Any]:
+        """Parquet 출력이면 XDM 스키마 파일에서 만든 Arrow 스키마와 압축/행 그룹 설정"""
+        if args.format != "parquet":
+            return {}
+        schema_file = schema_file or SCHEMA_FILES.get(name)
+        return {
+            "schema": load_arrow_schema(SCHEMAS_DIR / schema_file) if schema_file else None,
+            "compression": args.compression,
+            "row_group_size": args.row_group_size,
+        }
+
+    def save(records: Iterable[dict], name: str, schema_file: Optional[str] = None):
+        write_records(records, output_dir / f"{name}{ext}", args.format,
+                      pretty=args.pretty, progress_interval=args.progress_interval,
+                      writer_options=writer_options(name, schema_file))
+
+    def save_rows(csv_path: Path, row_to_xdm: Callable[[Dict[str, str]], Optional[dict]],
+                  convert: Callable[[Path], Iterable[dict]], name: str, schema_file: Optional[str] = None):
+        """행 단위로 변환되는 입력은 --workers/--parts 지정 시 청크 단위 병렬 변환"""
+        if workers > 1 or args.parts:
+            write_records_parallel(csv_path, row_to_xdm, output_dir / f"{name}{ext}", args.format,
+                                   pretty=args.pretty, workers=workers, chunk_size=args.chunk_size << 20,
+                                   parts=args.parts, progress_interval=args.progress_interval,
+                                   writer_options=writer_options(name, schema_file))
+        else:
+            save(convert(csv_path), name, schema_file)
+
     print("=" * 60)
-    print("CSV to XDM JSON Conversion")
+    print("CSV to XDM Conversion")
     print("=" * 60)
-    print(f"Data source: {DATA_DIR}")
-    print(f"Output folder: {OUTPUT_DIR}")
+    print(f"Data source: {data_dir}")
+    print(f"Output folder: {output_dir}")
+    print(f"Format: {args.format}")
+    if workers > 1 or args.parts:
+        print(f"Workers: {workers} (chunk size {args.chunk_size} MB)")
     print()
 
     # Create output folder
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    # 1. Customer Profiles
-    print("[1/4] Converting Customer Profiles...")
-    customer_csv = DATA_DIR / "customer.csv"
-    if customer_csv.exists():
-        customers = convert_customer_to_xdm(customer_csv)
-        save_json(customers, OUTPUT_DIR / "customer-data.json")
-    else:
-        print(f"  [!] File not found: {customer_csv}")
-
-    # 2. Commerce Events (Orders)
-    print("[2/4] Converting Commerce Events...")
-    orders_csv = DATA_DIR / "order.csv"
-    items_csv = DATA_DIR / "order_item.csv"
-    if orders_csv.exists() and items_csv.exists():
-        orders = convert_orders_to_xdm(orders_csv, items_csv)
-        save_json(orders, OUTPUT_DIR / "order-data.json")
-    else:
-        print("  [!] File not found: order.csv or order_item.csv")
-
-    # 3. Web Events
-    print("[3/4] Converting Web Events...")
-    web_events_csv = DATA_DIR / "sample-web-events.csv"
-    if web_events_csv.exists():
-        web_events = convert_web_events_to_xdm(web_events_csv)
-        save_json(web_events, OUTPUT_DIR / "web-events-data.json")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.mappings is not None:
+        # 매핑 스펙으로 변환 (스펙 파일만 추가하면 새 입력도 변환 가능)
+        mappings = load_mappings(args.mappings)
+        for index, mapping in enumerate(mappings, 1):
+            print(f"[{index}/{len(mappings)}] Converting {mapping.source} ({mapping.origin})...")
+            csv_path = data_dir / mapping.source
+            if not csv_path.exists():
+                print(f"  [!] File not found: {csv_path}")
+            elif mapping.join is None:
+                save_rows(csv_path, mapping, lambda _, m=mapping: convert_with_mapping(m, data_dir),
+                          mapping.output, mapping.schema)
+            else:
+                save(convert_with_mapping(mapping, data_dir, join_memory, args.tmp_dir), mapping.output, mapping.schema)
     else:
-        print(f"  [!] File not found: {web_events_csv}")
-
-    # 4. Products (Lookup)
-    print("[4/4] Converting Products...")
-    products_csv = DATA_DIR / "product.csv"
-    if products_csv.exists():
-        products = convert_products_to_xdm(products_csv)
-        save_json(products, OUTPUT_DIR / "product-data.json")
-    else:
-        print(f"  [!] File not found: {products_csv}")
+        # 1. Customer Profiles
+        print("[1/4] Converting Customer Profiles...")
+        customer_csv = data_dir / "customer.csv"
+        if customer_csv.exists():
+            save_rows(customer_csv, customer_row_to_xdm, convert_customer_to_xdm, "customer-data")
+        else:
+            print(f"  [!] File not found: {customer_csv}")
+
+        # 2. Commerce Events (Orders)
+        print("[2/4] Converting Commerce Events...")
+        orders_csv = data_dir / "order.csv"
+        items_csv = data_dir / "order_item.csv"
+        if orders_csv.exists() and items_csv.exists():
+            save(convert_orders_to_xdm(orders_csv, items_csv, join_memory, args.tmp_dir), "order-data")
+        else:
+            print("  [!] File not found: order.csv or order_item.csv")
+
+        # 3. Web Events
+        print("[3/4] Converting Web Events...")
+        web_events_csv = data_dir / "sample-web-events.csv"
+        if web_events_csv.exists():
+            save_rows(web_events_csv, web_event_row_to_xdm, convert_web_events_to_xdm, "web-events-data")
+        else:
+            print(f"  [!] File not found: {web_events_csv}")
+
+        # 4. Products (Lookup)
+        print("[4/4] Converting Products...")
+        products_csv = data_dir / "product.csv"
+        if products_csv.exists():
+            save_rows(products_csv, product_row_to_xdm, convert_products_to_xdm, "product-data")
+        else:
+            print(f"  [!] File not found: {products_csv}")
 
     print()
     print("=" * 60)
@@ -364,7 +774,7 @@ def main():
     print("Next steps:")
     print("1. Create schemas in AEP UI")
     print("2. Create datasets")
-    print("3. Upload generated JSON files to datasets")
+    print("3. Upload generated files to datasets")
 
 
 if __name__ == "__main__":
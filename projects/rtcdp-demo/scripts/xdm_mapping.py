@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+CSV → XDM 선언형 매핑 엔진
+
+매핑 스펙(JSON/YAML)에 적힌 컬럼 → XDM 경로 규칙을 한 번만 해석하여 행 변환 함수의
+파이썬 소스를 생성하고 컴파일합니다. 행마다 스펙을 해석하지 않으므로 손으로 작성한
+변환 함수와 같은 형태의 코드가 실행됩니다.
+
+스펙 형식:
+    {
+      "output": "web-events-data",          # 출력 파일 이름 (확장자 제외)
+      "source": "sample-web-events.csv",    # 입력 CSV (데이터 폴더 기준)
+      "schema": "web-event-schema.json",    # (선택) Parquet 출력 시 사용할 XDM 스키마 (schemas/ 기준)
+      "required": ["eventId"],              # 비어 있으면 행을 건너뛰는 컬럼
+      "fields": {                           # XDM 경로 → 값 (스펙 순서대로 키 생성)
+        "_id": {"template": "web-{eventId}"},
+        "timestamp": "timestamp",           # 문자열은 컬럼 이름
+        "identityMap.ECID[].id": "personId",  # [] 는 객체 하나를 담은 목록
+        "_rtcdpDemo.loyaltyPoints": {"column": "loyalty_points", "type": "int"},
+        "web.webReferrer.URL": {"column": "referrerUrl", "optional": true}
+      },
+      "join": {                             # (선택) 다른 CSV의 행을 키로 묶어 목록 필드로 포함
+        "source": "order_item.csv", "on": "order_id", "fields": {...}
+      }
+    }
+
+값 규칙:
+    - column: 컬럼 값 (문자열 하나만 쓰면 column의 축약형)
+    - map / default: 값 변환표와 표에 없을 때의 값 (default가 객체이면 값 규칙으로 계산)
+    - type: map 적용 후 형 변환 (int, float, bool, str, date: YYYY-MM-DD → YYYY-MM-DDT00:00:00Z)
+    - value: 상수, template: "{컬럼}" 치환 문자열, now: 변환 시각, joined: join으로 묶은 목록
+    - when: 나열한 컬럼이 모두 비어 있지 않을 때만 필드 생성 (optional: true 는 자기 컬럼 기준)
+      조건부 필드는 조건 없는 필드 다음에 추가됩니다.
+
+사용법:
+    python xdm_mapping.py ../mappings/web-events.json   # 생성된 변환 함수 소스 출력
+"""
+
+import json
+import linecache
+import string
+import sys
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:  # YAML 스펙을 쓰지 않으면 필요 없음
+    yaml = None
+
+
+SPEC_KEYS = {"output", "source", "schema", "description", "required", "fields", "join"}
+JOIN_KEYS = {"source", "on", "fields"}
+FIELD_KEYS = {"column", "type", "map", "default", "value", "template", "now", "joined", "when", "optional"}
+
+# bool 변환 시 참으로 보는 값
+TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+# 형 변환 (값 식 → 변환 식), date는 임시 변수를 받음
+CASTS: Dict[str, Callable[..., str]] = {
+    "str": lambda expr, tmp: expr,
+    "int": lambda expr, tmp: f"int({expr})",
+    "float": lambda expr, tmp: f"float({expr})",
+    "bool": lambda expr, tmp: f"({expr}.strip().lower() in _TRUE_VALUES)",
+    "date": lambda expr, tmp: f"({tmp} if not ({tmp} := {expr}) or 'T' in {tmp} else {tmp} + 'T00:00:00Z')",
+}
+
+
+class _CodeContext:
+    """
+    코드 생성 중 사용하는 상수/임시 변수/참조 컬럼 모음
+
+    hoisted에 있는 컬럼은 row[...] 대신 함수 앞에서 한 번 읽어 둔 지역 변수(_rN)로 참조합니다.
+    """
+
+    def __init__(self, name: str, hoisted: Collection[str] = ()):
+        self.name = name
+        self.namespace: Dict[str, Any] = {"datetime": datetime, "_TRUE_VALUES": TRUE_VALUES}
+        self.columns: List[str] = []
+        self.reads: Counter = Counter()
+        self.hoisted = hoisted
+        self._temps = 0
+
+    def require(self, column: str) -> None:
+        """참조 컬럼으로 등록 (값은 row.get으로 직접 확인)"""
+        if not isinstance(column, str) or not column:
+            raise ValueError(f"매핑 '{self.name}': 컬럼 이름이 올바르지 않습니다: {column!r}")
+        if column not in self.columns:
+            self.columns.append(column)
+
+    def column(self, column: str) -> str:
+        self.require(column)
+        self.reads[column] += 1
+        if column in self.hoisted:
+            return self.local(column)
+        return f"row[{column!r}]"
+
+    def local(self, column: str) -> str:
+        return f"_r{self.columns.index(column)}"
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def temp(self) -> str:
+        self._temps += 1
+        return f"_v{self._temps}"
+
+
+def _value_expr(rule: Any, ctx: _CodeContext, path: str) -> str:
+    """값 규칙 하나 → 파이썬 식"""
+    if isinstance(rule, str):
+        rule = {"column": rule}
+    if not isinstance(rule, dict):
+        raise ValueError(f"매핑 '{ctx.name}': '{path}' 값 규칙은 컬럼 이름 또는 객체여야 합니다")
+    unknown = set(rule) - FIELD_KEYS
+    if unknown:
+        raise ValueError(f"매핑 '{ctx.name}': '{path}'에 알 수 없는 키: {', '.join(sorted(unknown))}")
+
+    if "value" in rule:
+        return repr(rule["value"])
+    if rule.get("now"):
+        return "datetime.now().isoformat() + 'Z'"
+    if rule.get("joined"):
+        return "joined"
+    if "template" in rule:
+        expr = _template_expr(rule["template"], ctx, path)
+    elif "column" in rule:
+        expr = ctx.column(rule["column"])
+    else:
+        raise ValueError(f"매핑 '{ctx.name}': '{path}'에 column/value/template/now/joined 중 하나가 필요합니다")
+
+    if "map" in rule:
+        table = ctx.constant(dict(rule["map"]))
+        default = rule.get("default")
+        if isinstance(default, dict):
+            tmp = ctx.temp()
+            expr = f"({table}[{tmp}] if ({tmp} := {expr}) in {table} else {_value_expr(default, ctx, path)})"
+        else:
+            expr = f"{table}.get({expr}, {default!r})"
+
+    cast = rule.get("type")
+    if cast is not None:
+        if cast not in CASTS:
+            raise ValueError(f"매핑 '{ctx.name}': '{path}'의 type은 {', '.join(CASTS)} 중 하나여야 합니다")
+        expr = CASTS[cast](expr, ctx.temp())
+    return expr
+
+
+def _template_expr(template: str, ctx: _CodeContext, path: str) -> str:
+    """'web-{eventId}' → 'web-' + row['eventId']"""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            if not field or spec or conversion:
+                raise ValueError(f"매핑 '{ctx.name}': '{path}' 템플릿에는 {{컬럼}} 형태만 쓸 수 있습니다")
+            parts.append(ctx.column(field))
+    return " + ".join(parts) or "''"
+
+
+def _conditions(rule: Any, ctx: _CodeContext, path: str) -> Tuple[str, ...]:
+    if not isinstance(rule, dict):
+        return ()
+    when = rule.get("when") or ()
+    if isinstance(when, str):
+        when = (when,)
+    if rule.get("optional"):
+        if "column" not in rule:
+            raise ValueError(f"매핑 '{ctx.name}': '{path}'의 optional은 column 규칙에만 쓸 수 있습니다")
+        when = (*when, rule["column"])
+    return tuple(dict.fromkeys(when))
+
+
+def _insert(tree: Dict[str, Any], segments: List[str], expr: str, ctx: _CodeContext, path: str) -> None:
+    node = tree
+    for segment in segments[:-1]:
+        child = node.setdefault(segment, {})
+        if not isinstance(child, dict):
+            raise ValueError(f"매핑 '{ctx.name}': '{path}'가 값 필드 '{segment}' 아래에 있습니다")
+        node = child
+    if segments[-1] in node:
+        raise ValueError(f"매핑 '{ctx.name}': '{path}'가 다른 필드와 겹칩니다")
+    node[segments[-1]] = expr
+
+
+def _key(segment: str) -> str:
+    return segment[:-2] if segment.endswith("[]") else segment
+
+
+def _literal(node: Any, indent: int) -> str:
+    """경로 트리 → 중첩 dict 리터럴 소스 ([] 세그먼트는 원소 하나짜리 목록)"""
+    if isinstance(node, str):
+        return node
+    pad = "    " * (indent + 1)
+    lines = []
+    for segment, child in node.items():
+        value = _literal(child, indent + 1)
+        if segment.endswith("[]"):
+            value = f"[{value}]"
+        lines.append(f"{pad}{_key(segment)!r}: {value},")
+    return "{\n" + "\n".join(lines) + "\n" + "    " * indent + "}"
+
+
+def _conditional_assignments(group: Dict[str, Any], static: Optional[Dict[str, Any]], target: str,
+                             prefix: Tuple[str, ...], shared: Counter, indent: int) -> List[str]:
+    """
+    조건부 필드 트리를 record에 추가하는 문장 목록
+
+    조건 없는 필드로 이미 만들어지는 경로는 그대로 따라 내려가고, 그 아래는 리터럴 하나로
+    대입합니다. 여러 조건이 같은 경로를 함께 쓰는 경우에만 setdefault로 합칩니다.
+    """
+    pad = "    " * indent
+    lines = []
+    for segment, child in group.items():
+        path = (*prefix, segment)
+        key = _key(segment)
+        static_child = static.get(segment) if static is not None else None
+        if isinstance(child, dict) and isinstance(static_child, dict) and not segment.endswith("[]"):
+            lines += _conditional_assignments(child, static_child, f"{target}[{key!r}]", path, shared, indent)
+        elif static_child is not None:
+            raise ValueError(f"조건부 필드 '{'.'.join(path)}'가 조건 없는 필드와 겹칩니다")
+        elif isinstance(child, dict) and not segment.endswith("[]") and shared[path] > 1:
+            lines += _conditional_assignments(
+                child, None, f"{target}.setdefault({key!r}, {{}})", path, shared, indent
+            )
+        else:
+            lines.append(f"{pad}{target}[{key!r}] = {_literal(child, indent)}")
+    return lines
+
+
+def _prefixes(tree: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> List[Tuple[str, ...]]:
+    result = []
+    for segment, child in tree.items():
+        path = (*prefix, segment)
+        result.append(path)
+        if isinstance(child, dict):
+            result += _prefixes(child, path)
+    return result
+
+
+def _generate_body(name: str, fields: Dict[str, Any], required: List[str], ctx: _CodeContext) -> List[str]:
+    """fields 스펙 → 변환 함수 본문 (required 검사 포함)"""
+    static: Dict[str, Any] = {}
+    groups: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    for path, rule in fields.items():
+        segments = path.split(".")
+        if not all(_key(segment) for segment in segments):
+            raise ValueError(f"매핑 '{name}': 경로가 올바르지 않습니다: {path!r}")
+        expr = _value_expr(rule, ctx, path)
+        conditions = _conditions(rule, ctx, path)
+        _insert(groups.setdefault(conditions, {}) if conditions else static, segments, expr, ctx, path)
+
+    lines = []
+    for column in required:
+        ctx.require(column)
+        lines.append(f"    if not row.get({column!r}):")
+        lines.append("        return None")
+    if ctx.hoisted:
+        # 여러 번 쓰는 컬럼은 지역 변수로 한 번만 읽음
+        lines += [f"    {ctx.local(column)} = row[{column!r}]" for column in ctx.columns if column in ctx.hoisted]
+
+    if not groups:
+        lines.append(f"    return {_literal(static, 1)}")
+    else:
+        lines.append(f"    record = {_literal(static, 1)}")
+        shared = Counter(path for group in groups.values() for path in _prefixes(group))
+        for conditions, group in groups.items():
+            for column in conditions:
+                ctx.require(column)
+            test = " and ".join(f"row.get({column!r})" for column in conditions)
+            lines.append(f"    if {test}:")
+            lines += _conditional_assignments(group, static, "record", (), shared, 2)
+        lines.append("    return record")
+    return lines
+
+
+def generate_source(name: str, fields: Dict[str, Any], required: List[str] = ()) -> Tuple[str, _CodeContext]:
+    """
+    fields 스펙 → 변환 함수 소스와 코드 생성 컨텍스트
+
+    한 번 생성하여 컬럼별 읽기 횟수를 센 뒤, 두 번 이상 읽는 컬럼을 지역 변수로 바꿔 다시 생성합니다.
+    """
+    if not isinstance(fields, dict) or not fields:
+        raise ValueError(f"매핑 '{name}': fields가 비어 있습니다")
+    ctx = _CodeContext(name)
+    _generate_body(name, fields, required, ctx)
+    ctx = _CodeContext(name, {column for column, count in ctx.reads.items() if count > 1})
+    lines = _generate_body(name, fields, required, ctx)
+    return "\n".join(["def transform(row, joined=None):", *lines]) + "\n", ctx
+
+
+class CompiledMapping:
+    """
+    컴파일된 매핑 스펙
+
+    mapping(row) 또는 mapping.transform(row, joined)로 행을 변환합니다 (required 컬럼이 비어 있으면 None).
+    pickle 시 스펙만 전달하고 받는 쪽에서 다시 컴파일하므로 프로세스 풀 작업에 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, spec: Dict[str, Any], origin: Optional[str] = None):
+        unknown = set(spec) - SPEC_KEYS
+        missing = {"output", "source", "fields"} - set(spec)
+        name = spec.get("output") or origin or "<mapping>"
+        if unknown or missing:
+            detail = [f"알 수 없는 키: {', '.join(sorted(unknown))}"] if unknown else []
+            detail += [f"필수 키 누락: {', '.join(sorted(missing))}"] if missing else []
+            raise ValueError(f"매핑 '{name}': {'; '.join(detail)}")
+
+        self.spec = spec
+        self.origin = origin
+        self.output: str = spec["output"]
+        self.source: str = spec["source"]
+        self.schema: Optional[str] = spec.get("schema")
+        self.code, ctx = generate_source(self.output, spec["fields"], spec.get("required") or ())
+        self.columns = ctx.columns
+        self.transform = self._compile(self.output, self.code, ctx.namespace)
+
+        self.join: Optional[CompiledMapping] = None
+        self.join_on: Optional[str] = None
+        join = spec.get("join")
+        if join is not None:
+            unknown = set(join) - JOIN_KEYS
+            if unknown or not {"source", "on", "fields"} <= set(join):
+                raise ValueError(f"매핑 '{self.output}': join에는 source, on, fields만 필요합니다")
+            self.join_on = join["on"]
+            self.join = CompiledMapping(
+                {"output": f"{self.output}.join", "source": join["source"], "fields": join["fields"]}, origin
+            )
+
+    @staticmethod
+    def _compile(name: str, code: str, namespace: Dict[str, Any]) -> Callable[..., Optional[dict]]:
+        filename = f"<mapping {name}>"
+        # 트레이스백에 생성된 소스가 보이도록 등록
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+        exec(compile(code, filename, "exec"), namespace)
+        return namespace["transform"]
+
+    def __call__(self, row: Dict[str, str]) -> Optional[dict]:
+        return self.transform(row)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"spec": self.spec, "origin": self.origin}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["spec"], state["origin"])
+
+    def check_columns(self, fieldnames: List[str], source: Optional[Path] = None) -> None:
+        """스펙이 참조하는 컬럼이 CSV 헤더에 모두 있는지 확인"""
+        missing = [column for column in self.columns if column not in fieldnames]
+        if missing:
+            raise ValueError(
+                f"매핑 '{self.output}': {source or self.source}에 없는 컬럼: {', '.join(missing)}"
+            )
+
+
+def load_spec(path: Path) -> Dict[str, Any]:
+    """JSON 또는 YAML(PyYAML 설치 시) 스펙 파일 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise ValueError(f"{path.name}: YAML 스펙을 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def load_mapping(path: Path) -> CompiledMapping:
+    return CompiledMapping(load_spec(path), origin=path.name)
+
+
+def load_mappings(mapping_dir: Path) -> List[CompiledMapping]:
+    """폴더의 모든 스펙 파일을 이름 순으로 컴파일"""
+    paths = sorted(p for p in mapping_dir.iterdir() if p.suffix in (".json", ".yaml", ".yml"))
+    return [load_mapping(path) for path in paths]
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        mapping = load_mapping(Path(arg))
+        print(f"# {arg} → {mapping.output}")
+        print(mapping.code)
+        if mapping.join is not None:
+            print(f"# join: {mapping.join.source} (on {mapping.join_on})")
+            print(mapping.join.code)
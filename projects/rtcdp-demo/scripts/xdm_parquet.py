@@ -0,0 +1,201 @@
+"""
+XDM Parquet 작성기
+schemas/*-schema.json의 XDM 필드 정의로 Arrow 스키마를 만들고, 변환된 레코드를 행 그룹 단위로 Parquet에 기록
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # --format parquet을 쓰지 않으면 필요 없음
+    pa = pc = pq = None
+
+
+# 변환 스크립트가 사용하는 tenant 네임스페이스 (스키마 파일의 tenant 필드 이름을 이 이름으로 바꿈)
+TENANT_ID = "_rtcdpDemo"
+DEFAULT_COMPRESSION = "snappy"
+COMPRESSIONS = ("snappy", "zstd", "gzip", "brotli", "lz4", "none")
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def _properties(node: Dict[str, Any]) -> Dict[str, Any]:
+    """객체 노드의 속성 (allOf 안의 인라인 정의 포함, 오프라인에서 읽을 수 없는 $ref 표준 필드 그룹은 제외)"""
+    properties = dict(node.get("properties") or {})
+    for part in node.get("allOf") or []:
+        if "$ref" not in part:
+            properties.update(_properties(part))
+    return properties
+
+
+def _arrow_type(node: Dict[str, Any]) -> "pa.DataType":
+    """XDM(JSON Schema) 필드 → Arrow 타입"""
+    json_type = node.get("type")
+    if json_type == "object" or "properties" in node or "allOf" in node:
+        fields = [pa.field(name, _arrow_type(child)) for name, child in _properties(node).items()]
+        return pa.struct(fields) if fields else pa.map_(pa.string(), pa.string())
+    if json_type == "array":
+        return pa.list_(_arrow_type(node.get("items") or {"type": "string"}))
+    if json_type == "integer":
+        return pa.int64()
+    if json_type == "number":
+        return pa.float64()
+    if json_type == "boolean":
+        return pa.bool_()
+    if node.get("format") == "date-time":
+        return pa.timestamp("us", tz="UTC")
+    if node.get("format") == "date":
+        return pa.date32()
+    return pa.string()
+
+
+def xdm_to_arrow_schema(xdm_schema: Dict[str, Any], tenant_id: str = TENANT_ID) -> "pa.Schema":
+    """
+    XDM 스키마 정의 → Arrow 스키마
+
+    객체는 struct, 배열은 list(예: productListItems는 list<struct>), date-time은 UTC timestamp가 됩니다.
+    '_'로 시작하는 최상위 필드(_id 제외)는 tenant 네임스페이스로 보고 tenant_id로 이름을 바꿉니다.
+    """
+    require_pyarrow()
+    fields = []
+    for name, child in _properties(xdm_schema).items():
+        if name.startswith("_") and name != "_id":
+            name = tenant_id
+        fields.append(pa.field(name, _arrow_type(child)))
+    return pa.schema(fields)
+
+
+def load_arrow_schema(schema_path: Path, tenant_id: str = TENANT_ID) -> "pa.Schema":
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        return xdm_to_arrow_schema(json.load(f), tenant_id)
+
+
+def _as_strings(data_type: "pa.DataType") -> "pa.DataType":
+    """날짜/시각을 문자열로 바꾼 타입 (레코드의 ISO 8601 문자열을 그대로 담은 뒤 한 번에 변환)"""
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(_as_strings(field.type)) for field in data_type])
+    if pa.types.is_list(data_type):
+        return pa.list_(_as_strings(data_type.value_type))
+    if pa.types.is_timestamp(data_type) or pa.types.is_date(data_type):
+        return pa.string()
+    return data_type
+
+
+def _fill_null_types(data_type: "pa.DataType") -> "pa.DataType":
+    """추론한 스키마에서 값이 모두 비어 타입을 알 수 없는 필드는 문자열로 처리"""
+    if pa.types.is_null(data_type):
+        return pa.string()
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(_fill_null_types(field.type)) for field in data_type])
+    if pa.types.is_list(data_type):
+        return pa.list_(_fill_null_types(data_type.value_type))
+    return data_type
+
+
+def _cast(array: "pa.Array", data_type: "pa.DataType") -> "pa.Array":
+    """
+    문자열 날짜/시각을 포함한 중첩 배열 변환
+
+    null struct의 하위 값이나 빈 문자열은 null로 변환합니다.
+    """
+    if array.type == data_type:
+        return array
+    if pa.types.is_struct(data_type):
+        children = [_cast(child, field.type) for child, field in zip(array.flatten(), data_type)]
+        return pa.StructArray.from_arrays(children, fields=list(data_type), mask=array.is_null())
+    if pa.types.is_list(data_type):
+        values = _cast(array.values, data_type.value_type)
+        return pa.ListArray.from_arrays(array.offsets, values, mask=array.is_null())
+    if pa.types.is_string(array.type):
+        array = pc.if_else(pc.equal(array, ""), pa.scalar(None, pa.string()), array)
+    return array.cast(data_type)
+
+
+def _unknown_paths(record: Dict[str, Any], data_type: "pa.DataType", prefix: str = "") -> List[str]:
+    """스키마에 없어 Parquet에서 빠지는 레코드 필드 경로"""
+    names = {field.name: field.type for field in data_type}
+    paths = []
+    for key, value in record.items():
+        path = f"{prefix}{key}"
+        if key not in names:
+            paths.append(path)
+        elif isinstance(value, dict) and pa.types.is_struct(names[key]):
+            paths += _unknown_paths(value, names[key], f"{path}.")
+        elif isinstance(value, list) and value and isinstance(value[0], dict) \
+                and pa.types.is_list(names[key]) and pa.types.is_struct(names[key].value_type):
+            paths += _unknown_paths(value[0], names[key].value_type, f"{path}[].")
+    return paths
+
+
+class ParquetWriter:
+    """
+    XDM 레코드를 행 그룹 단위로 쓰는 Parquet 작성기
+
+    레코드를 row_group_size개씩 모아 Arrow 배치로 변환하여 기록하므로 메모리에는 행 그룹 하나만 남습니다.
+    schema가 없으면 첫 행 그룹에서 추론한 스키마를 이후 행 그룹에도 사용하며, 레코드가 하나도 없으면 파일을 만들지 않습니다.
+    """
+
+    extension = ".parquet"
+
+    def __init__(self, output_path: Path, pretty: bool = False, schema: Optional["pa.Schema"] = None,
+                 compression: str = DEFAULT_COMPRESSION, row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        require_pyarrow()
+        self.output_path = output_path
+        self.schema = schema
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._buffer: List[dict] = []
+        self._ingest_schema: Optional["pa.Schema"] = None
+        self._writer: Optional["pq.ParquetWriter"] = None
+
+    @staticmethod
+    def encode(record: dict, pretty: bool = False) -> dict:
+        """Parquet은 행 그룹 단위로 직렬화하므로 레코드를 그대로 전달"""
+        return record
+
+    def write(self, record: dict):
+        self.write_encoded([record])
+
+    def write_encoded(self, records: Iterable[dict]):
+        self._buffer.extend(records)
+        while len(self._buffer) >= self.row_group_size:
+            self._flush(self._buffer[:self.row_group_size])
+            del self._buffer[:self.row_group_size]
+
+    def _flush(self, records: List[dict]):
+        if self._writer is None:
+            if self.schema is None:
+                inferred = pa.RecordBatch.from_pylist(records).schema
+                self.schema = pa.schema([field.with_type(_fill_null_types(field.type)) for field in inferred])
+            unknown = _unknown_paths(records[0], pa.struct(list(self.schema))) if records else []
+            if unknown:
+                print(f"     [!] {self.output_path.name}: fields not in schema are dropped: {', '.join(unknown)}")
+            self._ingest_schema = pa.schema([field.with_type(_as_strings(field.type)) for field in self.schema])
+            self._writer = pq.ParquetWriter(
+                self.output_path, self.schema,
+                compression=None if self.compression == "none" else self.compression
+            )
+        batch = pa.RecordBatch.from_pylist(records, schema=self._ingest_schema)
+        columns = [_cast(column, field.type) for column, field in zip(batch.columns, self.schema)]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=self.schema),
+                                 row_group_size=self.row_group_size)
+        self.count += len(records)
+
+    def close(self):
+        if self._writer is None and not self._buffer and self.schema is None:
+            # 스키마도 레코드도 없으면 열이 없는 파일이 되므로 기록하지 않음
+            print(f"     [!] {self.output_path.name}: no records and no schema, file not written")
+            return
+        if self._buffer or self._writer is None:
+            self._flush(self._buffer)
+            self._buffer = []
+        self._writer.close()